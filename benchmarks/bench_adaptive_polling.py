@@ -0,0 +1,161 @@
+"""
+Benchmark: upstream calls and freshness of fixed vs adaptive feed polling.
+
+Replays BENCH_HOURS (default 48) of simulated time against a local
+ChangingUpstream whose feeds gain new stories at different rates
+(BENCH_FEED_RATES, stories per hour; default a busy, a slow and a static feed)
+and drives the fetcher in three modes, each in a fresh database:
+
+    fixed          every feed fetched every FETCH_INTERVAL_HOURS (the old scheduler)
+    conditional    same schedule, with If-None-Match / If-Modified-Since
+    adaptive       poll_feeds every FETCH_INTERVAL_MIN_MINUTES with per-feed intervals
+
+For each mode it reports upstream requests (the RapidAPI quota), full bodies
+vs 304s, bytes downloaded, how many new stories were ingested or missed
+(pushed out of the upstream's window before a poll) and the mean / p95 delay
+between a story appearing upstream and being stored, plus each feed's final
+adaptive interval and the api_logs rows by outcome.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.fake_upstream import ChangingUpstream
+
+HOURS = float(os.getenv('BENCH_HOURS', '48'))
+ITEMS_PER_FEED = int(os.getenv('BENCH_ITEMS_PER_FEED', '50'))
+RATES = os.getenv('BENCH_FEED_RATES', 'markets:30,business:4,archive:0')
+FETCH_INTERVAL_HOURS = os.getenv('BENCH_FETCH_INTERVAL_HOURS', '2')
+MIN_MINUTES = os.getenv('BENCH_INTERVAL_MIN_MINUTES', '15')
+MAX_HOURS = os.getenv('BENCH_INTERVAL_MAX_HOURS', '12')
+MODES = ('fixed', 'conditional', 'adaptive')
+
+
+def parse_rates(value: str):
+    rates = {}
+    for entry in value.split(','):
+        name, _, rate = entry.partition(':')
+        rates[name.strip()] = float(rate or 0)
+    return rates
+
+
+def run_mode(mode: str) -> dict:
+    """Simulate one mode in this process (the fetcher and database are process globals)"""
+    rates = parse_rates(RATES)
+    upstream = ChangingUpstream(rates, validators=True, items_per_feed=ITEMS_PER_FEED, subnews_per_item=0).start()
+    tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+    os.environ.update({
+        'DATABASE_PATH': os.path.join(tmp_dir, 'bench.db'),
+        'LOG_FILE': os.path.join(tmp_dir, 'bench.log'),
+        'LOG_LEVEL': 'WARNING',
+        'RAPIDAPI_KEY': 'benchmark',
+        'RAPIDAPI_HOST': upstream.host,
+        'NEWS_API_SCHEME': 'http',
+        'NEWS_FEEDS': ','.join(f'/{name}:en-US' for name in rates),
+        'RATE_LIMIT_PER_SECOND': '0',
+        'FETCH_INTERVAL_HOURS': FETCH_INTERVAL_HOURS,
+        'FETCH_INTERVAL_MIN_MINUTES': MIN_MINUTES,
+        'FETCH_INTERVAL_MAX_HOURS': MAX_HOURS,
+        'ADAPTIVE_POLLING': str(mode == 'adaptive'),
+        'CONDITIONAL_REQUESTS': str(mode != 'fixed')
+    })
+    from database import db
+    from news_fetcher import news_fetcher
+    
+    tick_hours = float(MIN_MINUTES) / 60
+    fixed_every = max(1, round(float(FETCH_INTERVAL_HOURS) / tick_hours))
+    start = time.time()
+    first_seen = {}
+    last_id = 0
+    
+    def poll(step: int):
+        nonlocal last_id
+        if mode == 'adaptive':
+            news_fetcher.poll_feeds(now=start + upstream.hours * 3600)
+        elif step % fixed_every == 0:
+            news_fetcher.fetch_and_store_news()
+        with db.get_connection() as conn:
+            for row in conn.execute('SELECT id, url FROM news_articles WHERE id > ? ORDER BY id', (last_id,)):
+                last_id = row['id']
+                first_seen[row['url']] = upstream.hours
+    
+    try:
+        steps = int(round(HOURS / tick_hours))
+        for step in range(steps + 1):
+            if step:
+                upstream.advance(tick_hours)
+            poll(step)
+        
+        delays = []
+        published = missed = 0
+        for feed in rates:
+            for story in range(ITEMS_PER_FEED, upstream.story_count(feed)):
+                published += 1
+                seen = first_seen.get(f'https://news.example.com/en-US/{feed}/{story}')
+                if seen is not None:
+                    delays.append(seen - upstream.published_at(feed, story))
+                elif story < upstream.story_count(feed) - ITEMS_PER_FEED:
+                    missed += 1
+        
+        requests_per_feed = {feed: 0 for feed in rates}
+        for entry in upstream.request_log:
+            requests_per_feed[entry['path'].split('?')[0].strip('/')] += 1
+        with db.get_connection() as conn:
+            outcomes = dict(conn.execute('SELECT outcome, COUNT(*) FROM api_logs GROUP BY outcome').fetchall())
+        
+        delays.sort()
+        return {
+            'mode': mode,
+            'requests': upstream.requests,
+            'not_modified': upstream.not_modified,
+            'bytes': upstream.bytes_sent,
+            'published': published,
+            'ingested': len(delays),
+            'missed': missed,
+            'mean_delay_hours': statistics.mean(delays) if delays else None,
+            'p95_delay_hours': delays[int(0.95 * (len(delays) - 1))] if delays else None,
+            'requests_per_feed': requests_per_feed,
+            'intervals_hours': {state['feed']: round(state['interval_seconds'] / 3600, 2)
+                                for state in db.get_feed_states().values()},
+            'api_logs': outcomes
+        }
+    finally:
+        news_fetcher.connection_pool.close_all()
+        upstream.stop()
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--mode':
+        print(json.dumps(run_mode(sys.argv[2])))
+        return
+    
+    print(f"{HOURS:g}h simulated, feeds (stories/h): {RATES}, window {ITEMS_PER_FEED} stories")
+    print(f"fixed interval {FETCH_INTERVAL_HOURS}h; adaptive between {MIN_MINUTES}min and {MAX_HOURS}h\n")
+    print(f"{'mode':<12} {'requests':>8} {'304s':>6} {'KB':>8} {'ingested':>9} {'missed':>7} "
+          f"{'delay mean':>11} {'p95':>7}")
+    results = []
+    for mode in MODES:
+        output = subprocess.run([sys.executable, '-m', 'benchmarks.bench_adaptive_polling', '--mode', mode],
+                                cwd=ROOT, check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append(result)
+        print(f"{mode:<12} {result['requests']:>8} {result['not_modified']:>6} {result['bytes'] / 1024:>8.0f} "
+              f"{result['ingested']:>5}/{result['published']:<4} {result['missed']:>6} "
+              f"{result['mean_delay_hours'] * 60:>8.1f}min {result['p95_delay_hours'] * 60:>5.0f}min")
+    
+    print()
+    for result in results:
+        print(f"{result['mode']:<12} requests per feed {result['requests_per_feed']}")
+    adaptive = results[-1]
+    print(f"\nadaptive intervals at the end (hours): {adaptive['intervals_hours']}")
+    print(f"adaptive api_logs rows by outcome: {adaptive['api_logs']}")
+
+
+if __name__ == '__main__':
+    main()
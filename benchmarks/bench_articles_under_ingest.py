@@ -0,0 +1,112 @@
+"""
+Benchmark: /articles throughput while an ingest is running.
+
+Seeds a temporary database, then hammers GET /articles from several client
+threads twice: once idle and once while a writer thread repeatedly runs
+bulk_insert_articles. Compare journal modes by running e.g.
+
+    python benchmarks/bench_articles_under_ingest.py
+    DATABASE_JOURNAL_MODE=DELETE python benchmarks/bench_articles_under_ingest.py
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import statistics
+
+# Point the app at a throwaway database before it is imported
+_tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+os.environ['DATABASE_PATH'] = os.path.join(_tmp_dir, 'bench.db')
+os.environ['LOG_FILE'] = os.path.join(_tmp_dir, 'bench.log')
+os.environ.setdefault('RAPIDAPI_KEY', 'benchmark')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+from database import db
+from main import app
+
+SEED_ROWS = int(os.getenv('BENCH_SEED_ROWS', '20000'))
+CLIENT_THREADS = int(os.getenv('BENCH_CLIENT_THREADS', '8'))
+DURATION = float(os.getenv('BENCH_DURATION', '5'))
+INGEST_BATCH = int(os.getenv('BENCH_INGEST_BATCH', '1000'))
+
+
+def make_articles(start: int, count: int):
+    return [{
+        'title': f'Synthetic headline {i}',
+        'url': f'https://example.com/news/{i}',
+        'publisher': f'Publisher {i % 50}',
+        'published_date': '2025-07-14 12:00:00',
+        'summary': f'Summary text for synthetic article number {i} ' * 3,
+        'thumbnail': f'https://img.example.com/{i}.jpg',
+        'language': 'en-US',
+        'category': 'business',
+        'full_content': ''
+    } for i in range(start, start + count)]
+
+
+def run_clients(duration: float):
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+    
+    def worker(n: int):
+        client = TestClient(app)
+        local = []
+        page = 1 + n
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = client.get('/articles', params={'page': page % 50 + 1, 'limit': 20})
+            local.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.text
+            page += 1
+        with lock:
+            latencies.extend(local)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(CLIENT_THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies
+
+
+def report(label: str, latencies, duration: float):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0
+    print(f"{label:<22} {len(latencies) / duration:>9.1f} req/s   "
+          f"p50 {statistics.median(latencies) * 1000:>7.2f} ms   p99 {p99 * 1000:>7.2f} ms")
+
+
+def main():
+    db.bulk_insert_articles(make_articles(0, SEED_ROWS))
+    print(f"journal_mode={db.journal_mode} synchronous={db.synchronous} "
+          f"rows={SEED_ROWS} clients={CLIENT_THREADS} duration={DURATION}s")
+    
+    report('idle', run_clients(DURATION), DURATION)
+    
+    stop = threading.Event()
+    ingested = [0]
+    
+    def ingest():
+        next_id = SEED_ROWS
+        while not stop.is_set():
+            db.bulk_insert_articles(make_articles(next_id, INGEST_BATCH))
+            next_id += INGEST_BATCH
+            ingested[0] += INGEST_BATCH
+    
+    writer = threading.Thread(target=ingest)
+    writer.start()
+    try:
+        latencies = run_clients(DURATION)
+    finally:
+        stop.set()
+        writer.join()
+    report('during ingest', latencies, DURATION)
+    print(f"rows ingested during run: {ingested[0]}")
+
+
+if __name__ == '__main__':
+    main()
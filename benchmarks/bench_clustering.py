@@ -0,0 +1,155 @@
+"""
+Benchmark: ingest-time near-duplicate clustering throughput per 10k articles.
+
+Generates BENCH_ROWS (default 10000) articles in which BENCH_DUP_RATE of
+them (default 0.3) are syndicated copies of an earlier headline: a publisher
+suffix, different casing or punctuation, or one word changed. Inserts them
+through DatabaseManager.bulk_insert_articles in INGEST_BATCH_SIZE batches into
+fresh databases with clustering off and on, and reports the time per 10k
+articles, how many copies landed in their original's cluster, how many
+distinct stories were wrongly merged, and the latency of /articles with and
+without collapse=true.
+
+A second phase inserts BENCH_TEMPLATED_ROWS (default 6000) templated headlines
+(a handful of boilerplate patterns differing in one ticker or figure), whose
+shared words put thousands of articles in the same MinHash bands, and reports
+clustered vs unclustered ingest time per batch at the start and the end of the
+run: the per-batch cost should stay roughly flat as the bands fill up.
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.corpus import VOCABULARY, generate_articles
+
+from database import DatabaseManager
+
+ROWS = int(os.getenv('BENCH_ROWS', '10000'))
+DUP_RATE = float(os.getenv('BENCH_DUP_RATE', '0.3'))
+BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', '500'))
+REPEAT = int(os.getenv('BENCH_REPEAT', '200'))
+SUFFIXES = (' - Reuters', ' | Bloomberg.com', ' - CNBC', ' — Financial Times')
+TEMPLATED_ROWS = int(os.getenv('BENCH_TEMPLATED_ROWS', '6000'))
+TEMPLATES = (
+    'Stock market today: Dow, S&P 500 and Nasdaq futures move as investors watch {ticker} shares',
+    '{ticker} stock price, news, quote and history for traders today',
+    'Earnings preview: what to expect from {ticker} quarterly report this week',
+    'Why {ticker} shares are trading higher today according to analysts',
+)
+
+
+def make_articles():
+    """Articles plus, for each one, the index of the original it copies (its own index if none)"""
+    rng = random.Random(7)
+    articles = []
+    origins = []
+    for i, values in enumerate(generate_articles(ROWS, seed=7)):
+        if articles and rng.random() < DUP_RATE:
+            origin = rng.randrange(max(0, len(articles) - 2000), len(articles))
+            origin = origins[origin]
+            words = articles[origin]['title'].split()
+            variant = rng.randrange(3)
+            if variant == 0:
+                title = ' '.join(words) + rng.choice(SUFFIXES)
+            elif variant == 1:
+                title = ' '.join(words).lower().rstrip('.') + '!'
+            else:
+                words[rng.randrange(len(words))] = rng.choice(VOCABULARY)
+                title = ' '.join(words)
+        else:
+            # Real headlines name a company, person or place the shared vocabulary lacks
+            origin = i
+            title = f'{values[0]} at Company{rng.randrange(50000)}'
+        articles.append({'title': title, 'url': f'https://news.example.com/{i}', 'summary': values[4],
+                         'publisher': values[2]})
+        origins.append(origin)
+    return articles, origins
+
+
+def make_templated_articles():
+    rng = random.Random(11)
+    return [{'title': rng.choice(TEMPLATES).format(ticker=f'TK{rng.randrange(100000)}'),
+             'url': f'https://templated.example.com/{i}', 'publisher': 'Wire'}
+            for i in range(TEMPLATED_ROWS)]
+
+
+def templated_batch_seconds(path: str, clustering: bool, articles):
+    """Seconds taken by each INGEST_BATCH_SIZE batch of the templated articles"""
+    manager = fresh_manager(path, clustering)
+    seconds = []
+    for start in range(0, len(articles), BATCH_SIZE):
+        started = time.perf_counter()
+        manager.bulk_insert_articles(articles[start:start + BATCH_SIZE])
+        seconds.append(time.perf_counter() - started)
+    manager.close_all_connections()
+    return seconds
+
+
+def fresh_manager(path: str, clustering: bool) -> DatabaseManager:
+    previous = os.environ.get('DATABASE_PATH')
+    os.environ['DATABASE_PATH'] = path
+    try:
+        manager = DatabaseManager()
+    finally:
+        os.environ['DATABASE_PATH'] = previous
+    manager.clustering_enabled = clustering
+    return manager
+
+
+def time_query(manager: DatabaseManager, **kwargs) -> float:
+    samples = []
+    for page in range(1, REPEAT + 1):
+        started = time.perf_counter()
+        manager.get_articles(page=1 + page % 20, limit=20, include_total=False, **kwargs)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    articles, origins = make_articles()
+    copies = sum(1 for i, origin in enumerate(origins) if origin != i)
+    tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+    print(f"{ROWS} articles, {copies} syndicated copies, batches of {BATCH_SIZE}")
+    
+    for clustering in (False, True):
+        manager = fresh_manager(os.path.join(tmp_dir, f'clustering_{clustering}.db'), clustering)
+        started = time.perf_counter()
+        for start in range(0, ROWS, BATCH_SIZE):
+            manager.bulk_insert_articles(articles[start:start + BATCH_SIZE])
+        elapsed = time.perf_counter() - started
+        print(f"\nclustering {'on' if clustering else 'off'}: {elapsed * 1000 * 10000 / ROWS:.0f}ms per 10k articles "
+              f"({ROWS / elapsed:.0f} articles/s)")
+        if not clustering:
+            baseline = elapsed
+            continue
+        print(f"  clustering overhead: {(elapsed - baseline) * 1000 * 10000 / ROWS:.0f}ms per 10k articles")
+        
+        with manager.get_connection() as conn:
+            cluster_of = {row['url']: row['cluster'] for row in conn.execute(
+                'SELECT url, COALESCE(cluster_id, id) AS cluster FROM news_articles')}
+            stories = conn.execute('SELECT COUNT(*) FROM news_articles WHERE cluster_id IS NULL').fetchone()[0]
+        clusters = [cluster_of[article['url']] for article in articles]
+        found = sum(1 for i, origin in enumerate(origins) if origin != i and clusters[i] == clusters[origin])
+        originals = {clusters[i] for i, origin in enumerate(origins) if origin == i}
+        merged = sum(1 for i, origin in enumerate(origins) if origin == i) - len(originals)
+        print(f"  copies clustered with their original: {found}/{copies} ({found / max(copies, 1):.1%})")
+        print(f"  distinct stories merged by mistake: {merged}")
+        print(f"  stories after collapse: {stories} of {ROWS} articles")
+        print(f"  /articles page:  {time_query(manager) * 1e6:.0f}us, "
+              f"collapse=true: {time_query(manager, collapse=True) * 1e6:.0f}us")
+    
+    templated = make_templated_articles()
+    print(f"\n{TEMPLATED_ROWS} templated headlines, batches of {BATCH_SIZE}")
+    for clustering in (False, True):
+        seconds = templated_batch_seconds(os.path.join(tmp_dir, f'templated_{clustering}.db'), clustering, templated)
+        print(f"  clustering {'on' if clustering else 'off'}: {sum(seconds):.2f}s total, "
+              f"first batch {seconds[0] * 1000:.0f}ms, last batch {seconds[-1] * 1000:.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
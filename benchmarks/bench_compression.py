@@ -0,0 +1,97 @@
+"""
+Benchmark: compression CPU cost vs bytes saved for typical responses.
+
+Serves a synthetic corpus (BENCH_ROWS, default 10000) in-process and, for
+/articles pages, /latest and a full /articles/export, reports the identity
+size and, per available encoding and level, the compressed size, the share
+of bytes saved and the CPU time per response. It then replays the same
+cached /articles request BENCH_REPEAT times with Accept-Encoding: gzip to show
+that hits reuse the stored compressed bytes: the compressor runs once per
+cache entry, not once per request.
+"""
+import os
+import sys
+import gzip
+import time
+import subprocess
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.corpus import corpus_path
+
+ROWS = int(os.getenv('BENCH_ROWS', '10000'))
+REPEAT = int(os.getenv('BENCH_REPEAT', '200'))
+
+# Build or reuse the corpus in a child process, then point this process's database at it
+subprocess.run([sys.executable, '-m', 'benchmarks.corpus', '--rows', str(ROWS)], cwd=ROOT, check=True)
+os.environ['DATABASE_PATH'] = corpus_path(ROWS)
+os.environ.setdefault('RAPIDAPI_KEY', 'benchmark')
+os.environ['LOG_FILE'] = os.path.join(os.path.dirname(os.environ['DATABASE_PATH']), 'bench.log')
+
+from fastapi.testclient import TestClient
+from main import app
+from cache import response_cache
+from compress import response_compressor, brotli, zstandard
+
+REQUESTS = [
+    ('/articles limit=20', '/articles?limit=20'),
+    ('/articles limit=100', '/articles?limit=100'),
+    ('/latest limit=50', '/latest?limit=50'),
+    ('/articles/export', '/articles/export')
+]
+
+LEVELS = [('gzip', level, lambda body, level=level: gzip.compress(body, level, mtime=0)) for level in (1, 6, 9)]
+if brotli is not None:
+    LEVELS += [('br', q, lambda body, q=q: brotli.compress(body, quality=q)) for q in (1, 5, 11)]
+if zstandard is not None:
+    LEVELS += [('zstd', level, lambda body, level=level: zstandard.ZstdCompressor(level=level).compress(body))
+               for level in (1, 3, 9)]
+
+
+def time_call(func, body: bytes, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(body)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    client = TestClient(app)
+    print(f"corpus: {ROWS} rows; encodings offered: {', '.join(response_compressor.preference)}")
+    print(f"{'response':<22} {'codec':<8} {'bytes':>10} {'saved':>7} {'cpu/resp':>10} {'MB/s':>8}")
+    for label, path in REQUESTS:
+        body = client.get(path, headers={'Accept-Encoding': 'identity'}).content
+        print(f"{label:<22} {'identity':<8} {len(body):>10}")
+        repeat = max(3, min(REPEAT, 2000000 // max(len(body), 1)))
+        for name, level, func in LEVELS:
+            size = len(func(body))
+            seconds = time_call(func, body, repeat)
+            print(f"{'':<22} {name + '-' + str(level):<8} {size:>10} {1 - size / len(body):>7.1%} "
+                  f"{seconds * 1000:>8.3f}ms {len(body) / seconds / 2 ** 20:>8.1f}")
+    
+    # Cached responses: the first gzip request compresses and stores, later hits reuse the bytes
+    path = '/articles?limit=100'
+    response_cache.clear()
+    before = response_compressor.get_stats()['gzip']['responses']
+    timings = {}
+    for encoding in ('identity', 'gzip'):
+        client.get(path, headers={'Accept-Encoding': encoding})
+        samples = []
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            response = client.get(path, headers={'Accept-Encoding': encoding})
+            samples.append(time.perf_counter() - started)
+        timings[encoding] = (statistics.median(samples), response.num_bytes_downloaded, response.headers.get('x-cache'))
+    compressions = response_compressor.get_stats()['gzip']['responses'] - before
+    
+    print(f"\ncached {path}, {REPEAT} hits per encoding:")
+    for encoding, (seconds, size, cache_status) in timings.items():
+        print(f"  {encoding:<8} median {seconds * 1000:.3f}ms per request, {size} bytes on the wire (X-Cache: {cache_status})")
+    print(f"  gzip compressions performed: {compressions} for {REPEAT + 1} gzip requests")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: /articles/facets from the article_facets rollup vs GROUP BY over news_articles.
+
+Copies a synthetic corpus of BENCH_ROWS (default 100000) articles from
+benchmarks/corpus.py (opening it seeds the rollup, which is timed) and runs
+DatabaseManager.get_facets BENCH_REPEAT (default 50) times per filter, once
+as served and once with rollup=False, checking both give the same counts:
+
+    all                 no filters
+    collapse            cluster representatives only
+    last_day            date_from/date_to on day boundaries
+    last_week           seven days
+    unaligned_window    a 6h window starting and ending mid-hour (rollup+scan)
+    search              a search term (always GROUP BY)
+
+Then inserts BENCH_INGEST_ROWS (default 20000) articles through
+bulk_insert_articles into fresh databases with and without the rollup
+triggers to show what maintaining the rollup costs at ingest.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.corpus import ensure_corpus, generate_articles
+
+from database import DatabaseManager
+
+ROWS = int(os.getenv('BENCH_ROWS', '100000'))
+REPEAT = int(os.getenv('BENCH_REPEAT', '50'))
+INGEST_ROWS = int(os.getenv('BENCH_INGEST_ROWS', '20000'))
+BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', '500'))
+
+
+def open_manager(path: str) -> DatabaseManager:
+    os.environ['DATABASE_PATH'] = path
+    manager = DatabaseManager()
+    manager.clustering_enabled = False
+    return manager
+
+
+def make_filters():
+    today = datetime.now(timezone.utc).replace(microsecond=0)
+    window_start = (today - timedelta(days=2)).replace(minute=17, second=5)
+    return [
+        ('all', {}),
+        ('collapse', {'collapse': True}),
+        ('last_day', {'date_from': (today - timedelta(days=1)).date().isoformat(),
+                      'date_to': today.date().isoformat()}),
+        ('last_week', {'date_from': (today - timedelta(days=7)).date().isoformat()}),
+        ('unaligned_window', {'date_from': window_start.strftime('%Y-%m-%d %H:%M:%S'),
+                              'date_to': (window_start + timedelta(hours=6)).strftime('%Y-%m-%d %H:%M:%S')}),
+        ('search', {'search': 'inflation'})
+    ]
+
+
+def time_facets(manager: DatabaseManager, **kwargs):
+    samples = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        result = manager.get_facets(**kwargs)
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return result, samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def ingest_seconds(path: str, triggers: bool) -> float:
+    manager = open_manager(path)
+    if not triggers:
+        with manager.get_connection() as conn:
+            for name in ('news_articles_facets_ai', 'news_articles_facets_ad', 'news_articles_facets_au'):
+                conn.execute(f'DROP TRIGGER {name}')
+            conn.commit()
+    articles = [{'title': values[0], 'url': f'https://ingest.example.com/{i}', 'publisher': values[2],
+                 'summary': values[4], 'published_date': values[3], 'language': values[6], 'category': values[7]}
+                for i, values in enumerate(generate_articles(INGEST_ROWS, seed=11))]
+    started = time.perf_counter()
+    for start in range(0, len(articles), BATCH_SIZE):
+        manager.bulk_insert_articles(articles[start:start + BATCH_SIZE])
+    elapsed = time.perf_counter() - started
+    manager.close_all_connections()
+    return elapsed
+
+
+def main():
+    corpus, _ = ensure_corpus(ROWS)
+    tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+    path = os.path.join(tmp_dir, 'bench.db')
+    shutil.copyfile(corpus, path)
+    
+    started = time.perf_counter()
+    manager = open_manager(path)
+    open_seconds = time.perf_counter() - started
+    with manager.get_connection() as conn:
+        rollup_rows = conn.execute('SELECT COUNT(*) FROM article_facets').fetchone()[0]
+    print(f"{ROWS} articles; opening the corpus (seeding the rollup) took {open_seconds:.2f}s, "
+          f"{rollup_rows} rollup rows\n")
+    
+    print(f"{'filter':<18} {'source':<12} {'articles':>9} {'p50':>9} {'p99':>9} {'GROUP BY p50':>13} {'p99':>9} "
+          f"{'speedup':>8}")
+    failed = False
+    for name, filters in make_filters():
+        served, p50, p99 = time_facets(manager, **filters)
+        scanned, scan_p50, scan_p99 = time_facets(manager, rollup=False, **filters)
+        if served['facets'] != scanned['facets'] or served['total'] != scanned['total']:
+            print(f"FAIL: {name} counts differ between {served['source']} and scan")
+            failed = True
+        print(f"{name:<18} {served['source']:<12} {served['total']:>9} {p50 * 1000:>7.2f}ms {p99 * 1000:>7.2f}ms "
+              f"{scan_p50 * 1000:>11.2f}ms {scan_p99 * 1000:>7.2f}ms {scan_p50 / p50:>7.1f}x")
+    manager.close_all_connections()
+    
+    without = ingest_seconds(os.path.join(tmp_dir, 'ingest_plain.db'), triggers=False)
+    with_rollup = ingest_seconds(os.path.join(tmp_dir, 'ingest_rollup.db'), triggers=True)
+    print(f"\ningest of {INGEST_ROWS} articles in batches of {BATCH_SIZE}: {INGEST_ROWS / without:.0f} articles/s "
+          f"without the rollup triggers, {INGEST_ROWS / with_rollup:.0f} articles/s with them "
+          f"({(with_rollup - without) / without:+.0%} ingest time)")
+    
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Benchmark: concurrent multi-feed fetch against a local fake upstream.
+
+Starts benchmarks/fake_upstream.py with a per-request delay, configures
+several feeds and times one fetch_and_store_news cycle. Reports upstream
+requests vs TCP connections (keep-alive reuse) and compares FETCH_WORKERS=1
+with the configured worker count.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_upstream import FakeUpstream
+
+FEEDS = os.getenv('BENCH_FEEDS', '/business:en-US,/technology:en-US,/world:en-US,'
+                                 '/business:en-GB,/business:de-DE,/technology:fr-FR')
+LATENCY = float(os.getenv('BENCH_UPSTREAM_LATENCY', '0.2'))
+WORKERS = int(os.getenv('FETCH_WORKERS', '4'))
+
+upstream = FakeUpstream(items_per_feed=int(os.getenv('BENCH_ITEMS_PER_FEED', '50')), latency=LATENCY).start()
+
+_tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+os.environ.update({
+    'DATABASE_PATH': os.path.join(_tmp_dir, 'bench.db'),
+    'LOG_FILE': os.path.join(_tmp_dir, 'bench.log'),
+    'LOG_LEVEL': os.getenv('LOG_LEVEL', 'WARNING'),
+    'RAPIDAPI_KEY': 'benchmark',
+    'RAPIDAPI_HOST': upstream.host,
+    'NEWS_API_SCHEME': 'http',
+    'NEWS_FEEDS': FEEDS,
+    'RATE_LIMIT_PER_SECOND': os.getenv('RATE_LIMIT_PER_SECOND', '0'),
+})
+
+from database import db
+from news_fetcher import news_fetcher
+
+
+def run_cycle(workers: int, cycles: int = 2):
+    news_fetcher.fetch_workers = workers
+    requests_before, connections_before = upstream.requests, upstream.connections
+    start = time.perf_counter()
+    for _ in range(cycles):
+        news_fetcher.fetch_and_store_news()
+    elapsed = (time.perf_counter() - start) / cycles
+    print(f"workers={workers:<3} {elapsed:>6.2f}s/cycle  "
+          f"requests={upstream.requests - requests_before:<4} "
+          f"new connections={upstream.connections - connections_before}")
+
+
+def main():
+    print(f"{len(news_fetcher.feeds)} feeds, upstream latency {LATENCY}s")
+    try:
+        run_cycle(1)
+        news_fetcher.connection_pool.close_all()
+        run_cycle(WORKERS)
+        print(f"articles stored: {db.get_database_stats()['total_articles']}")
+    finally:
+        news_fetcher.connection_pool.close_all()
+        upstream.stop()
+
+
+if __name__ == '__main__':
+    main()
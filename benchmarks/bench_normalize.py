@@ -0,0 +1,205 @@
+"""
+Benchmark: normalizing raw API items into article rows.
+
+Builds BENCH_ITEMS (default 100000) upstream items with BENCH_SUBNEWS (default
+2) subnews each, shaped like benchmarks/fake_upstream.py serves them, and
+times the old per-item normalize_items loop (kept here verbatim as the
+baseline) against normalize.ItemNormalizer in INGEST_BATCH_SIZE batches, as
+iter_feed_batches runs it. Reports items and rows per second, the tracemalloc
+peak while normalizing and the memory blocks and bytes retained per row.
+
+Both paths must produce identical rows for well-formed items. A second run
+with BENCH_BAD_RATE (default 0.01) of the items malformed shows the rejects
+reported per reason.
+"""
+import os
+import sys
+import gc
+import time
+import random
+import logging
+import tracemalloc
+from typing import Any, Dict, Iterable, Iterator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.fake_upstream import make_item
+from normalize import ItemNormalizer
+
+ITEMS = int(os.getenv('BENCH_ITEMS', '100000'))
+SUBNEWS = int(os.getenv('BENCH_SUBNEWS', '2'))
+BAD_RATE = float(os.getenv('BENCH_BAD_RATE', '0.01'))
+BATCH_SIZE = int(os.getenv('INGEST_BATCH_SIZE', '500'))
+FEED = {'endpoint': '/business', 'language': 'en-US', 'category': 'business'}
+
+logger = logging.getLogger('bench_normalize')
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+
+def legacy_normalize_items(items: Iterable[Dict[str, Any]], feed: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    """NewsFetcher.normalize_items as it was before ItemNormalizer"""
+    for item in items:
+        try:
+            # Convert timestamp to readable date format
+            timestamp = item.get('timestamp', '')
+            published_date = ''
+            if timestamp:
+                try:
+                    # Convert timestamp (milliseconds) to datetime
+                    import datetime
+                    dt = datetime.datetime.fromtimestamp(int(timestamp) / 1000)
+                    published_date = dt.strftime('%Y-%m-%d %H:%M:%S')
+                except (ValueError, TypeError):
+                    published_date = str(timestamp)
+            
+            # Extract thumbnail from images object
+            thumbnail = ''
+            images = item.get('images', {})
+            if isinstance(images, dict):
+                # Try thumbnailProxied first, then thumbnail
+                thumbnail = images.get('thumbnailProxied', images.get('thumbnail', ''))
+            
+            # Normalize article data according to the actual API structure
+            article = {
+                'title': item.get('title', '').strip(),
+                'url': item.get('newsUrl', '').strip(),
+                'publisher': item.get('publisher', '').strip(),
+                'published_date': published_date,
+                'summary': item.get('snippet', '').strip(),
+                'thumbnail': thumbnail.strip(),
+                'language': feed['language'],
+                'category': feed['category'],
+                'full_content': ''  # This API doesn't provide full content
+            }
+            
+            # Skip articles with missing essential fields
+            if not article['title'] or not article['url']:
+                logger.warning(f"Skipping article with missing title or URL")
+                continue
+            
+            yield article
+            
+            # Also process subnews if available
+            subnews = item.get('subnews', [])
+            if isinstance(subnews, list) and item.get('hasSubnews', False):
+                for subitem in subnews:
+                    try:
+                        # Convert subnews timestamp
+                        sub_timestamp = subitem.get('timestamp', '')
+                        sub_published_date = ''
+                        if sub_timestamp:
+                            try:
+                                dt = datetime.datetime.fromtimestamp(int(sub_timestamp) / 1000)
+                                sub_published_date = dt.strftime('%Y-%m-%d %H:%M:%S')
+                            except (ValueError, TypeError):
+                                sub_published_date = str(sub_timestamp)
+                        
+                        # Extract subnews thumbnail
+                        sub_thumbnail = ''
+                        sub_images = subitem.get('images', {})
+                        if isinstance(sub_images, dict):
+                            sub_thumbnail = sub_images.get('thumbnailProxied', sub_images.get('thumbnail', ''))
+                        
+                        sub_article = {
+                            'title': subitem.get('title', '').strip(),
+                            'url': subitem.get('newsUrl', '').strip(),
+                            'publisher': subitem.get('publisher', '').strip(),
+                            'published_date': sub_published_date,
+                            'summary': subitem.get('snippet', '').strip(),
+                            'thumbnail': sub_thumbnail.strip(),
+                            'language': feed['language'],
+                            'category': feed['category'],
+                            'full_content': ''
+                        }
+                        
+                        if sub_article['title'] and sub_article['url']:
+                            yield sub_article
+                    
+                    except Exception as e:
+                        logger.warning(f"Error parsing subnews item: {e}")
+                        continue
+        
+        except Exception as e:
+            logger.warning(f"Error parsing article: {e}")
+            continue
+
+
+def make_items(bad_rate: float):
+    rng = random.Random(3)
+    items = []
+    for n in range(ITEMS):
+        item = make_item('business', 'en-US', n, SUBNEWS)
+        if rng.random() < bad_rate:
+            damage = rng.randrange(4)
+            if damage == 0:
+                del item['newsUrl']
+            elif damage == 1:
+                item['title'] = '   '
+            elif damage == 2:
+                item['publisher'] = {'name': item['publisher']}
+            else:
+                item = 'not an object'
+        items.append(item)
+    return items
+
+
+def legacy(items):
+    return list(legacy_normalize_items(items, FEED))
+
+
+def schema(items):
+    normalizer = ItemNormalizer(FEED['language'], FEED['category'])
+    rows = []
+    for start in range(0, len(items), BATCH_SIZE):
+        rows.extend(normalizer.normalize(items[start:start + BATCH_SIZE]))
+    schema.rejects = normalizer.rejects
+    return rows
+
+
+def measure(func, items):
+    """(seconds, rows, tracemalloc peak bytes, blocks retained per row, bytes retained per row)"""
+    gc.collect()
+    started = time.perf_counter()
+    rows = func(items)
+    seconds = time.perf_counter() - started
+    count = len(rows)
+    del rows
+    
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    rows = func(items)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sys.getallocatedblocks() - blocks_before
+    del rows
+    return seconds, count, peak, blocks / max(count, 1), retained / max(count, 1)
+
+
+def main():
+    items = make_items(0.0)
+    if legacy(items) != schema(items):
+        print("FAIL: ItemNormalizer rows differ from the legacy normalizer")
+        return 1
+    
+    print(f"{ITEMS} items with {SUBNEWS} subnews each, batches of {BATCH_SIZE}")
+    print(f"{'normalizer':<12} {'items/s':>10} {'rows/s':>10} {'seconds':>8} {'peak MiB':>9} "
+          f"{'blocks/row':>11} {'bytes/row':>10}")
+    baseline = None
+    for name, func in (('legacy', legacy), ('schema', schema)):
+        seconds, count, peak, blocks, retained = measure(func, items)
+        baseline = baseline or seconds
+        print(f"{name:<12} {ITEMS / seconds:>10.0f} {count / seconds:>10.0f} {seconds:>8.3f} "
+              f"{peak / 2 ** 20:>9.1f} {blocks:>11.1f} {retained:>10.0f}  {baseline / seconds:.1f}x")
+    
+    items = make_items(BAD_RATE)
+    legacy_rows, rows = len(legacy(items)), len(schema(items))
+    print(f"\nwith {BAD_RATE:.0%} malformed items: legacy kept {legacy_rows} rows (one log warning per item, "
+          f"subnews of bad items dropped), schema kept {rows} rows")
+    print(f"rejects by reason: {schema.rejects}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
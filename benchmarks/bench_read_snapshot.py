@@ -0,0 +1,199 @@
+"""
+Benchmark: article reads from the on-disk database vs the in-memory read snapshot.
+
+Copies a synthetic corpus of BENCH_ROWS (default 100000) articles from
+benchmarks/corpus.py and times DatabaseManager.get_articles (paged, searched
+and date-filtered) and get_article_by_id, BENCH_REPEAT (default 2000) calls
+each, first with reads going to the file and then with READ_SNAPSHOT on.
+Reports p50/p99 per query and the throughput of BENCH_THREADS (default 4)
+concurrent readers, as the database executor runs them.
+
+A last phase repeats paged and detail reads for BENCH_INGEST_SECONDS (default
+10) while a second DatabaseManager on the same file (standing in for the
+leader process) inserts BENCH_INGEST_BATCH (default 200) articles every second,
+and reports how many reads the snapshot served.
+
+Memory cost is the snapshot's page_count * page_size and the process's
+anonymous RSS before and after it is built (mmap'd file pages are excluded);
+the build (backup API copy) time is reported too. The corpus file is warm in
+the page cache and mmap'd, so the disk numbers are the best case for disk reads.
+"""
+import os
+import sys
+import random
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.corpus import SEARCH_TERMS, ensure_corpus, generate_articles
+
+from database import DatabaseManager, _SNAPSHOT_READS
+
+ROWS = int(os.getenv('BENCH_ROWS', '100000'))
+REPEAT = int(os.getenv('BENCH_REPEAT', '2000'))
+THREADS = int(os.getenv('BENCH_THREADS', '4'))
+INGEST_SECONDS = float(os.getenv('BENCH_INGEST_SECONDS', '10'))
+INGEST_BATCH = int(os.getenv('BENCH_INGEST_BATCH', '200'))
+
+
+def rss_bytes() -> int:
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('RssAnon:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def make_queries(max_id: int):
+    """(name, callable taking the manager and a Random) for each read being timed"""
+    today = datetime.now(timezone.utc).date()
+    
+    def paged(manager, rng):
+        manager.get_articles(page=rng.randint(1, 50), limit=20)
+    
+    def search(manager, rng):
+        manager.get_articles(search=rng.choice(SEARCH_TERMS), limit=20)
+    
+    def date_range(manager, rng):
+        day = today - timedelta(days=rng.randrange(30))
+        manager.get_articles(date_from=day.isoformat(), date_to=(day + timedelta(days=1)).isoformat(), limit=20)
+    
+    def detail(manager, rng):
+        manager.get_article_by_id(rng.randint(1, max_id))
+    
+    return [('articles_paged', paged), ('articles_search', search), ('articles_date_range', date_range),
+            ('article_detail', detail)]
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def time_queries(manager: DatabaseManager, queries):
+    results = {}
+    for name, query in queries:
+        rng = random.Random(name)
+        for _ in range(min(REPEAT, 50)):
+            query(manager, rng)
+        samples = []
+        for _ in range(REPEAT):
+            started = time.perf_counter()
+            query(manager, rng)
+            samples.append(time.perf_counter() - started)
+        results[name] = percentiles(samples)
+    return results
+
+
+def concurrent_throughput(manager: DatabaseManager, queries) -> float:
+    """Reads per second across THREADS threads, each cycling through every query"""
+    def worker(seed: int):
+        rng = random.Random(seed)
+        for i in range(REPEAT):
+            queries[i % len(queries)][1](manager, rng)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return THREADS * REPEAT / (time.perf_counter() - started)
+
+
+def under_ingest(manager: DatabaseManager, writer: DatabaseManager, queries, offset: int):
+    """(p50, p99, reads served by the snapshot, reads sent to disk) while writer inserts a batch every second"""
+    stop = threading.Event()
+    
+    def ingest():
+        batch = 0
+        while not stop.is_set():
+            articles = [{'title': values[0], 'url': f'https://ingest.example.com/{offset}/{batch}/{i}',
+                         'publisher': values[2], 'summary': values[4]}
+                        for i, values in enumerate(generate_articles(INGEST_BATCH, seed=offset + batch))]
+            writer.bulk_insert_articles(articles)
+            batch += 1
+            stop.wait(1)
+    
+    reads_before = dict(_SNAPSHOT_READS._values)
+    thread = threading.Thread(target=ingest)
+    thread.start()
+    rng = random.Random(offset)
+    samples = []
+    deadline = time.monotonic() + INGEST_SECONDS
+    while time.monotonic() < deadline:
+        for _, query in queries:
+            if query.__name__ in ('paged', 'detail'):
+                started = time.perf_counter()
+                query(manager, rng)
+                samples.append(time.perf_counter() - started)
+    stop.set()
+    thread.join()
+    
+    served = {source: count - reads_before.get(source, 0) for source, count in _SNAPSHOT_READS._values.items()}
+    return percentiles(samples) + (served.get(('snapshot',), 0), served.get(('disk',), 0))
+
+
+def main():
+    corpus, _ = ensure_corpus(ROWS)
+    tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+    path = os.path.join(tmp_dir, 'bench.db')
+    shutil.copyfile(corpus, path)
+    
+    os.environ['DATABASE_PATH'] = path
+    os.environ['READ_SNAPSHOT'] = 'False'
+    manager = DatabaseManager()
+    with manager.get_connection() as conn:
+        max_id = conn.execute('SELECT MAX(id) FROM news_articles').fetchone()[0]
+    queries = make_queries(max_id)
+    
+    disk = time_queries(manager, queries)
+    disk_throughput = concurrent_throughput(manager, queries)
+    
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    snapshot = manager.refresh_snapshot()
+    build_seconds = time.perf_counter() - started
+    manager.read_snapshot = True
+    memory = time_queries(manager, queries)
+    memory_throughput = concurrent_throughput(manager, queries)
+    rss_after = rss_bytes()
+    
+    # Ingest last, so the timings above all see the same corpus
+    writer = DatabaseManager()
+    writer.clustering_enabled = False
+    manager.generation_check_interval = 0.1
+    manager.read_snapshot = False
+    disk_ingest = under_ingest(manager, writer, queries, 1)
+    manager.read_snapshot = True
+    memory_ingest = under_ingest(manager, writer, queries, 2)
+    generations = (snapshot.generation, manager.get_snapshot_stats()['generation'])
+    
+    print(f"{ROWS} articles, file {os.path.getsize(path) / 2 ** 20:.1f} MiB, {REPEAT} calls per query")
+    print(f"snapshot: {snapshot.size_bytes / 2 ** 20:.1f} MiB of pages, built in {build_seconds * 1000:.0f}ms, "
+          f"anonymous RSS {rss_before / 2 ** 20:.0f} -> {rss_after / 2 ** 20:.0f} MiB\n")
+    print(f"{'query':<22} {'disk p50':>9} {'p99':>8} {'snapshot p50':>13} {'p99':>8} {'p50 speedup':>12}")
+    for name, _ in queries:
+        disk_p50, disk_p99 = disk[name]
+        memory_p50, memory_p99 = memory[name]
+        print(f"{name:<22} {disk_p50 * 1e6:>7.0f}us {disk_p99 * 1e6:>6.0f}us {memory_p50 * 1e6:>11.0f}us "
+              f"{memory_p99 * 1e6:>6.0f}us {disk_p50 / memory_p50:>11.2f}x")
+    print(f"\n{THREADS} concurrent readers: disk {disk_throughput:.0f} reads/s, "
+          f"snapshot {memory_throughput:.0f} reads/s")
+    print(f"\npaged and detail reads during ingest ({INGEST_BATCH} articles/s from another manager):")
+    print(f"  disk      p50 {disk_ingest[0] * 1e6:.0f}us p99 {disk_ingest[1] * 1e6:.0f}us")
+    print(f"  snapshot  p50 {memory_ingest[0] * 1e6:.0f}us p99 {memory_ingest[1] * 1e6:.0f}us, "
+          f"{memory_ingest[2]} reads from the snapshot, {memory_ingest[3]} from disk while it was behind "
+          f"(generation {generations[0]} -> {generations[1]})")
+    
+    writer.close_all_connections()
+    manager.close_all_connections()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: LIKE vs FTS5 latency for /articles?search=.
+
+Builds a synthetic news_articles table (1M rows by default, set BENCH_ROWS
+to change) in a temporary database and times DatabaseManager.get_articles
+for a handful of searches, once through the FTS5 index and once with the
+LIKE fallback.
+"""
+import os
+import sys
+import random
+import tempfile
+import time
+import statistics
+
+_tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+os.environ['DATABASE_PATH'] = os.path.join(_tmp_dir, 'bench.db')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager
+
+ROWS = int(os.getenv('BENCH_ROWS', '1000000'))
+REPEAT = int(os.getenv('BENCH_REPEAT', '5'))
+QUERIES = [
+    ('rare term', 'bitcoin'),
+    ('common term', 'market'),
+    ('prefix', 'infla*'),
+    ('phrase', '"interest rates"'),
+    ('relevance sort', 'oil prices'),
+]
+
+WORDS = ('market stocks shares earnings profit revenue growth inflation interest rates bank '
+         'central policy oil prices energy trade tariffs china europe investors bonds yields '
+         'dollar currency tech startup funding merger acquisition deal quarter forecast').split()
+
+
+def build_corpus(db: DatabaseManager):
+    rng = random.Random(42)
+    batch = []
+    with db.get_connection() as conn:
+        for i in range(ROWS):
+            title = ' '.join(rng.choice(WORDS) for _ in range(8))
+            if i % 5000 == 0:
+                title += ' bitcoin'
+            summary = ' '.join(rng.choice(WORDS) for _ in range(25))
+            batch.append((title.capitalize(), f'https://example.com/{i}', f'Publisher {i % 200}',
+                          summary, f'2025-07-{1 + i % 28:02d} {i % 24:02d}:00:00'))
+            if len(batch) == 50000:
+                conn.executemany('''
+                    INSERT INTO news_articles (title, url, publisher, summary, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', batch)
+                conn.commit()
+                batch = []
+        if batch:
+            conn.executemany('''
+                INSERT INTO news_articles (title, url, publisher, summary, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', batch)
+            conn.commit()
+
+
+def time_query(db: DatabaseManager, search: str, sort: str):
+    samples = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = db.get_articles(page=1, limit=20, search=search, sort=sort)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, result['total_count']
+
+
+def main():
+    db = DatabaseManager()
+    if not db.fts_enabled:
+        print("FTS5 is not available in this SQLite build; nothing to compare")
+        return
+    
+    start = time.perf_counter()
+    build_corpus(db)
+    print(f"built {ROWS} rows (with FTS triggers) in {time.perf_counter() - start:.1f}s")
+    print(f"{'query':<16} {'search':<20} {'LIKE ms':>10} {'FTS ms':>10} {'speedup':>8}  matches(LIKE/FTS)")
+    
+    for label, search in QUERIES:
+        sort = 'relevance' if label == 'relevance sort' else 'date'
+        db.fts_enabled = False
+        like_ms, like_count = time_query(db, search, sort)
+        db.fts_enabled = True
+        fts_ms, fts_count = time_query(db, search, sort)
+        print(f"{label:<16} {search:<20} {like_ms:>10.1f} {fts_ms:>10.1f} {like_ms / fts_ms:>7.1f}x  "
+              f"{like_count}/{fts_count}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: serialization cost per 100 rows of /articles.
+
+Takes a page of 100 rows shaped exactly like DatabaseManager.get_articles
+returns them and times each way of turning it into the response body:
+
+    pydantic model       PaginatedResponse(**result).model_dump_json()  (the old path)
+    pydantic adapter     TypeAdapter validate + dump_json (SERIALIZATION_FAST_PATH=False)
+    json (stdlib)        serialization.dumps without orjson
+    orjson               serialization.dumps (the fast path; only taken when orjson is installed)
+
+Every encoder must produce the same bytes as the old path; the benchmark
+fails otherwise.
+"""
+import os
+import sys
+import json
+import time
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.corpus import generate_articles
+
+os.environ.setdefault('RAPIDAPI_KEY', 'benchmark')
+os.environ['LOG_FILE'] = os.path.join(os.path.dirname(os.environ['DATABASE_PATH']), 'bench.log')
+
+import serialization
+from main import PaginatedResponse, paginated_adapter
+
+ROWS = 100
+REPEAT = int(os.getenv('BENCH_REPEAT', '2000'))
+COLUMNS = ('title', 'url', 'publisher', 'published_date', 'summary', 'thumbnail', 'language', 'category')
+
+
+def make_page() -> dict:
+    articles = []
+    for article_id, values in enumerate(generate_articles(ROWS), start=1):
+        article = {'id': article_id}
+        article.update(zip(COLUMNS, values[:8]))
+        article['created_at'] = values[-2]
+        article['updated_at'] = values[-1]
+        article['cluster_id'] = article_id
+        articles.append(article)
+    return {'articles': articles, 'total_count': 10000, 'page': 1, 'limit': ROWS, 'total_pages': 100,
+            'has_more': True, 'next_cursor': 'WyIyMDI2LTEwLTAxIDAwOjAwOjAwIiwxMDBd'}
+
+
+def measure(func) -> float:
+    samples = []
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    page = make_page()
+    encoders = [
+        ('pydantic model', lambda: PaginatedResponse(**page).model_dump_json().encode('utf-8')),
+        ('pydantic adapter', lambda: paginated_adapter.dump_json(paginated_adapter.validate_python(page))),
+        ('json (stdlib)', lambda: json.dumps(page, ensure_ascii=False, separators=(',', ':')).encode('utf-8')),
+    ]
+    if serialization.orjson is not None:
+        encoders.append(('orjson', lambda: serialization.orjson.dumps(page)))
+    
+    expected = encoders[0][1]()
+    baseline = None
+    print(f"{ROWS} rows, {len(expected)} bytes, median of {REPEAT} runs")
+    for name, encode in encoders:
+        if encode() != expected:
+            print(f"FAIL: {name} output differs from the Pydantic model output")
+            return 1
+        seconds = measure(encode)
+        baseline = baseline or seconds
+        print(f"  {name:<18} {seconds * 1e6:>9.1f}us per 100 rows  {baseline / seconds:>6.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
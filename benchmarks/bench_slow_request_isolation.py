@@ -0,0 +1,74 @@
+"""
+Benchmark: fast requests keep flowing while one request is slow.
+
+Makes /articles/{id} artificially slow (a blocking sleep inside the
+DatabaseManager call, standing in for a slow SQLite query) and fires it
+concurrently with a burst of /health and /latest requests on the same event
+loop. With data access offloaded to the database executor the fast requests
+all finish long before the slow one; if any handler blocked the loop they
+would queue behind it. Exits non-zero when that happens.
+"""
+import os
+import sys
+import asyncio
+import tempfile
+import time
+
+_tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+os.environ['DATABASE_PATH'] = os.path.join(_tmp_dir, 'bench.db')
+os.environ['LOG_FILE'] = os.path.join(_tmp_dir, 'bench.log')
+os.environ.setdefault('RAPIDAPI_KEY', 'benchmark')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from database import db
+from main import app
+
+SLOW_SECONDS = float(os.getenv('BENCH_SLOW_SECONDS', '2'))
+FAST_REQUESTS = int(os.getenv('BENCH_FAST_REQUESTS', '50'))
+
+
+def install_slow_lookup():
+    original = db.get_article_by_id
+    
+    def slow_get_article_by_id(article_id):
+        time.sleep(SLOW_SECONDS)
+        return original(article_id)
+    
+    db.get_article_by_id = slow_get_article_by_id
+
+
+async def main() -> int:
+    db.insert_article({'title': 'Benchmark article', 'url': 'https://example.com/bench'})
+    install_slow_lookup()
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        started = time.perf_counter()
+        
+        async def timed(path: str):
+            response = await client.get(path)
+            return path, response.status_code, time.perf_counter() - started
+        
+        slow = asyncio.create_task(timed('/articles/1'))
+        await asyncio.sleep(0.05)
+        fast = await asyncio.gather(*[
+            timed('/health' if n % 2 else '/latest') for n in range(FAST_REQUESTS)
+        ])
+        slow_result = await slow
+    
+    fast_done = max(elapsed for _, _, elapsed in fast)
+    print(f"slow request finished after   {slow_result[2]:.3f}s (status {slow_result[1]})")
+    print(f"{FAST_REQUESTS} fast requests finished by {fast_done:.3f}s "
+          f"(statuses {sorted({status for _, status, _ in fast})})")
+    
+    if fast_done >= SLOW_SECONDS:
+        print("FAIL: fast requests were blocked behind the slow one")
+        return 1
+    print("OK: event loop stayed responsive")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
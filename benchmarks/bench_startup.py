@@ -0,0 +1,92 @@
+"""
+Benchmark: time from process start to first served request.
+
+Launches ``uvicorn main:app`` in a subprocess against a fake upstream that
+answers slowly (BENCH_UPSTREAM_LATENCY, default 3s), then polls /ready. Reports
+the wall-clock time until the first response, the app's own startup timings
+(import, startup complete, first request, measured from main.py import) and
+how long it takes for /ready to turn "warm" once the background initial fetch
+lands. Startup that waited for the upstream would take at least the latency
+before answering anything; exits non-zero if that happens.
+"""
+import os
+import sys
+import socket
+import subprocess
+import tempfile
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.fake_upstream import FakeUpstream
+
+LATENCY = float(os.getenv('BENCH_UPSTREAM_LATENCY', '3'))
+TIMEOUT = float(os.getenv('BENCH_TIMEOUT', '60'))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main() -> int:
+    upstream = FakeUpstream(items_per_feed=int(os.getenv('BENCH_ITEMS_PER_FEED', '50')), latency=LATENCY).start()
+    tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+    port = free_port()
+    env = dict(os.environ,
+               DATABASE_PATH=os.path.join(tmp_dir, 'bench.db'),
+               LOG_FILE=os.path.join(tmp_dir, 'bench.log'),
+               LOG_LEVEL=os.getenv('LOG_LEVEL', 'WARNING'),
+               RAPIDAPI_KEY='benchmark',
+               RAPIDAPI_HOST=upstream.host,
+               NEWS_API_SCHEME='http',
+               RATE_LIMIT_PER_SECOND='0')
+    
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--log-level', 'warning'],
+        cwd=ROOT, env=env
+    )
+    try:
+        first_response = None
+        warm_at = None
+        readiness = None
+        with httpx.Client(base_url=f'http://127.0.0.1:{port}', timeout=TIMEOUT) as client:
+            while time.perf_counter() - started < TIMEOUT:
+                try:
+                    readiness = client.get('/ready').json()
+                except httpx.TransportError:
+                    time.sleep(0.01)
+                    continue
+                if first_response is None:
+                    first_response = time.perf_counter() - started
+                    print(f"first response after {first_response * 1000:.0f}ms "
+                          f"(status={readiness['status']}, initial_fetch={readiness['initial_fetch']})")
+                if readiness['status'] == 'warm':
+                    warm_at = time.perf_counter() - started
+                    break
+                time.sleep(0.05)
+        
+        if warm_at is None:
+            print(f"never warm within {TIMEOUT}s: {readiness}")
+            return 1
+        print(f"warm after {warm_at * 1000:.0f}ms ({readiness['total_articles']} articles, "
+              f"upstream latency {LATENCY}s)")
+        print(f"app startup timings since import: {readiness['startup']}")
+        
+        if first_response >= LATENCY:
+            print("FAIL: first response waited for the upstream fetch")
+            return 1
+        return 0
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        upstream.stop()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
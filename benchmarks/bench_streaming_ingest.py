@@ -0,0 +1,91 @@
+"""
+Benchmark: peak memory of buffered vs streaming ingest.
+
+For several payload sizes served by benchmarks/fake_upstream.py, measures
+tracemalloc peak while ingesting one feed two ways:
+
+  buffered   read the whole body, json.loads it, normalize every item, then
+             one bulk_insert_articles (the pre-streaming ingest, kept here as
+             the baseline)
+  streaming  fetch_and_store_news (incremental parse, batched writes)
+
+The streaming peak should stay roughly flat as the payload grows.
+"""
+import os
+import sys
+import json
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fake_upstream import FakeUpstream
+
+SIZES = [int(n) for n in os.getenv('BENCH_ITEM_COUNTS', '1000,5000,20000').split(',')]
+
+upstream = FakeUpstream(subnews_per_item=2).start()
+
+_tmp_dir = tempfile.mkdtemp(prefix='news_bench_')
+os.environ.update({
+    'DATABASE_PATH': os.path.join(_tmp_dir, 'bench.db'),
+    'LOG_FILE': os.path.join(_tmp_dir, 'bench.log'),
+    'LOG_LEVEL': os.getenv('LOG_LEVEL', 'WARNING'),
+    'RAPIDAPI_KEY': 'benchmark',
+    'RAPIDAPI_HOST': upstream.host,
+    'NEWS_API_SCHEME': 'http',
+    'NEWS_FEEDS': '/business:en-US',
+    'RATE_LIMIT_PER_SECOND': '0',
+    'MAX_ARTICLES_PER_FETCH': '100000000',
+})
+
+from database import db
+from news_fetcher import feed_key, news_fetcher
+
+
+def measure(label: str, func):
+    db.clear_count_cache()
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return f"{label} {peak / 1024 / 1024:>8.1f} MiB {elapsed:>6.2f}s"
+
+
+def buffered():
+    feed = news_fetcher.feeds[0]
+    headers = {'x-rapidapi-key': news_fetcher.rapidapi_key, 'x-rapidapi-host': news_fetcher.rapidapi_host}
+    conn, response = news_fetcher._open_response(feed_key(feed), headers)
+    try:
+        raw = json.loads(response.read().decode('utf-8'))
+    finally:
+        conn.close()
+    db.bulk_insert_articles(news_fetcher.item_normalizer(feed).normalize(raw.get('items', [])))
+
+
+def main():
+    feed = news_fetcher.feeds[0]
+    print(f"{'items':>7} {'payload':>9}   {'buffered peak / time':<28} {'streaming peak / time':<28}")
+    try:
+        for size in SIZES:
+            upstream.items_per_feed = size
+            upstream._payloads.clear()
+            payload = upstream.payload(feed['endpoint'].strip('/'), feed['language'])
+            # Fresh rows each time so both paths do the same inserts
+            with db.get_connection() as conn:
+                conn.execute('DELETE FROM news_articles')
+                conn.commit()
+            buffered_result = measure('', buffered)
+            with db.get_connection() as conn:
+                conn.execute('DELETE FROM news_articles')
+                conn.commit()
+            streaming_result = measure('', news_fetcher.fetch_and_store_news)
+            print(f"{size:>7} {len(payload) / 1024 / 1024:>7.1f}MB  {buffered_result:<28} {streaming_result:<28}")
+    finally:
+        news_fetcher.connection_pool.close_all()
+        upstream.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+Compare two benchmark suite result files and flag regressions.
+
+    python -m benchmarks.compare results/base.json results/new.json --threshold 0.10
+
+For every load scenario present in both files it compares throughput and the
+p50/p99 latencies, and for every ingest pass the articles per second. A change
+worse than ``--threshold`` (relative) is a regression, as is any scenario that
+starts returning errors. Exits 1 if anything regressed, so it can gate CI.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# (label, path into a scenario result, True if higher is better)
+SCENARIO_METRICS = (
+    ('rps', ('throughput_rps',), True),
+    ('p50 ms', ('latency_ms', 'p50'), False),
+    ('p99 ms', ('latency_ms', 'p99'), False)
+)
+
+
+def _get(data: Dict[str, Any], path: Tuple[str, ...]) -> Optional[float]:
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def compare_value(base: Optional[float], new: Optional[float], higher_is_better: bool,
+                  threshold: float) -> Tuple[Optional[float], bool]:
+    """Relative change (positive = better) and whether it is a regression"""
+    if not base or new is None:
+        return None, False
+    change = (new - base) / base
+    if not higher_is_better:
+        change = -change
+    return change, change < -threshold
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> Tuple[List[List[str]], List[str]]:
+    rows = []
+    regressions = []
+    
+    for name in sorted(set(base.get('scenarios', {})) & set(new.get('scenarios', {}))):
+        old_result, new_result = base['scenarios'][name], new['scenarios'][name]
+        for label, path, higher_is_better in SCENARIO_METRICS:
+            old_value, new_value = _get(old_result, path), _get(new_result, path)
+            change, regressed = compare_value(old_value, new_value, higher_is_better, threshold)
+            rows.append([name, label, str(old_value), str(new_value),
+                         f'{change:+.1%}' if change is not None else '-', 'REGRESSION' if regressed else ''])
+            if regressed:
+                regressions.append(f'{name} {label}: {old_value} -> {new_value}')
+        if new_result.get('errors') and not old_result.get('errors'):
+            regressions.append(f"{name}: {new_result['errors']} errors ({new_result.get('status_codes')})")
+    
+    old_passes = base.get('ingest', {}).get('passes', {})
+    new_passes = new.get('ingest', {}).get('passes', {})
+    for name in sorted(set(old_passes) & set(new_passes)):
+        old_value = old_passes[name].get('articles_per_second')
+        new_value = new_passes[name].get('articles_per_second')
+        change, regressed = compare_value(old_value, new_value, True, threshold)
+        rows.append([f'ingest {name}', 'articles/s', str(old_value), str(new_value),
+                     f'{change:+.1%}' if change is not None else '-', 'REGRESSION' if regressed else ''])
+        if regressed:
+            regressions.append(f'ingest {name} articles/s: {old_value} -> {new_value}')
+    
+    return rows, regressions
+
+
+def describe(results: Dict[str, Any]) -> str:
+    git = results.get('git', {})
+    corpus = results.get('corpus', {})
+    commit = (git.get('commit') or 'unknown')[:10] + ('+dirty' if git.get('dirty') else '')
+    return f"{commit} ({corpus.get('rows', '?')} rows, {results.get('started_at', '?')})"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative change treated as a regression')
+    args = parser.parse_args()
+    
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    
+    if base.get('corpus', {}).get('rows') != new.get('corpus', {}).get('rows'):
+        print("warning: results were measured on different corpus sizes")
+    
+    print(f"base: {describe(base)}")
+    print(f"new:  {describe(new)}")
+    rows, regressions = compare(base, new, args.threshold)
+    header = ['scenario', 'metric', 'base', 'new', 'change', '']
+    widths = [max(len(str(row[i])) for row in rows + [header]) for i in range(len(header))]
+    for row in [header] + rows:
+        print('  '.join(str(cell).ljust(width) for cell, width in zip(row, widths)).rstrip())
+    
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
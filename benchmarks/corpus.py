@@ -0,0 +1,182 @@
+"""
+Synthetic news_articles corpora for benchmarks.
+
+Builds a database with the application's own schema (tables, indexes, FTS
+index and counter triggers all come from DatabaseManager.init_database) and
+fills it with deterministic articles: Zipf-distributed business vocabulary in
+titles and summaries, a few hundred publishers, several languages and
+categories, and created_at spread over the last ``days`` days so date filters
+select realistic slices. The same ``rows``/``seed``/``days`` always produce the
+same corpus, which is cached on disk and reused across runs:
+
+    python -m benchmarks.corpus --rows 1000000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# database opens its global manager on import; keep that off the real news.db
+os.environ['DATABASE_PATH'] = os.path.join(tempfile.mkdtemp(prefix='news_bench_'), 'scratch.db')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+DEFAULT_CORPUS_DIR = os.path.join(ROOT, 'benchmarks', '.corpora')
+
+VOCABULARY = ('market stocks shares earnings profit revenue growth inflation interest rates bank '
+              'central policy oil prices energy trade tariffs china europe investors bonds yields '
+              'dollar currency tech startup funding merger acquisition deal quarter forecast '
+              'economy recession jobs unemployment wages consumer spending retail sales housing '
+              'mortgage lending credit debt deficit budget tax regulation antitrust lawsuit '
+              'semiconductor chips software cloud ai automation electric vehicles battery lithium '
+              'supply chain shipping freight airline travel tourism hotel restaurant food '
+              'agriculture wheat corn gold silver copper steel aluminum mining crypto exchange '
+              'ipo listing valuation dividend buyback guidance outlook analyst downgrade upgrade '
+              'ceo executive board layoffs hiring strike union pension insurance healthcare '
+              'pharma vaccine biotech trial approval federal reserve ecb treasury minister '
+              'government election sanctions war ukraine russia india japan brazil mexico').split()
+
+# Rare enough that a search for them exercises the selective end of the index
+RARE_TERMS = ('bitcoin', 'hydrogen', 'uranium', 'stablecoin', 'cobalt')
+
+LANGUAGES = ('en-US', 'en-US', 'en-US', 'en-GB', 'de-DE', 'fr-FR')
+CATEGORIES = ('business', 'business', 'technology', 'world', 'markets')
+
+# Representative /articles?search= values: common, mid-frequency, rare, prefix, phrase
+SEARCH_TERMS = ('market', 'inflation', 'tariffs', 'bitcoin', 'semicon*', '"interest rates"', 'oil prices')
+
+_INSERT_SQL = '''
+    INSERT INTO news_articles
+    (title, url, publisher, published_date, summary, thumbnail, language, category, full_content,
+     content_hash, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def corpus_path(rows: int, seed: int = 42, days: int = 30, corpus_dir: str = DEFAULT_CORPUS_DIR) -> str:
+    return os.path.join(corpus_dir, f'articles_{rows}_s{seed}_d{days}.db')
+
+
+def _zipf_weights(n: int) -> List[float]:
+    return [1.0 / (rank + 1) for rank in range(n)]
+
+
+def generate_articles(rows: int, seed: int = 42, days: int = 30,
+                      now: datetime = None) -> Iterator[Tuple[Any, ...]]:
+    """Yield insert tuples for _INSERT_SQL, oldest first so ids follow created_at"""
+    from database import _article_values
+    
+    rng = random.Random(seed)
+    words = list(VOCABULARY)
+    rng.shuffle(words)
+    weights = _zipf_weights(len(words))
+    # created_at is stored in UTC, like CURRENT_TIMESTAMP
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    start = now - timedelta(days=days)
+    step = (days * 86400) / max(rows, 1)
+    
+    for i in range(rows):
+        title_words = rng.choices(words, weights, k=rng.randint(6, 12))
+        if rng.random() < 0.002:
+            title_words.insert(rng.randrange(len(title_words)), rng.choice(RARE_TERMS))
+        summary_words = rng.choices(words, weights, k=rng.randint(20, 40))
+        created = start + timedelta(seconds=int(i * step))
+        created_at = created.strftime('%Y-%m-%d %H:%M:%S')
+        article: Dict[str, Any] = {
+            'title': ' '.join(title_words).capitalize(),
+            'url': f'https://news.example.com/{i}',
+            'publisher': f'Publisher {int(rng.paretovariate(1.2)) % 300}',
+            'published_date': (created - timedelta(minutes=rng.randint(0, 600))).strftime('%Y-%m-%d %H:%M:%S'),
+            'summary': ' '.join(summary_words).capitalize() + '.',
+            'thumbnail': f'https://img.example.com/{i}.jpg',
+            'language': rng.choice(LANGUAGES),
+            'category': rng.choice(CATEGORIES),
+            'full_content': ''
+        }
+        yield _article_values(article) + (created_at, created_at)
+
+
+def build_corpus(path: str, rows: int, seed: int = 42, days: int = 30, batch_size: int = 50000) -> float:
+    """Create a corpus database at path through the application's schema; returns build seconds"""
+    from database import DatabaseManager
+    
+    started = time.perf_counter()
+    scratch_path, os.environ['DATABASE_PATH'] = os.environ['DATABASE_PATH'], path
+    try:
+        manager = DatabaseManager()
+    finally:
+        os.environ['DATABASE_PATH'] = scratch_path
+    with manager.get_connection() as conn:
+        conn.execute('PRAGMA synchronous=OFF')
+        batch = []
+        for values in generate_articles(rows, seed, days):
+            batch.append(values)
+            if len(batch) >= batch_size:
+                conn.executemany(_INSERT_SQL, batch)
+                conn.commit()
+                batch = []
+        if batch:
+            conn.executemany(_INSERT_SQL, batch)
+        conn.execute("UPDATE table_counters SET value = CAST(strftime('%s', 'now') AS INTEGER) "
+                     "WHERE name = 'last_modified'")
+        conn.commit()
+        conn.execute('PRAGMA optimize')
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    manager.close_all_connections()
+    return time.perf_counter() - started
+
+
+def ensure_corpus(rows: int, seed: int = 42, days: int = 30, corpus_dir: str = DEFAULT_CORPUS_DIR,
+                  rebuild: bool = False) -> Tuple[str, float]:
+    """Path to a cached corpus, building it first if needed; returns (path, build seconds or 0.0)"""
+    path = corpus_path(rows, seed, days, corpus_dir)
+    if os.path.exists(path) and not rebuild and _is_complete(path, rows):
+        return path, 0.0
+    
+    os.makedirs(corpus_dir, exist_ok=True)
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    partial = path + '.partial'
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(partial + suffix):
+            os.remove(partial + suffix)
+    seconds = build_corpus(partial, rows, seed, days)
+    os.replace(partial, path)
+    return path, seconds
+
+
+def _is_complete(path: str, rows: int) -> bool:
+    try:
+        with sqlite3.connect(path) as conn:
+            row = conn.execute("SELECT value FROM table_counters WHERE name = 'news_articles'").fetchone()
+            return row is not None and row[0] == rows
+    except sqlite3.Error:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--corpus-dir', default=os.getenv('BENCH_CORPUS_DIR', DEFAULT_CORPUS_DIR))
+    parser.add_argument('--rebuild', action='store_true')
+    args = parser.parse_args()
+    
+    path, seconds = ensure_corpus(args.rows, args.seed, args.days, args.corpus_dir, args.rebuild)
+    if seconds:
+        print(f"built {args.rows} rows in {seconds:.1f}s: {path}")
+    else:
+        print(f"reusing {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+"""
+Local stand-in for the RapidAPI Google News endpoints.
+
+Serves deterministic ``{"status": "success", "items": [...]}`` payloads with
+``subnews`` for any path, over HTTP/1.1 keep-alive, and records how many
+requests and TCP connections it saw. Point the fetcher at it with
+
+    NEWS_API_SCHEME=http RAPIDAPI_HOST=127.0.0.1:<port>
+"""
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+BASE_TIMESTAMP_MS = 1752494570000
+
+
+def make_item(feed: str, language: str, n: int, subnews: int = 2) -> Dict[str, Any]:
+    """One upstream item shaped like the real API response"""
+    item = {
+        'title': f'{feed.title()} headline {n} ({language})',
+        'snippet': f'Synthetic snippet for {feed} story {n}. ' * 4,
+        'publisher': f'Publisher {n % 37}',
+        'newsUrl': f'https://news.example.com/{language}/{feed}/{n}',
+        'timestamp': str(BASE_TIMESTAMP_MS - n * 60000),
+        'images': {
+            'thumbnail': f'https://img.example.com/{feed}/{n}.jpg',
+            'thumbnailProxied': f'https://proxy.example.com/{feed}/{n}.jpg'
+        },
+        'hasSubnews': subnews > 0,
+        'subnews': []
+    }
+    for s in range(subnews):
+        item['subnews'].append({
+            'title': f'{feed.title()} related {n}.{s} ({language})',
+            'snippet': f'Related coverage {s} of {feed} story {n}.',
+            'publisher': f'Syndicate {s}',
+            'newsUrl': f'https://syndicate{s}.example.com/{language}/{feed}/{n}',
+            'timestamp': str(BASE_TIMESTAMP_MS - n * 60000 - s * 1000),
+            'images': {'thumbnail': f'https://img.example.com/{feed}/{n}-{s}.jpg'}
+        })
+    return item
+
+
+def make_payload(feed: str, language: str, items: int, subnews: int = 2) -> bytes:
+    """A full ``items`` response body"""
+    return json.dumps({
+        'status': 'success',
+        'items': [make_item(feed, language, n, subnews) for n in range(items)]
+    }).encode('utf-8')
+
+
+class FakeUpstream:
+    """Threaded HTTP server replaying RapidAPI-style payloads
+    
+    ``items_per_feed`` and ``subnews_per_item`` shape the payload and
+    ``latency`` adds a fixed server-side delay per request.
+    """
+    
+    def __init__(self, items_per_feed: int = 50, subnews_per_item: int = 2, latency: float = 0.0):
+        self.items_per_feed = items_per_feed
+        self.subnews_per_item = subnews_per_item
+        self.latency = latency
+        self.requests = 0
+        self.connections = 0
+        self.request_log: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._payloads: Dict[tuple, bytes] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+    
+    @property
+    def host(self) -> str:
+        return f'127.0.0.1:{self.port}'
+    
+    def payload(self, feed: str, language: str) -> bytes:
+        key = (feed, language)
+        if key not in self._payloads:
+            self._payloads[key] = make_payload(feed, language, self.items_per_feed, self.subnews_per_item)
+        return self._payloads[key]
+    
+    def handle(self, handler: BaseHTTPRequestHandler):
+        """Build the response for one request (override to script other behaviour)"""
+        url = urlparse(handler.path)
+        feed = url.path.strip('/') or 'business'
+        language = parse_qs(url.query).get('lr', ['en-US'])[0]
+        return 200, {}, self.payload(feed, language)
+    
+    def _make_handler(self):
+        upstream = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def setup(self):
+                super().setup()
+                with upstream._lock:
+                    upstream.connections += 1
+            
+            def do_GET(self):
+                with upstream._lock:
+                    upstream.requests += 1
+                    upstream.request_log.append({'path': self.path, 'headers': dict(self.headers),
+                                                 'time': time.monotonic()})
+                if upstream.latency:
+                    time.sleep(upstream.latency)
+                status, headers, body = upstream.handle(self)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+    
+    def start(self) -> 'FakeUpstream':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+    
+    def __enter__(self) -> 'FakeUpstream':
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ChangingUpstream(FakeUpstream):
+    """Fake upstream whose feeds gain stories at per-feed rates, with ETag/Last-Modified support
+    
+    ``rates`` maps a feed name (path without the slash) to new stories per hour;
+    ``advance(hours)`` moves the upstream's clock. Each feed serves its newest
+    ``items_per_feed`` stories, so stories pushed out of that window between two
+    polls are never seen. Conditional requests for an unchanged feed get a 304
+    unless ``validators`` is False.
+    """
+    
+    def __init__(self, rates: Dict[str, float], validators: bool = True, **kwargs):
+        super().__init__(**kwargs)
+        self.rates = rates
+        self.validators = validators
+        self.hours = 0.0
+        self.not_modified = 0
+        self.bytes_sent = 0
+    
+    def advance(self, hours: float):
+        with self._lock:
+            self.hours += hours
+    
+    def story_count(self, feed: str) -> int:
+        """Stories published on feed so far; story n > items_per_feed appears at (n - items_per_feed) / rate"""
+        return self.items_per_feed + int(self.rates.get(feed, 0.0) * self.hours + 1e-9)
+    
+    def published_at(self, feed: str, story: int) -> float:
+        """Upstream clock (hours) at which a story appeared"""
+        if story < self.items_per_feed:
+            return 0.0
+        return (story + 1 - self.items_per_feed) / self.rates[feed]
+    
+    def payload(self, feed: str, language: str) -> bytes:
+        count = self.story_count(feed)
+        key = (feed, language, count)
+        if key not in self._payloads:
+            items = [make_item(feed, language, n, self.subnews_per_item)
+                     for n in range(count - 1, count - 1 - self.items_per_feed, -1)]
+            self._payloads[key] = json.dumps({'status': 'success', 'items': items}).encode('utf-8')
+        return self._payloads[key]
+    
+    def handle(self, handler: BaseHTTPRequestHandler):
+        url = urlparse(handler.path)
+        feed = url.path.strip('/') or 'business'
+        language = parse_qs(url.query).get('lr', ['en-US'])[0]
+        count = self.story_count(feed)
+        headers = {}
+        if self.validators:
+            newest = self.published_at(feed, count - 1)
+            headers = {
+                'ETag': f'"{feed}-{language}-{count}"',
+                'Last-Modified': formatdate(BASE_TIMESTAMP_MS / 1000 + newest * 3600, usegmt=True)
+            }
+            # If-None-Match takes precedence over If-Modified-Since when both are sent
+            if_none_match = handler.headers.get('If-None-Match')
+            if if_none_match is not None:
+                unchanged = if_none_match == headers['ETag']
+            else:
+                unchanged = handler.headers.get('If-Modified-Since') == headers['Last-Modified']
+            if unchanged:
+                with self._lock:
+                    self.not_modified += 1
+                return 304, headers, b''
+        body = self.payload(feed, language)
+        with self._lock:
+            self.bytes_sent += len(body)
+        return 200, headers, body
+
+
+if __name__ == '__main__':
+    with FakeUpstream() as upstream:
+        print(f"Fake upstream listening on http://{upstream.host}/ (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,359 @@
+"""
+Benchmark suite: HTTP load scenarios over a synthetic corpus plus an ingest run.
+
+Builds (or reuses) a synthetic corpus with benchmarks/corpus.py, starts the
+API under uvicorn on it and drives each load scenario with concurrent
+keep-alive clients for a fixed duration after a warmup:
+
+    articles_paged        /articles?page=1..50
+    articles_deep_paged   /articles?page=<anywhere in the corpus>
+    articles_search       /articles?search=<common, rare, prefix, phrase terms>
+    articles_date_range   /articles?date_from=..&date_to=.. (one-day windows)
+    article_detail        /articles/{random id}
+    latest                /latest
+    stats                 /stats
+
+The suite holds the scheduler leader lock for the corpus, so the server runs as
+a follower and never fetches or cleans up while it is being measured.
+
+The ingest benchmark starts a second server on an empty database against
+benchmarks/fake_upstream.py. It triggers POST /admin/fetch three times: a cold
+run (all inserts), an identical re-run (all unchanged) and a run with edited
+payloads (all updates). Each run reports the fetch job's per-stage timings and
+its articles per second.
+
+Results are written as JSON (schema below) for benchmarks/compare.py:
+
+    python -m benchmarks.suite --rows 100000 --output results/base.json
+    python -m benchmarks.suite --rows 100000 --output results/new.json
+    python -m benchmarks.compare results/base.json results/new.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from benchmarks.corpus import DEFAULT_CORPUS_DIR, SEARCH_TERMS, ensure_corpus
+from benchmarks.fake_upstream import FakeUpstream, make_item
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from leader import LeaderLock
+
+RESULTS_SCHEMA = 1
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True).stdout.strip())
+        return {'commit': commit, 'dirty': dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': None, 'dirty': None}
+
+
+class ApiServer:
+    """uvicorn running main:app in a subprocess with the given environment overrides"""
+    
+    def __init__(self, env: Dict[str, str], workers: int = 1):
+        self.port = free_port()
+        self.base_url = f'http://127.0.0.1:{self.port}'
+        self.env = dict(os.environ, **env)
+        self.workers = workers
+        self.process: Optional[subprocess.Popen] = None
+    
+    def __enter__(self) -> 'ApiServer':
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(self.port),
+             '--workers', str(self.workers), '--log-level', 'warning', '--no-access-log'],
+            cwd=ROOT, env=self.env
+        )
+        deadline = time.monotonic() + 60
+        with httpx.Client(base_url=self.base_url) as client:
+            while time.monotonic() < deadline:
+                if self.process.poll() is not None:
+                    raise RuntimeError(f"server exited with status {self.process.returncode}")
+                try:
+                    client.get('/ready')
+                    return self
+                except httpx.TransportError:
+                    time.sleep(0.05)
+        raise RuntimeError("server did not start within 60s")
+    
+    def __exit__(self, *exc):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+def corpus_facts(path: str) -> Dict[str, Any]:
+    """Id and created_at ranges the scenarios draw their parameters from"""
+    with sqlite3.connect(path) as conn:
+        max_id, first, last = conn.execute(
+            'SELECT MAX(id), MIN(created_at), MAX(created_at) FROM news_articles'
+        ).fetchone()
+    return {
+        'max_id': max_id or 1,
+        'first_day': datetime.strptime(first[:10], '%Y-%m-%d'),
+        'days': max(1, (datetime.strptime(last[:10], '%Y-%m-%d') - datetime.strptime(first[:10], '%Y-%m-%d')).days),
+        'size_bytes': os.path.getsize(path)
+    }
+
+
+def make_scenarios(facts: Dict[str, Any], page_size: int) -> Dict[str, Callable[[random.Random], str]]:
+    last_page = max(1, facts['max_id'] // page_size)
+    
+    def date_range(rng: random.Random) -> str:
+        day = facts['first_day'] + timedelta(days=rng.randrange(facts['days']))
+        return (f"/articles?limit={page_size}&date_from={day:%Y-%m-%d}"
+                f"&date_to={day + timedelta(days=1):%Y-%m-%d}")
+    
+    return {
+        'articles_paged': lambda rng: f"/articles?limit={page_size}&page={rng.randint(1, min(50, last_page))}",
+        'articles_deep_paged': lambda rng: f"/articles?limit={page_size}&page={rng.randint(1, last_page)}",
+        'articles_search': lambda rng: f"/articles?limit={page_size}&search={rng.choice(SEARCH_TERMS)}",
+        'articles_date_range': date_range,
+        'article_detail': lambda rng: f"/articles/{rng.randint(1, facts['max_id'])}",
+        'latest': lambda rng: f"/latest?limit={page_size}",
+        'stats': lambda rng: '/stats'
+    }
+
+
+def summarize_latencies(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    
+    def percentile(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000, 3)
+    
+    return {
+        'mean': round(sum(ordered) / len(ordered) * 1000, 3),
+        'p50': percentile(50),
+        'p90': percentile(90),
+        'p95': percentile(95),
+        'p99': percentile(99),
+        'max': round(ordered[-1] * 1000, 3)
+    }
+
+
+async def run_load(base_url: str, make_path: Callable[[random.Random], str], concurrency: int,
+                   duration: float, warmup: float, seed: int) -> Dict[str, Any]:
+    """Closed-loop load: each client sends its next request as soon as the previous one completes"""
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        loop_start = time.perf_counter()
+        measure_from = loop_start + warmup
+        deadline = measure_from + duration
+        
+        async def worker(n: int):
+            nonlocal errors
+            rng = random.Random(seed * 1000 + n)
+            while True:
+                started = time.perf_counter()
+                if started >= deadline:
+                    return
+                try:
+                    response = await client.get(make_path(rng))
+                    status = str(response.status_code)
+                except httpx.HTTPError:
+                    status = 'error'
+                finished = time.perf_counter()
+                if started >= measure_from:
+                    latencies.append(finished - started)
+                    statuses[status] = statuses.get(status, 0) + 1
+                    if status == 'error' or status.startswith('5'):
+                        errors += 1
+        
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'status_codes': statuses,
+        'throughput_rps': round(len(latencies) / duration, 1),
+        'latency_ms': summarize_latencies(latencies)
+    }
+
+
+def run_load_scenarios(args, corpus_path: str, facts: Dict[str, Any], log_dir: str) -> Dict[str, Any]:
+    lock = LeaderLock(f"{corpus_path}.scheduler.lock")
+    if not lock.acquire():
+        raise RuntimeError(f"another process holds {lock.path}; is a server already using this corpus?")
+    
+    env = {
+        'DATABASE_PATH': corpus_path,
+        'LOG_FILE': os.path.join(log_dir, 'load.log'),
+        'LOG_LEVEL': 'WARNING',
+        'RAPIDAPI_KEY': 'benchmark',
+        'RESPONSE_CACHE_ENABLED': 'False' if args.no_response_cache else 'True'
+    }
+    scenarios = make_scenarios(facts, args.page_size)
+    selected = args.scenarios or list(scenarios)
+    results = {}
+    try:
+        with ApiServer(env, workers=args.workers) as server:
+            for name in selected:
+                result = asyncio.run(run_load(server.base_url, scenarios[name], args.concurrency,
+                                              args.duration, args.warmup, args.seed))
+                results[name] = result
+                latency = result['latency_ms']
+                print(f"{name:<22} {result['throughput_rps']:>9.1f} req/s  p50 {latency.get('p50', 0):>8.2f}ms  "
+                      f"p99 {latency.get('p99', 0):>8.2f}ms  errors {result['errors']}", flush=True)
+    finally:
+        lock.release()
+    return results
+
+
+class EditableUpstream(FakeUpstream):
+    """Fake upstream whose payload text can be bumped to turn a re-fetch into updates"""
+    
+    revision = 0
+    
+    def payload(self, feed: str, language: str) -> bytes:
+        key = (feed, language, self.revision)
+        if key not in self._payloads:
+            items = [make_item(feed, language, n, self.subnews_per_item) for n in range(self.items_per_feed)]
+            if self.revision:
+                for item in items:
+                    item['snippet'] += f' (revision {self.revision})'
+            self._payloads[key] = json.dumps({'status': 'success', 'items': items}).encode('utf-8')
+        return self._payloads[key]
+
+
+def run_ingest(args, log_dir: str) -> Dict[str, Any]:
+    feeds = [f'/{name}:en-US' for name in ('business', 'technology', 'world', 'markets')][:args.ingest_feeds]
+    db_path = os.path.join(log_dir, 'ingest.db')
+    lock = LeaderLock(f"{db_path}.scheduler.lock")
+    lock.acquire()
+    
+    passes = {}
+    with EditableUpstream(items_per_feed=args.ingest_items, subnews_per_item=args.ingest_subnews,
+                          latency=args.ingest_latency) as upstream:
+        env = {
+            'DATABASE_PATH': db_path,
+            'LOG_FILE': os.path.join(log_dir, 'ingest.log'),
+            'LOG_LEVEL': 'WARNING',
+            'RAPIDAPI_KEY': 'benchmark',
+            'RAPIDAPI_HOST': upstream.host,
+            'NEWS_API_SCHEME': 'http',
+            'NEWS_FEEDS': ','.join(feeds),
+            'RATE_LIMIT_PER_SECOND': '0',
+            'MAX_ARTICLES_PER_FETCH': str(args.ingest_items * (1 + args.ingest_subnews))
+        }
+        try:
+            with ApiServer(env) as server, httpx.Client(base_url=server.base_url, timeout=60) as client:
+                for name, revision in (('cold', 0), ('unchanged', 0), ('updated', 1)):
+                    upstream.revision = revision
+                    job_id = client.post('/admin/fetch').json()['job_id']
+                    while True:
+                        job = client.get(f'/admin/fetch/{job_id}').json()
+                        if job['status'] != 'running':
+                            break
+                        time.sleep(0.05)
+                    articles = sum(job['articles'].values())
+                    total = job['timings']['total_seconds']
+                    job['articles_per_second'] = round(articles / total, 1) if total else None
+                    passes[name] = job
+                    print(f"ingest {name:<15} {job['articles_per_second']:>9} articles/s  "
+                          f"{job['articles']}  {job['timings']}", flush=True)
+        finally:
+            lock.release()
+    
+    return {
+        'feeds': len(feeds),
+        'items_per_feed': args.ingest_items,
+        'subnews_per_item': args.ingest_subnews,
+        'upstream_latency_seconds': args.ingest_latency,
+        'passes': passes
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=int(os.getenv('BENCH_ROWS', '10000')),
+                        help='corpus size (10k to 5M rows)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--days', type=int, default=30, help='days of created_at spread in the corpus')
+    parser.add_argument('--corpus-dir', default=os.getenv('BENCH_CORPUS_DIR', DEFAULT_CORPUS_DIR))
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=10.0, help='measured seconds per scenario')
+    parser.add_argument('--warmup', type=float, default=2.0, help='unmeasured seconds before each scenario')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn worker processes')
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--scenarios', nargs='*', help='subset of load scenarios to run')
+    parser.add_argument('--no-response-cache', action='store_true', help='run the server with the cache off')
+    parser.add_argument('--skip-load', action='store_true')
+    parser.add_argument('--skip-ingest', action='store_true')
+    parser.add_argument('--ingest-feeds', type=int, default=4)
+    parser.add_argument('--ingest-items', type=int, default=500, help='items per feed in the fake upstream')
+    parser.add_argument('--ingest-subnews', type=int, default=2)
+    parser.add_argument('--ingest-latency', type=float, default=0.0, help='fake upstream delay per request')
+    parser.add_argument('--output', help='write JSON results here (default: stdout)')
+    args = parser.parse_args()
+    
+    log_dir = tempfile.mkdtemp(prefix='news_bench_')
+    results: Dict[str, Any] = {
+        'schema': RESULTS_SCHEMA,
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'git': git_revision(),
+        'environment': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count()
+        },
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'corpus_dir')}
+    }
+    
+    if not args.skip_load:
+        corpus_path, build_seconds = ensure_corpus(args.rows, args.seed, args.days, args.corpus_dir)
+        facts = corpus_facts(corpus_path)
+        results['corpus'] = {'rows': args.rows, 'build_seconds': round(build_seconds, 1),
+                             'size_bytes': facts['size_bytes']}
+        print(f"corpus: {args.rows} rows ({facts['size_bytes'] / 2 ** 20:.0f} MiB)"
+              + (f", built in {build_seconds:.1f}s" if build_seconds else ', cached'), flush=True)
+        results['scenarios'] = run_load_scenarios(args, corpus_path, facts, log_dir)
+    
+    if not args.skip_ingest:
+        results['ingest'] = run_ingest(args, log_dir)
+    
+    output = json.dumps(results, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+        print(f"results written to {args.output}")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,184 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from dotenv import load_dotenv
+from metrics import metrics
+
+# Load environment variables
+load_dotenv()
+
+# Rough per-entry bookkeeping cost (key tuple, OrderedDict node, expiry) added to the body size
+ENTRY_OVERHEAD_BYTES = 256
+
+class CachedResponse:
+    """A serialized response body plus the headers that must be replayed with it"""
+    
+    def __init__(self, body: bytes, media_type: str = 'application/json', headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.media_type = media_type
+        self.headers = headers or {}
+        # Content-Encoding -> compressed body, filled in once per encoding as clients ask for it
+        self.encoded: Dict[str, bytes] = {}
+    
+    @property
+    def size(self) -> int:
+        return (len(self.body) + sum(len(body) for body in self.encoded.values())
+                + sum(len(k) + len(v) for k, v in self.headers.items()) + ENTRY_OVERHEAD_BYTES)
+
+class ResponseCache:
+    """Bounded LRU cache of serialized responses, invalidated by data generation
+    
+    Entries are stored for a single data generation. When a lookup arrives with
+    a newer generation (after an ingest or cleanup) the whole cache is dropped,
+    so nothing older than the data it describes is ever served. Lookups and
+    stores from a request that read an older generation are ignored rather
+    than sending the cache back to it.
+    """
+    
+    def __init__(self):
+        self.enabled = os.getenv('RESPONSE_CACHE_ENABLED', 'True').lower() == 'true'
+        self.max_bytes = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+        self.max_entries = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '2048'))
+        
+        self._entries: "OrderedDict[Hashable, Tuple[CachedResponse, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._size_bytes = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def _check_generation(self, generation: int) -> bool:
+        """Drop every entry when the data generation moves forward (caller holds the lock)
+        
+        Returns False for a generation older than the cached one.
+        """
+        if self._generation is not None and generation < self._generation:
+            return False
+        if generation != self._generation:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._size_bytes = 0
+            self._generation = generation
+        return True
+    
+    def get(self, key: Hashable, generation: int) -> Optional[CachedResponse]:
+        """Return the cached response for key, or None on a miss"""
+        if not self.enabled:
+            return None
+        
+        with self._lock:
+            entry = self._entries.get(key) if self._check_generation(generation) else None
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            cached, expires_at, size = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._size_bytes -= size
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+    
+    def set(self, key: Hashable, generation: int, cached: CachedResponse, ttl: Optional[float] = None):
+        """Store a serialized response, evicting least recently used entries to stay within bounds"""
+        if not self.enabled:
+            return
+        
+        size = cached.size
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            if not self._check_generation(generation):
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size_bytes -= old[2]
+            
+            self._make_room(size)
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._entries[key] = (cached, expires_at, size)
+            self._size_bytes += size
+    
+    def _make_room(self, size: int):
+        """Evict least recently used entries until one of size bytes fits (caller holds the lock)"""
+        while self._entries and (self._size_bytes + size > self.max_bytes
+                                 or len(self._entries) >= self.max_entries):
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size
+            self.evictions += 1
+    
+    def add_encoding(self, key: Hashable, cached: CachedResponse, encoding: str, body: bytes):
+        """Attach a compressed variant to a cached response, evicting other entries to make room
+        
+        The variant is dropped when the response is no longer cached or would not fit with it.
+        """
+        with self._lock:
+            if encoding in cached.encoded:
+                return
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not cached:
+                return
+            size = entry[2] + len(body)
+            if size > self.max_bytes:
+                return
+            
+            # Re-inserted as most recently used, so the eviction below never picks it
+            del self._entries[key]
+            self._size_bytes -= entry[2]
+            self._make_room(size)
+            cached.encoded[encoding] = body
+            self._entries[key] = (cached, entry[1], size)
+            self._size_bytes += size
+    
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'generation': self._generation,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_bytes': self.max_bytes,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations
+            }
+    
+    def metric_families(self) -> List[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]:
+        """Cache counters for /metrics, read at scrape time"""
+        stats = self.get_stats()
+        return [
+            ('response_cache_hits_total', 'counter', 'Response cache hits', [({}, stats['hits'])]),
+            ('response_cache_misses_total', 'counter', 'Response cache misses', [({}, stats['misses'])]),
+            ('response_cache_evictions_total', 'counter', 'Entries evicted to stay within bounds',
+             [({}, stats['evictions'])]),
+            ('response_cache_invalidations_total', 'counter', 'Full clears caused by a new data generation',
+             [({}, stats['invalidations'])]),
+            ('response_cache_entries', 'gauge', 'Cached responses', [({}, stats['entries'])]),
+            ('response_cache_size_bytes', 'gauge', 'Approximate cache memory use', [({}, stats['size_bytes'])])
+        ]
+
+# Global response cache instance
+response_cache = ResponseCache()
+metrics.add_collector(response_cache.metric_families)
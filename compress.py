@@ -0,0 +1,169 @@
+import os
+import gzip
+import zlib
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from metrics import metrics
+
+# Optional codecs: offered only when the library is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Load environment variables
+load_dotenv()
+
+# Media types worth compressing; images and already-compressed formats are left alone
+COMPRESSIBLE_TYPES = ('application/json', 'application/x-ndjson', 'text/')
+
+class _GzipStream:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class _BrotliStream:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+    
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+    
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    
+    def chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+    
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+class ResponseCompressor:
+    """Content-Encoding negotiation and compression for response bodies
+    
+    gzip is always available; br and zstd are offered when brotli/zstandard are
+    installed. Among the encodings a client accepts, the first one in
+    COMPRESSION_ENCODINGS wins. Bodies under COMPRESSION_MIN_SIZE are sent as is.
+    """
+    
+    def __init__(self):
+        self.enabled = os.getenv('COMPRESSION_ENABLED', 'True').lower() == 'true'
+        self.min_size = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+        gzip_level = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+        brotli_quality = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '5'))
+        zstd_level = int(os.getenv('COMPRESSION_ZSTD_LEVEL', '3'))
+        
+        # encoding -> (one-shot compress, streaming compressor factory)
+        self.codecs: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[], object]]] = {
+            'gzip': (lambda body: gzip.compress(body, gzip_level, mtime=0), lambda: _GzipStream(gzip_level))
+        }
+        if brotli is not None:
+            self.codecs['br'] = (lambda body: brotli.compress(body, quality=brotli_quality),
+                                 lambda: _BrotliStream(brotli_quality))
+        if zstandard is not None:
+            zstd_compressor = zstandard.ZstdCompressor(level=zstd_level)
+            self.codecs['zstd'] = (lambda body: zstd_compressor.compress(body), lambda: _ZstdStream(zstd_level))
+        
+        preference = os.getenv('COMPRESSION_ENCODINGS') or 'zstd,br,gzip'
+        self.preference = [name.strip() for name in preference.split(',') if name.strip() in self.codecs]
+        
+        self._lock = threading.Lock()
+        # encoding -> [responses, bytes in, bytes out, seconds]
+        self._stats: Dict[str, List[float]] = {name: [0, 0, 0, 0.0] for name in self.codecs}
+    
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Preferred encoding acceptable to the client, or None for identity"""
+        if not self.enabled or not accept_encoding or not self.preference:
+            return None
+        
+        accepted: Dict[str, float] = {}
+        for part in accept_encoding.lower().split(','):
+            name, _, params = part.strip().partition(';')
+            quality = 1.0
+            params = params.strip()
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    continue
+            accepted[name.strip()] = quality
+        
+        for name in self.preference:
+            if accepted.get(name, accepted.get('*', 0)) > 0:
+                return name
+        return None
+    
+    def should_compress(self, media_type: Optional[str], size: Optional[int]) -> bool:
+        """Whether a body of this type and size (None when streamed) is worth compressing"""
+        if not media_type or not media_type.startswith(COMPRESSIBLE_TYPES):
+            return False
+        return size is None or self.large_enough(size)
+    
+    def large_enough(self, size: int) -> bool:
+        """Whether a body of this size reaches COMPRESSION_MIN_SIZE"""
+        return size >= self.min_size
+    
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a whole body, recording CPU time and bytes saved"""
+        started = time.perf_counter()
+        compressed = self.codecs[encoding][0](body)
+        self.record(encoding, len(body), len(compressed), time.perf_counter() - started)
+        return compressed
+    
+    def stream(self, encoding: str):
+        """Incremental compressor with ``chunk(data)`` (flushed, so each chunk is sent at once) and ``finish()``"""
+        return self.codecs[encoding][1]()
+    
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, seconds: float, responses: int = 1):
+        with self._lock:
+            stats = self._stats[encoding]
+            stats[0] += responses
+            stats[1] += bytes_in
+            stats[2] += bytes_out
+            stats[3] += seconds
+    
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-encoding compressed responses, bytes and CPU seconds"""
+        with self._lock:
+            return {
+                name: {
+                    'responses': int(responses),
+                    'bytes_in': int(bytes_in),
+                    'bytes_out': int(bytes_out),
+                    'ratio': bytes_out / bytes_in if bytes_in else None,
+                    'cpu_seconds': round(seconds, 6)
+                }
+                for name, (responses, bytes_in, bytes_out, seconds) in self._stats.items()
+            }
+    
+    def metric_families(self) -> List[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]:
+        """Compression counters for /metrics, read at scrape time"""
+        stats = self.get_stats()
+        return [
+            ('response_compression_bytes_in_total', 'counter', 'Response bytes before compression',
+             [({'encoding': name}, values['bytes_in']) for name, values in stats.items()]),
+            ('response_compression_bytes_out_total', 'counter', 'Response bytes after compression',
+             [({'encoding': name}, values['bytes_out']) for name, values in stats.items()]),
+            ('response_compression_seconds_total', 'counter', 'CPU time spent compressing responses',
+             [({'encoding': name}, values['cpu_seconds']) for name, values in stats.items()])
+        ]
+
+# Global response compressor instance
+response_compressor = ResponseCompressor()
+metrics.add_collector(response_compressor.metric_families)
@@ -1,33 +1,515 @@
 import sqlite3
 import json
 import os
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import re
+import base64
+import hashlib
+import time
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple, Callable, FrozenSet
 from contextlib import contextmanager
 from dotenv import load_dotenv
+from metrics import metrics
+from dedup import headline_features, minhash_bands, jaccard
 
 # Load environment variables
 load_dotenv()
 
+# Columns written by bulk export, in output order (full_content is appended on request)
+EXPORT_COLUMNS = ('id', 'title', 'url', 'publisher', 'published_date', 'summary', 'thumbnail',
+                  'language', 'category', 'created_at', 'updated_at')
+
+# Quoted phrases, or bare terms optionally ending in * for prefix matching
+_SEARCH_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def _parse_search_terms(search: str) -> List[Tuple[str, bool]]:
+    """Split user search text into ``(text, is_prefix)`` terms
+    
+    ``"rate cut"`` is kept together as a phrase, ``infla*`` is a prefix term and
+    every other word is a plain term. Quotes inside terms are dropped.
+    """
+    terms = []
+    for phrase, term in _SEARCH_TOKEN_RE.findall(search):
+        if phrase.strip():
+            terms.append((phrase.strip(), False))
+        elif term:
+            prefix = term.endswith('*')
+            term = term.rstrip('*').replace('"', '')
+            if term:
+                terms.append((term, prefix))
+    return terms
+
+
+def _build_fts_query(terms: List[Tuple[str, bool]]) -> str:
+    """Build a safe FTS5 MATCH expression ANDing the given terms
+    
+    Every term is quoted, so FTS5 operators typed by the user are treated as literal text.
+    """
+    return ' '.join('"' + text + '"' + ('*' if prefix else '') for text, prefix in terms)
+
+
+# Stays well below SQLite's bound-parameter limit for IN (...) lookups
+_SQL_VARIABLE_CHUNK = 500
+
+# Band-matched headlines compared exactly per new article when clustering
+_CLUSTER_MAX_CANDIDATES = 16
+# Newest members read from each band; templated headlines can put thousands of articles in one
+_CLUSTER_BAND_SCAN = 64
+
+_ARTICLE_CONTENT_FIELDS = ('title', 'publisher', 'published_date', 'summary', 'thumbnail',
+                           'language', 'category', 'full_content')
+
+# Facets kept in the article_facets rollup, with the SQL giving a row's value ({row} is NEW,
+# OLD or a table alias). published_hour is 'YYYY-MM-DD HH:00:00', or '' for an unparseable date
+_FACET_COLUMNS = (
+    ('publisher', "COALESCE({row}.publisher, '')"),
+    ('category', "COALESCE({row}.category, '')"),
+    ('language', "COALESCE({row}.language, '')"),
+    ('published_hour', "CASE WHEN {row}.published_date GLOB "
+                       "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]*' "
+                       "THEN substr({row}.published_date, 1, 13) || ':00:00' ELSE '' END")
+)
+# Rollup rows are bucketed by the hour of created_at, which the /articles date filters apply to
+_FACET_HOUR_SQL = "COALESCE(strftime('%Y-%m-%d %H:00:00', {row}.created_at), '')"
+_FACET_REPRESENTATIVE_SQL = "({row}.cluster_id IS NULL)"
+
+# article_facets as computed from scratch (seeding and reconcile_stats)
+_FACET_ROLLUP_SQL = ' UNION ALL '.join(
+    f"SELECT {_FACET_HOUR_SQL.format(row='a')}, {_FACET_REPRESENTATIVE_SQL.format(row='a')}, '{facet}', "
+    f"{expression.format(row='a')}, COUNT(*) FROM news_articles a GROUP BY 1, 2, 4"
+    for facet, expression in _FACET_COLUMNS
+)
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+def _facet_increment_sql(row: str) -> str:
+    """Trigger statement adding article ``row`` (NEW) to the rollup"""
+    hour = _FACET_HOUR_SQL.format(row=row)
+    representative = _FACET_REPRESENTATIVE_SQL.format(row=row)
+    values = ', '.join(f"({hour}, {representative}, '{facet}', {expression.format(row=row)}, 1)"
+                       for facet, expression in _FACET_COLUMNS)
+    return f'''
+        INSERT INTO article_facets (hour, representative, facet, value, articles) VALUES {values}
+        ON CONFLICT(hour, representative, facet, value) DO UPDATE SET articles = articles + 1;'''
+
+
+def _facet_decrement_sql(row: str) -> str:
+    """Trigger statements removing article ``row`` (OLD) from the rollup, dropping emptied rows"""
+    hour = _FACET_HOUR_SQL.format(row=row)
+    representative = _FACET_REPRESENTATIVE_SQL.format(row=row)
+    statements = [f'''
+        UPDATE article_facets SET articles = articles - 1
+        WHERE hour = {hour} AND representative = {representative}
+          AND facet = '{facet}' AND value = {expression.format(row=row)};''' for facet, expression in _FACET_COLUMNS]
+    statements.append(f'''
+        DELETE FROM article_facets WHERE hour = {hour} AND representative = {representative} AND articles <= 0;''')
+    return ''.join(statements)
+
+
+def _facet_plan(date_from: Optional[str],
+                date_to: Optional[str]) -> Optional[Tuple[Optional[str], Optional[str], List[str]]]:
+    """Split a created_at range into rollup hours and partially covered hours
+    
+    Returns ``(hour_from, hour_to, edges)``: the rollup serves hours from hour_from
+    (inclusive) to hour_to (exclusive), and each hour in ``edges`` must be counted
+    from news_articles. None when a bound is neither 'YYYY-MM-DD' nor
+    'YYYY-MM-DD HH:MM:SS', so hours cannot be told apart.
+    """
+    bounds = []
+    for bound in (date_from, date_to):
+        if bound is None or _DATE_RE.match(bound):
+            bounds.append(bound)
+            continue
+        try:
+            bounds.append(datetime.strptime(bound, '%Y-%m-%d %H:%M:%S'))
+        except ValueError:
+            return None
+    
+    hour_from = hour_to = None
+    edges = []
+    if isinstance(bounds[0], str):
+        hour_from = f'{bounds[0]} 00:00:00'
+    elif bounds[0] is not None:
+        floor = bounds[0].replace(minute=0, second=0)
+        if bounds[0] != floor:
+            edges.append(floor.strftime('%Y-%m-%d %H:%M:%S'))
+            floor += timedelta(hours=1)
+        hour_from = floor.strftime('%Y-%m-%d %H:%M:%S')
+    
+    # created_at <= 'YYYY-MM-DD' ends before that day starts
+    if isinstance(bounds[1], str):
+        hour_to = f'{bounds[1]} 00:00:00'
+    elif bounds[1] is not None:
+        floor = bounds[1].replace(minute=0, second=0)
+        if bounds[1] == floor.replace(minute=59, second=59):
+            floor += timedelta(hours=1)
+        elif floor.strftime('%Y-%m-%d %H:%M:%S') not in edges:
+            edges.append(floor.strftime('%Y-%m-%d %H:%M:%S'))
+        hour_to = floor.strftime('%Y-%m-%d %H:%M:%S')
+    return hour_from, hour_to, edges
+
+
+# Existing URLs keep id and created_at; the WHERE makes identical content a no-op
+_UPSERT_ARTICLE_SQL = '''
+    INSERT INTO news_articles 
+    (title, url, publisher, published_date, summary, thumbnail, language, category, full_content,
+     content_hash, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(url) DO UPDATE SET
+        title = excluded.title,
+        publisher = excluded.publisher,
+        published_date = excluded.published_date,
+        summary = excluded.summary,
+        thumbnail = excluded.thumbnail,
+        language = excluded.language,
+        category = excluded.category,
+        full_content = excluded.full_content,
+        content_hash = excluded.content_hash,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE news_articles.content_hash IS NOT excluded.content_hash
+'''
+
+
+def _article_values(article: Dict[str, Any]) -> Tuple:
+    """Row values for _UPSERT_ARTICLE_SQL, ending with the article's content hash"""
+    row = {
+        'title': article.get('title') or '',
+        'publisher': article.get('publisher') or '',
+        'published_date': article.get('published_date') or '',
+        'summary': article.get('summary') or '',
+        'thumbnail': article.get('thumbnail') or '',
+        'language': article.get('language') or os.getenv('NEWS_LANGUAGE', 'en-US'),
+        'category': article.get('category') or 'business',
+        'full_content': article.get('full_content') or ''
+    }
+    content_hash = hashlib.sha1(
+        '\x1f'.join(row[field] for field in _ARTICLE_CONTENT_FIELDS).encode('utf-8')
+    ).hexdigest()
+    return (row['title'], article.get('url') or '', row['publisher'], row['published_date'], row['summary'],
+            row['thumbnail'], row['language'], row['category'], row['full_content'], content_hash)
+
+
+_DB_DURATION = metrics.histogram('db_operation_duration_seconds', 'DatabaseManager method duration',
+                                 ['method'])
+_DB_ROWS = metrics.counter('db_rows_total', 'Rows returned or written by DatabaseManager methods', ['method'])
+_FACET_QUERIES = metrics.counter('db_facet_queries_total',
+                                 'get_facets calls by how they were served (rollup, rollup+scan or scan)', ['source'])
+_SNAPSHOT_READS = metrics.counter('db_read_snapshot_reads_total', 'Article reads by source (snapshot or disk)',
+                                  ['source'])
+_SNAPSHOT_REFRESH = metrics.histogram('db_read_snapshot_refresh_seconds',
+                                      'Time to copy the database into a new in-memory read snapshot')
+
+
+def _instrumented(rows: Optional[Callable[[Any], int]] = None):
+    """Record a DatabaseManager method's duration, and the rows it returned or wrote via ``rows``"""
+    def decorator(func):
+        method = func.__name__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            _DB_DURATION.observe(time.perf_counter() - started, method)
+            if rows is not None:
+                _DB_ROWS.inc(method, amount=rows(result))
+            return result
+        return wrapper
+    return decorator
+
+
+def encode_cursor(created_at: str, article_id: int) -> str:
+    """Encode a ``(created_at, id)`` keyset position as an opaque cursor"""
+    raw = json.dumps([created_at, article_id], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a cursor produced by encode_cursor, raising ValueError if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        created_at, article_id = json.loads(raw.decode('utf-8'))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(created_at, str) or not isinstance(article_id, int):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return created_at, article_id
+
+
+class ReadSnapshot:
+    """An in-memory copy of the database at one generation
+    
+    The copy lives in a named shared-cache memory database, kept alive by the
+    anchor connection; readers open their own connections to ``uri``.
+    """
+    
+    def __init__(self, uri: str, anchor: sqlite3.Connection, generation: int, size_bytes: int):
+        self.uri = uri
+        self.anchor = anchor
+        self.generation = generation
+        self.size_bytes = size_bytes
+        self.created_at = time.time()
+
+
 class DatabaseManager:
     def __init__(self):
         self.db_path = os.getenv('DATABASE_PATH', 'news.db')
         self.timeout = int(os.getenv('DATABASE_TIMEOUT', '30'))
         self.retention_days = int(os.getenv('DATA_RETENTION_DAYS', '3'))
+        self.api_log_retention_days = int(os.getenv('API_LOG_RETENTION_DAYS', '30'))
+        
+        # Cleanup deletes in short transactions, pausing between them so writers can interleave
+        self.cleanup_batch_size = int(os.getenv('CLEANUP_BATCH_SIZE', '1000'))
+        self.cleanup_batch_pause = float(os.getenv('CLEANUP_BATCH_PAUSE_MS', '50')) / 1000
+        
+        # Space reclamation: NONE, FULL or INCREMENTAL (freed pages returned during cleanup)
+        self.auto_vacuum = os.getenv('DATABASE_AUTO_VACUUM', 'INCREMENTAL').upper()
+        self.vacuum_step_pages = int(os.getenv('VACUUM_STEP_PAGES', '1024'))
+        
+        # Connection tuning
+        self.journal_mode = os.getenv('DATABASE_JOURNAL_MODE', 'WAL')
+        self.synchronous = os.getenv('DATABASE_SYNCHRONOUS', 'NORMAL')
+        self.mmap_size = int(os.getenv('DATABASE_MMAP_SIZE', '268435456'))
+        self.cache_size = int(os.getenv('DATABASE_CACHE_SIZE', '-16000'))
+        self.cached_statements = int(os.getenv('DATABASE_CACHED_STATEMENTS', '256'))
+        
+        # Full-text search; disabled automatically when SQLite lacks FTS5
+        self.fts_enabled = os.getenv('DATABASE_FTS', 'True').lower() == 'true'
+        
+        # Near-duplicate clustering of new articles against headlines from the last window
+        self.clustering_enabled = os.getenv('CLUSTERING_ENABLED', 'True').lower() == 'true'
+        self.cluster_window_hours = float(os.getenv('CLUSTER_WINDOW_HOURS', '48'))
+        self.cluster_similarity = float(os.getenv('CLUSTER_SIMILARITY', '0.7'))
+        
+        # Short-lived cache of filtered COUNT(*) results, keyed by the filter
+        self.count_cache_ttl = float(os.getenv('COUNT_CACHE_TTL', '30'))
+        self.count_cache_size = int(os.getenv('COUNT_CACHE_SIZE', '1024'))
+        self._count_cache: Dict[Tuple, Tuple[float, int]] = {}
+        self._count_cache_lock = threading.Lock()
+        
+        # Data generation, bumped by every write to news_articles so readers (and other
+        # processes) can tell when cached results went stale
+        self.generation_check_interval = float(os.getenv('GENERATION_CHECK_INTERVAL', '1'))
+        self._generation = 0
+        self._last_modified = 0
+        self._generation_checked_at = 0.0
+        
+        # In-memory copy of the database for get_articles/get_article_by_id, rebuilt in the
+        # background after writes and swapped in once complete
+        self.read_snapshot = os.getenv('READ_SNAPSHOT', 'False').lower() == 'true'
+        self._snapshot: Optional[ReadSnapshot] = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_wanted = threading.Event()
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._snapshot_sequence = 0
+        self._snapshot_connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        
+        # Long-lived connections, one per thread (sqlite3 connections must not be shared across threads)
+        self._local = threading.local()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        
         self.init_database()
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection and apply the configured pragmas"""
+        # check_same_thread is off only so that stale connections can be closed from another thread;
+        # each connection is otherwise used exclusively by the thread that opened it
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, cached_statements=self.cached_statements,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Must precede journal_mode, which writes the header of a new database; a no-op for
+        # existing files, which reclaim_space() converts
+        conn.execute(f'PRAGMA auto_vacuum={self.auto_vacuum}')
+        conn.execute(f'PRAGMA journal_mode={self.journal_mode}')
+        conn.execute(f'PRAGMA synchronous={self.synchronous}')
+        conn.execute(f'PRAGMA mmap_size={self.mmap_size}')
+        conn.execute(f'PRAGMA cache_size={self.cache_size}')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        # INSERT OR REPLACE only fires delete triggers (which keep the FTS index in sync) with this on
+        conn.execute('PRAGMA recursive_triggers=ON')
+        return conn
+    
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Return the calling thread's pooled connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        # A connection inherited through fork() must not be reused by the child
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        
+        conn = self._open_connection()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        
+        with self._connections_lock:
+            # Drop connections owned by threads that have exited
+            for thread in [t for t in self._connections if not t.is_alive()]:
+                self._connections.pop(thread).close()
+            self._connections[threading.current_thread()] = conn
+        return conn
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path, timeout=self.timeout)
-        conn.row_factory = sqlite3.Row
+        """Context manager for pooled per-thread database connections"""
+        conn = self._thread_connection()
         try:
             yield conn
         except Exception as e:
             conn.rollback()
             raise e
         finally:
+            # Never leave an open transaction on a pooled connection
+            if conn.in_transaction:
+                conn.rollback()
+    
+    def close_all_connections(self):
+        """Close every pooled connection (used on shutdown)"""
+        with self._connections_lock:
+            for conn in list(self._connections.values()) + list(self._snapshot_connections.values()):
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+            self._snapshot_connections.clear()
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                self._snapshot.anchor.close()
+                self._snapshot = None
+        self._local = threading.local()
+    
+    @contextmanager
+    def read_connection(self):
+        """Connection for article reads: the in-memory snapshot when it is current, else get_connection()
+        
+        A snapshot older than the current generation is never read, so responses
+        cached under a generation hold that generation's data; its replacement is
+        requested and reads go to disk until it is swapped in.
+        """
+        conn = self._snapshot_connection() if self.read_snapshot else None
+        if conn is None:
+            with self.get_connection() as conn:
+                yield conn
+            return
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+    
+    def _snapshot_connection(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's connection to the current snapshot, or None to read from disk"""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.generation < self.get_generation():
+            self.request_snapshot_refresh()
+            _SNAPSHOT_READS.inc('disk')
+            return None
+        
+        conn = getattr(self._local, 'snapshot_conn', None)
+        if conn is not None and self._local.snapshot_uri == snapshot.uri and self._local.snapshot_pid == os.getpid():
+            _SNAPSHOT_READS.inc('snapshot')
+            return conn
+        
+        with self._snapshot_lock:
+            # Connecting to a URI whose anchor was closed would create an empty database,
+            # so connect under the lock that guards the swap
+            snapshot = self._snapshot
+            if snapshot is None:
+                _SNAPSHOT_READS.inc('disk')
+                return None
+            new_conn = sqlite3.connect(snapshot.uri, uri=True, cached_statements=self.cached_statements,
+                                       check_same_thread=False)
+        new_conn.row_factory = sqlite3.Row
+        new_conn.execute('PRAGMA query_only=ON')
+        
+        # Dropping the previous connection releases the old snapshot once every thread has moved on
+        if conn is not None and self._local.snapshot_pid == os.getpid():
             conn.close()
+        self._local.snapshot_conn = new_conn
+        self._local.snapshot_uri = snapshot.uri
+        self._local.snapshot_pid = os.getpid()
+        with self._connections_lock:
+            for thread in [t for t in self._snapshot_connections if not t.is_alive()]:
+                self._snapshot_connections.pop(thread).close()
+            self._snapshot_connections[threading.current_thread()] = new_conn
+        _SNAPSHOT_READS.inc('snapshot')
+        return new_conn
+    
+    def request_snapshot_refresh(self):
+        """Ask the background refresher to rebuild the read snapshot (coalesced; no-op when disabled)"""
+        if not self.read_snapshot:
+            return
+        self._snapshot_wanted.set()
+        thread = self._snapshot_thread
+        if thread is None or not thread.is_alive():
+            with self._snapshot_lock:
+                # Threads do not survive fork(), so a child process starts its own
+                if self._snapshot_thread is None or not self._snapshot_thread.is_alive():
+                    self._snapshot_thread = threading.Thread(target=self._snapshot_refresher,
+                                                             name='db-snapshot', daemon=True)
+                    self._snapshot_thread.start()
+    
+    def _snapshot_refresher(self):
+        """Rebuild the snapshot whenever one is requested; requests made during a build trigger one more"""
+        while True:
+            self._snapshot_wanted.wait()
+            self._snapshot_wanted.clear()
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.generation >= self.get_generation():
+                continue
+            try:
+                self.refresh_snapshot()
+            except sqlite3.Error as e:
+                print(f"Database error refreshing read snapshot: {e}")
+                time.sleep(self.generation_check_interval)
+    
+    def refresh_snapshot(self) -> ReadSnapshot:
+        """Copy the database into a new in-memory snapshot and swap it in
+        
+        The online backup API copies a consistent view under one read transaction,
+        which in WAL mode does not block writers. Readers keep using the previous
+        snapshot (or disk) until the swap.
+        """
+        started = time.perf_counter()
+        self._snapshot_sequence += 1
+        uri = f'file:news_snapshot_{os.getpid()}_{id(self)}_{self._snapshot_sequence}?mode=memory&cache=shared'
+        anchor = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        try:
+            with self.get_connection() as conn:
+                conn.backup(anchor)
+            # The copy carries its own counters, so its generation matches its data exactly
+            generation = anchor.execute(
+                "SELECT value FROM table_counters WHERE name = 'generation'").fetchone()[0]
+            size_bytes = (anchor.execute('PRAGMA page_count').fetchone()[0]
+                          * anchor.execute('PRAGMA page_size').fetchone()[0])
+        except sqlite3.Error:
+            anchor.close()
+            raise
+        
+        snapshot = ReadSnapshot(uri, anchor, generation, size_bytes)
+        with self._snapshot_lock:
+            previous, self._snapshot = self._snapshot, snapshot
+        if previous is not None:
+            # Reader connections still on it keep the memory alive until they switch
+            previous.anchor.close()
+        _SNAPSHOT_REFRESH.observe(time.perf_counter() - started)
+        return snapshot
+    
+    def get_snapshot_stats(self) -> Dict[str, Any]:
+        """State of the in-memory read snapshot"""
+        snapshot = self._snapshot
+        return {
+            'enabled': self.read_snapshot,
+            'generation': snapshot.generation if snapshot else None,
+            'size_bytes': snapshot.size_bytes if snapshot else 0,
+            'age_seconds': round(time.time() - snapshot.created_at, 3) if snapshot else None,
+            'current': snapshot is not None and snapshot.generation >= self.get_generation()
+        }
     
     def init_database(self):
         """Initialize database and create tables"""
@@ -45,11 +527,30 @@ class DatabaseManager:
                     language TEXT,
                     category TEXT DEFAULT 'business',
                     full_content TEXT,
+                    content_hash TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
             
+            # Databases created before change detection or clustering lack these columns
+            cursor.execute('PRAGMA table_info(news_articles)')
+            columns = [row['name'] for row in cursor.fetchall()]
+            if 'content_hash' not in columns:
+                cursor.execute('ALTER TABLE news_articles ADD COLUMN content_hash TEXT')
+            if 'cluster_id' not in columns:
+                # NULL marks a story's representative; duplicates hold the representative's id
+                cursor.execute('ALTER TABLE news_articles ADD COLUMN cluster_id INTEGER')
+            
+            # MinHash LSH band keys of recent headlines (see dedup.py), pruned to the cluster window
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS article_bands (
+                    band INTEGER NOT NULL,
+                    article_id INTEGER NOT NULL,
+                    PRIMARY KEY (band, article_id)
+                ) WITHOUT ROWID
+            ''')
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS api_logs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -57,119 +558,508 @@ class DatabaseManager:
                     response_code INTEGER,
                     response_time REAL,
                     articles_fetched INTEGER,
+                    outcome TEXT DEFAULT 'fetched',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
             
+            # fetched, not_modified (304) or skipped (no request sent); skipped rows don't count as API calls
+            cursor.execute('PRAGMA table_info(api_logs)')
+            if 'outcome' not in [row['name'] for row in cursor.fetchall()]:
+                cursor.execute("ALTER TABLE api_logs ADD COLUMN outcome TEXT DEFAULT 'fetched'")
+                # Recreated below with the skipped-row exclusion
+                cursor.execute('DROP TRIGGER IF EXISTS api_logs_stats_ai')
+                cursor.execute('DROP TRIGGER IF EXISTS api_logs_stats_ad')
+            
+            # Adaptive polling state per feed (endpoint?lr=language), kept across restarts and leaders
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS feed_state (
+                    feed TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    interval_seconds REAL NOT NULL,
+                    yield_ratio REAL,
+                    next_fetch_at REAL NOT NULL,
+                    checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Status published by the process that currently leads the scheduler
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scheduler_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    leader TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    heartbeat_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Summaries of recent fetch jobs, so any worker can answer GET /admin/fetch/{job_id}
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS fetch_jobs (
+                    id TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
             # Create indexes for better performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_created_at ON news_articles(created_at)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_published_date ON news_articles(published_date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_url ON news_articles(url)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_category ON news_articles(category)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_api_logs_created_at ON api_logs(created_at)')
+            # Duplicates only: representatives (cluster_id NULL) are most rows and never looked up by cluster
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_cluster_members ON news_articles(cluster_id) WHERE cluster_id IS NOT NULL')
+            # Serves collapse=true: one row per story, in date order, without touching duplicates
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cluster_representatives
+                ON news_articles(created_at) WHERE cluster_id IS NULL
+            ''')
+            
+            # Row counters maintained by triggers so unfiltered totals never need COUNT(*)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS table_counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS news_articles_count_ai AFTER INSERT ON news_articles BEGIN
+                    UPDATE table_counters SET value = value + 1 WHERE name = 'news_articles';
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS news_articles_count_ad AFTER DELETE ON news_articles BEGIN
+                    UPDATE table_counters SET value = value - 1 WHERE name = 'news_articles';
+                END
+            ''')
+            cursor.execute('''
+                INSERT OR IGNORE INTO table_counters (name, value)
+                SELECT 'news_articles', COUNT(*) FROM news_articles
+            ''')
+            cursor.execute("INSERT OR IGNORE INTO table_counters (name, value) VALUES ('generation', 0)")
+            cursor.execute('''
+                INSERT OR IGNORE INTO table_counters (name, value)
+                SELECT 'last_modified', COALESCE(CAST(strftime('%s', MAX(updated_at)) AS INTEGER), 0)
+                FROM news_articles
+            ''')
+            # Unix time of the last successful fetch; unlike last_modified, cleanup never moves it
+            cursor.execute('''
+                INSERT OR IGNORE INTO table_counters (name, value)
+                SELECT 'last_ingest', COALESCE(CAST(strftime('%s', MAX(created_at)) AS INTEGER), 0)
+                FROM news_articles
+            ''')
+            
+            self._init_stats(cursor)
+            self._init_facets(cursor)
             
             conn.commit()
+        
+        if self.fts_enabled:
+            self.fts_enabled = self._init_fts()
     
-    def insert_article(self, article_data: Dict[str, Any]) -> bool:
-        """Insert a new article into the database"""
+    def _init_stats(self, cursor: sqlite3.Cursor):
+        """Create the trigger-maintained values behind get_database_stats()
+        
+        The newest and oldest article creation times are kept in table_counters as Unix
+        times. Inserts only compare against them; a delete re-reads MIN/MAX through
+        idx_created_at only when it removes the current boundary row. API calls are
+        counted per minute so the rolling 24h total sums at most 1440 rows.
+        """
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS api_call_counts (
+                minute INTEGER PRIMARY KEY,
+                calls INTEGER NOT NULL
+            )
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_articles_stats_ai AFTER INSERT ON news_articles BEGIN
+                UPDATE table_counters SET value = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+                WHERE (name = 'articles_newest' AND value < CAST(strftime('%s', NEW.created_at) AS INTEGER))
+                   OR (name = 'articles_oldest' AND (value = 0 OR value > CAST(strftime('%s', NEW.created_at) AS INTEGER)));
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS news_articles_stats_ad AFTER DELETE ON news_articles BEGIN
+                UPDATE table_counters
+                SET value = COALESCE((SELECT CAST(strftime('%s', MAX(created_at)) AS INTEGER) FROM news_articles), 0)
+                WHERE name = 'articles_newest' AND value <= CAST(strftime('%s', OLD.created_at) AS INTEGER);
+                UPDATE table_counters
+                SET value = COALESCE((SELECT CAST(strftime('%s', MIN(created_at)) AS INTEGER) FROM news_articles), 0)
+                WHERE name = 'articles_oldest' AND value >= CAST(strftime('%s', OLD.created_at) AS INTEGER);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS api_logs_stats_ai AFTER INSERT ON api_logs
+            WHEN NEW.outcome IS NOT 'skipped' BEGIN
+                INSERT INTO api_call_counts (minute, calls)
+                VALUES (CAST(strftime('%s', NEW.created_at) AS INTEGER) / 60, 1)
+                ON CONFLICT(minute) DO UPDATE SET calls = calls + 1;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS api_logs_stats_ad AFTER DELETE ON api_logs
+            WHEN OLD.outcome IS NOT 'skipped' BEGIN
+                UPDATE api_call_counts SET calls = calls - 1
+                WHERE minute = CAST(strftime('%s', OLD.created_at) AS INTEGER) / 60;
+            END
+        ''')
+        
+        # Seed databases created before these triggers existed
+        cursor.execute('''
+            INSERT OR IGNORE INTO table_counters (name, value)
+            SELECT 'articles_newest', COALESCE(CAST(strftime('%s', MAX(created_at)) AS INTEGER), 0)
+            FROM news_articles
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO table_counters (name, value)
+            SELECT 'articles_oldest', COALESCE(CAST(strftime('%s', MIN(created_at)) AS INTEGER), 0)
+            FROM news_articles
+        ''')
+        cursor.execute('''
+            INSERT OR IGNORE INTO api_call_counts (minute, calls)
+            SELECT CAST(strftime('%s', created_at) AS INTEGER) / 60, COUNT(*)
+            FROM api_logs WHERE created_at > datetime('now', '-1 day') AND outcome IS NOT 'skipped'
+            GROUP BY 1
+        ''')
+    
+    def _init_facets(self, cursor: sqlite3.Cursor):
+        """Create the article_facets rollup behind get_facets() and the triggers that maintain it
+        
+        One row per created_at hour, representative flag, facet and value holds the
+        number of such articles. Inserts, deletes (cleanup included) and updates that
+        move an article to another value or cluster adjust the rows concerned; rows
+        that reach zero are removed.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_facets'")
+        exists = cursor.fetchone() is not None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS article_facets (
+                hour TEXT NOT NULL,
+                representative INTEGER NOT NULL,
+                facet TEXT NOT NULL,
+                value TEXT NOT NULL,
+                articles INTEGER NOT NULL,
+                PRIMARY KEY (hour, representative, facet, value)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS news_articles_facets_ai AFTER INSERT ON news_articles BEGIN
+                {_facet_increment_sql('NEW')}
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS news_articles_facets_ad AFTER DELETE ON news_articles BEGIN
+                {_facet_decrement_sql('OLD')}
+            END
+        ''')
+        dimensions = [_FACET_HOUR_SQL, _FACET_REPRESENTATIVE_SQL] + [expression for _, expression in _FACET_COLUMNS]
+        changed = ' OR '.join(f"{sql.format(row='OLD')} IS NOT {sql.format(row='NEW')}" for sql in dimensions)
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS news_articles_facets_au
+            AFTER UPDATE OF publisher, category, language, published_date, cluster_id, created_at ON news_articles
+            WHEN {changed} BEGIN
+                {_facet_decrement_sql('OLD')}
+                {_facet_increment_sql('NEW')}
+            END
+        ''')
+        
+        # Seed databases created before the rollup existed
+        if not exists:
+            cursor.execute(f'INSERT INTO article_facets (hour, representative, facet, value, articles) {_FACET_ROLLUP_SQL}')
+    
+    def _init_fts(self) -> bool:
+        """Create the FTS5 index over title/summary and the triggers that keep it in sync"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_articles_fts'")
+                exists = cursor.fetchone() is not None
+                
                 cursor.execute('''
-                    INSERT OR REPLACE INTO news_articles 
-                    (title, url, publisher, published_date, summary, thumbnail, language, category, full_content, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (
-                    article_data.get('title', ''),
-                    article_data.get('url', ''),
-                    article_data.get('publisher', ''),
-                    article_data.get('published_date', ''),
-                    article_data.get('summary', ''),
-                    article_data.get('thumbnail', ''),
-                    article_data.get('language', os.getenv('NEWS_LANGUAGE', 'en-US')),
-                    article_data.get('category', 'business'),
-                    article_data.get('full_content', '')
-                ))
+                    CREATE VIRTUAL TABLE IF NOT EXISTS news_articles_fts USING fts5(
+                        title, summary, content='news_articles', content_rowid='id'
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS news_articles_fts_ai AFTER INSERT ON news_articles BEGIN
+                        INSERT INTO news_articles_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS news_articles_fts_ad AFTER DELETE ON news_articles BEGIN
+                        INSERT INTO news_articles_fts(news_articles_fts, rowid, title, summary)
+                        VALUES ('delete', old.id, old.title, old.summary);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS news_articles_fts_au AFTER UPDATE OF title, summary ON news_articles BEGIN
+                        INSERT INTO news_articles_fts(news_articles_fts, rowid, title, summary)
+                        VALUES ('delete', old.id, old.title, old.summary);
+                        INSERT INTO news_articles_fts(rowid, title, summary) VALUES (new.id, new.title, new.summary);
+                    END
+                ''')
+                
+                # Index rows that existed before the FTS table was introduced
+                if not exists:
+                    cursor.execute("INSERT INTO news_articles_fts(news_articles_fts) VALUES ('rebuild')")
+                
                 conn.commit()
                 return True
+        except sqlite3.OperationalError as e:
+            print(f"FTS5 unavailable, falling back to LIKE search: {e}")
+            return False
+    
+    @_instrumented()
+    def insert_article(self, article_data: Dict[str, Any]) -> bool:
+        """Insert a new article, or update the existing row for its URL if the content changed"""
+        values = _article_values(article_data)
+        try:
+            with self.get_connection() as conn:
+                if self.clustering_enabled:
+                    # Take the write lock before the lookup, so no other writer can add the URL after it
+                    conn.execute('BEGIN IMMEDIATE')
+                if self.clustering_enabled and not conn.execute(
+                        'SELECT 1 FROM news_articles WHERE url = ?', (values[1],)).fetchone():
+                    self._insert_clustered(conn, [values])
+                    rowcount = 1
+                else:
+                    rowcount = conn.execute(_UPSERT_ARTICLE_SQL, values).rowcount
+                if rowcount:
+                    self._bump_generation(conn)
+                conn.commit()
+                self.clear_count_cache()
+            if rowcount:
+                self.request_snapshot_refresh()
+            return True
         except sqlite3.Error as e:
             print(f"Database error inserting article: {e}")
             return False
     
-    def bulk_insert_articles(self, articles: List[Dict[str, Any]]) -> int:
-        """Insert multiple articles in a single transaction"""
-        inserted_count = 0
+    @_instrumented(rows=lambda counts: counts['inserted'] + counts['updated'])
+    def bulk_insert_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Upsert multiple articles in a single transaction
+        
+        Existing URLs keep their ``id`` and ``created_at``; rows whose content hash
+        is unchanged are skipped without a write. Returns ``inserted``, ``updated``
+        and ``unchanged`` counts. If the transaction fails nothing is stored and the
+        zero counts carry the message under ``error``.
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        
+        # Last occurrence wins when a batch repeats a URL
+        rows_by_url = {}
+        for article in articles:
+            values = _article_values(article)
+            if values[1]:
+                rows_by_url[values[1]] = values
+        if not rows_by_url:
+            return counts
+        
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                for article in articles:
-                    try:
-                        cursor.execute('''
-                            INSERT OR REPLACE INTO news_articles 
-                            (title, url, publisher, published_date, summary, thumbnail, language, category, full_content, updated_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                        ''', (
-                            article.get('title', ''),
-                            article.get('url', ''),
-                            article.get('publisher', ''),
-                            article.get('published_date', ''),
-                            article.get('summary', ''),
-                            article.get('thumbnail', ''),
-                            article.get('language', os.getenv('NEWS_LANGUAGE', 'en-US')),
-                            article.get('category', 'business'),
-                            article.get('full_content', '')
-                        ))
-                        inserted_count += 1
-                    except sqlite3.Error as e:
-                        print(f"Error inserting article {article.get('url', 'unknown')}: {e}")
+                if self.clustering_enabled:
+                    # New URLs are clustered as inserts, so the lookup must see every committed row
+                    # until this transaction commits: take the write lock first
+                    conn.execute('BEGIN IMMEDIATE')
+                existing = {}
+                urls = list(rows_by_url)
+                for start in range(0, len(urls), _SQL_VARIABLE_CHUNK):
+                    chunk = urls[start:start + _SQL_VARIABLE_CHUNK]
+                    placeholders = ','.join('?' * len(chunk))
+                    existing.update(conn.execute(
+                        f'SELECT url, content_hash FROM news_articles WHERE url IN ({placeholders})', chunk
+                    ).fetchall())
+                
+                changed = []
+                for url, values in rows_by_url.items():
+                    if url not in existing:
+                        counts['inserted'] += 1
+                    elif existing[url] != values[-1]:
+                        counts['updated'] += 1
+                    else:
+                        counts['unchanged'] += 1
                         continue
-                conn.commit()
+                    changed.append(values)
+                
+                if changed:
+                    if self.clustering_enabled and counts['inserted']:
+                        # Edited articles keep their cluster; new ones are matched one by one so
+                        # duplicates within the batch find each other
+                        conn.executemany(_UPSERT_ARTICLE_SQL, [values for values in changed if values[1] in existing])
+                        self._insert_clustered(conn, [values for values in changed if values[1] not in existing])
+                    else:
+                        conn.executemany(_UPSERT_ARTICLE_SQL, changed)
+                    self._bump_generation(conn)
+                    conn.commit()
+                    self.clear_count_cache()
+            if counts['inserted'] or counts['updated']:
+                self.request_snapshot_refresh()
         except sqlite3.Error as e:
             print(f"Database error in bulk insert: {e}")
-        return inserted_count
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0, 'error': str(e)}
+        return counts
+    
+    def _insert_clustered(self, conn: sqlite3.Connection, rows: List[Tuple]):
+        """Insert new articles, assigning each to the cluster of its most similar recent headline
+        
+        Candidates come from exact MinHash band matches in article_bands, limited to
+        articles created within cluster_window_hours and to the newest
+        _CLUSTER_BAND_SCAN members of each band, and join only if their headline's
+        Jaccard similarity reaches cluster_similarity. An article without a match
+        represents a new cluster (cluster_id NULL). Runs in the caller's transaction,
+        which must already hold the write lock (BEGIN IMMEDIATE) from before it
+        checked that the URLs are new: it reads before it writes, and in WAL mode a
+        deferred transaction whose snapshot another commit overtook fails with
+        "database is locked" instead of waiting.
+        """
+        # Band rows below the window are left for cleanup_old_articles to prune
+        window_start_id = self._cluster_window_start(conn)
+        
+        # Headline features of candidates already seen in this call
+        features_by_id: Dict[int, FrozenSet[str]] = {}
+        for values in rows:
+            features = headline_features(values[0])
+            keys = minhash_bands(features)
+            cluster_id = None
+            if keys:
+                # Each band is a bounded backwards range scan of its (band, article_id) key
+                band_scans = ' UNION ALL '.join(['''
+                    SELECT article_id FROM (
+                        SELECT article_id FROM article_bands
+                        WHERE band = ? AND article_id >= ?
+                        ORDER BY article_id DESC LIMIT ?
+                    )'''] * len(keys))
+                params = [value for key in keys for value in (key, window_start_id, _CLUSTER_BAND_SCAN)]
+                best = self.cluster_similarity
+                # Likely duplicates share the most bands; only those are compared exactly
+                for candidate in conn.execute(f'''
+                    SELECT a.id, a.title, a.cluster_id
+                    FROM (
+                        SELECT article_id, COUNT(*) AS shared FROM ({band_scans})
+                        GROUP BY article_id
+                        ORDER BY shared DESC, article_id DESC
+                        LIMIT ?
+                    ) m JOIN news_articles a ON a.id = m.article_id
+                ''', params + [_CLUSTER_MAX_CANDIDATES]).fetchall():
+                    candidate_features = features_by_id.get(candidate['id'])
+                    if candidate_features is None:
+                        candidate_features = features_by_id[candidate['id']] = headline_features(candidate['title'])
+                    similarity = jaccard(features, candidate_features)
+                    if similarity >= best:
+                        best = similarity
+                        cluster_id = candidate['cluster_id'] or candidate['id']
+            
+            # RETURNING names the row actually written; lastrowid is stale after an upsert's UPDATE
+            row = conn.execute(_UPSERT_ARTICLE_SQL + ' RETURNING id', values).fetchone()
+            if row is None:
+                # Already stored with identical content: nothing written
+                continue
+            article_id = row[0]
+            if cluster_id is not None:
+                conn.execute('UPDATE news_articles SET cluster_id = ? WHERE id = ?', (cluster_id, article_id))
+            if keys:
+                features_by_id[article_id] = features
+                conn.executemany('INSERT OR IGNORE INTO article_bands (band, article_id) VALUES (?, ?)',
+                                 [(key, article_id) for key in keys])
+    
+    def _cluster_window_start(self, conn: sqlite3.Connection) -> int:
+        """Lowest article id created within cluster_window_hours (ids follow insertion time)"""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=self.cluster_window_hours)
+        cutoff_str = cutoff.strftime('%Y-%m-%d %H:%M:%S')
+        row = conn.execute('SELECT MIN(id) FROM news_articles WHERE created_at >= ?', (cutoff_str,)).fetchone()
+        if row[0] is not None:
+            return row[0]
+        return conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM news_articles").fetchone()[0]
+    
+    def _prune_bands(self) -> int:
+        """Delete the band rows of articles that left the cluster window
+        
+        article_bands is keyed by band, so this scans the table; it runs once per
+        cleanup rather than on every insert.
+        """
+        with self.get_connection() as conn:
+            deleted = conn.execute('DELETE FROM article_bands WHERE article_id < ?',
+                                   (self._cluster_window_start(conn),)).rowcount
+            conn.commit()
+        return deleted
     
+    def _repair_clusters(self, conn: sqlite3.Connection) -> int:
+        """Promote the oldest remaining member of every cluster whose representative was deleted"""
+        orphaned = conn.execute('''
+            SELECT cluster_id, MIN(id) FROM news_articles
+            WHERE cluster_id IS NOT NULL AND cluster_id NOT IN (SELECT id FROM news_articles)
+            GROUP BY cluster_id
+        ''').fetchall()
+        for old_id, new_id in orphaned:
+            conn.execute('UPDATE news_articles SET cluster_id = ? WHERE cluster_id = ?', (new_id, old_id))
+            conn.execute('UPDATE news_articles SET cluster_id = NULL WHERE id = ?', (new_id,))
+        return len(orphaned)
+    
+    @_instrumented(rows=lambda result: len(result['articles']))
     def get_articles(self, page: int = 1, limit: int = 20, search: Optional[str] = None, 
-                    date_from: Optional[str] = None, date_to: Optional[str] = None) -> Dict[str, Any]:
-        """Get articles with pagination and optional filtering"""
-        offset = (page - 1) * limit
+                    date_from: Optional[str] = None, date_to: Optional[str] = None,
+                    sort: str = 'date', cursor: Optional[str] = None,
+                    include_total: bool = True, collapse: bool = False) -> Dict[str, Any]:
+        """Get articles with pagination and optional filtering
         
-        # Build WHERE clause
-        where_conditions = []
-        params = []
+        ``sort`` is ``'date'`` (newest first) or ``'relevance'`` (BM25 rank, only
+        meaningful together with ``search`` and an FTS5 index).
         
-        if search:
-            where_conditions.append("(title LIKE ? OR summary LIKE ?)")
-            params.extend([f"%{search}%", f"%{search}%"])
+        Date-sorted results carry a ``next_cursor``; passing it back as ``cursor``
+        seeks straight to the following page via ``(created_at, id)`` instead of
+        OFFSET, so deep pages stay cheap and rows do not shift when new articles
+        arrive. Raises ValueError for a malformed cursor or a cursor combined with
+        relevance sort.
         
-        if date_from:
-            where_conditions.append("created_at >= ?")
-            params.append(date_from)
+        With ``include_total=False`` no count is taken; ``total_count`` and
+        ``total_pages`` are None and callers rely on ``has_more``.
         
-        if date_to:
-            where_conditions.append("created_at <= ?")
-            params.append(date_to)
+        ``collapse=True`` returns only cluster representatives, one row per story.
+        """
+        offset = (page - 1) * limit
+        
+        join_clause, where_conditions, params = self._article_filters(search, date_from, date_to, collapse)
+        order_by = 'a.created_at DESC, a.id DESC'
+        if join_clause and sort == 'relevance':
+            order_by = 'news_articles_fts.rank, a.created_at DESC, a.id DESC'
+        
+        # Keyset condition is applied to the page query only; totals cover the whole filtered set.
+        # idx_created_at implicitly ends in the rowid (id), so it serves the (created_at, id) seek
+        page_conditions = list(where_conditions)
+        page_params = list(params)
+        if cursor:
+            if sort == 'relevance' and join_clause:
+                raise ValueError("Cursor pagination is only supported for date sort")
+            page_conditions.append("(a.created_at, a.id) < (?, ?)")
+            page_params.extend(decode_cursor(cursor))
+            offset = 0
         
         where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        page_where_clause = " AND ".join(page_conditions) if page_conditions else "1=1"
         
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+            with self.read_connection() as conn:
+                total_count = None
+                if include_total:
+                    total_count = self._count_articles(conn, join_clause, where_clause, params)
                 
-                # Get total count
-                cursor.execute(f"SELECT COUNT(*) FROM news_articles WHERE {where_clause}", params)
-                total_count = cursor.fetchone()[0]
-                
-                # Get articles
-                cursor.execute(f'''
-                    SELECT id, title, url, publisher, published_date, summary, thumbnail, 
-                           language, category, created_at, updated_at
-                    FROM news_articles 
-                    WHERE {where_clause}
-                    ORDER BY created_at DESC 
+                # Get articles, fetching one extra row to learn whether another page follows
+                rows = conn.execute(f'''
+                    SELECT a.id, a.title, a.url, a.publisher, a.published_date, a.summary, a.thumbnail, 
+                           a.language, a.category, a.created_at, a.updated_at,
+                           COALESCE(a.cluster_id, a.id) AS cluster_id
+                    FROM news_articles a {join_clause}
+                    WHERE {page_where_clause}
+                    ORDER BY {order_by} 
                     LIMIT ? OFFSET ?
-                ''', params + [limit, offset])
+                ''', page_params + [limit + 1, offset]).fetchall()
+                has_more = len(rows) > limit
                 
                 articles = []
-                for row in cursor.fetchall():
+                for row in rows[:limit]:
                     articles.append({
                         'id': row['id'],
                         'title': row['title'],
@@ -181,28 +1071,327 @@ class DatabaseManager:
                         'language': row['language'],
                         'category': row['category'],
                         'created_at': row['created_at'],
-                        'updated_at': row['updated_at']
+                        'updated_at': row['updated_at'],
+                        'cluster_id': row['cluster_id']
                     })
                 
+                next_cursor = None
+                if has_more and order_by.startswith('a.created_at'):
+                    last = articles[-1]
+                    next_cursor = encode_cursor(last['created_at'], last['id'])
+                
                 return {
                     'articles': articles,
                     'total_count': total_count,
                     'page': page,
                     'limit': limit,
-                    'total_pages': (total_count + limit - 1) // limit
+                    'total_pages': (total_count + limit - 1) // limit if total_count is not None else None,
+                    'has_more': has_more,
+                    'next_cursor': next_cursor
                 }
         except sqlite3.Error as e:
             print(f"Database error getting articles: {e}")
-            return {'articles': [], 'total_count': 0, 'page': page, 'limit': limit, 'total_pages': 0}
+            return {'articles': [], 'total_count': 0, 'page': page, 'limit': limit, 'total_pages': 0,
+                    'has_more': False, 'next_cursor': None}
+    
+    def _article_filters(self, search: Optional[str], date_from: Optional[str],
+                         date_to: Optional[str], collapse: bool = False) -> Tuple[str, List[str], List[Any]]:
+        """JOIN clause, WHERE conditions and parameters for the /articles filters"""
+        where_conditions = []
+        params = []
+        join_clause = ''
+        
+        terms = _parse_search_terms(search) if search else []
+        if terms and self.fts_enabled:
+            join_clause = 'JOIN news_articles_fts ON news_articles_fts.rowid = a.id'
+            where_conditions.append("news_articles_fts MATCH ?")
+            params.append(_build_fts_query(terms))
+        else:
+            # Substring fallback: phrases and prefixes degrade to plain LIKE matches
+            for text, _ in terms:
+                where_conditions.append("(a.title LIKE ? OR a.summary LIKE ?)")
+                params.extend([f"%{text}%", f"%{text}%"])
+        
+        if date_from:
+            where_conditions.append("a.created_at >= ?")
+            params.append(date_from)
+        
+        if date_to:
+            where_conditions.append("a.created_at <= ?")
+            params.append(date_to)
+        
+        if collapse:
+            # Matches the idx_cluster_representatives partial index
+            where_conditions.append("a.cluster_id IS NULL")
+        
+        return join_clause, where_conditions, params
     
+    @_instrumented(rows=len)
+    def get_export_batch(self, search: Optional[str] = None, date_from: Optional[str] = None,
+                         date_to: Optional[str] = None, after: Optional[Tuple[str, int]] = None,
+                         limit: int = 1000, include_content: bool = False) -> List[Dict[str, Any]]:
+        """Next ``limit`` matching articles, newest first, strictly after the ``(created_at, id)`` position
+        
+        Bulk export walks the filtered set one short keyset query at a time, so no
+        read transaction stays open for the whole export. Raises sqlite3.Error
+        rather than returning an empty batch, which would look like the end.
+        """
+        join_clause, where_conditions, params = self._article_filters(search, date_from, date_to)
+        if after:
+            where_conditions.append("(a.created_at, a.id) < (?, ?)")
+            params.extend(after)
+        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        columns = ', '.join(f'a.{column}' for column in EXPORT_COLUMNS)
+        if include_content:
+            columns += ', a.full_content'
+        
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute(f'''
+                    SELECT {columns}
+                    FROM news_articles a {join_clause}
+                    WHERE {where_clause}
+                    ORDER BY a.created_at DESC, a.id DESC
+                    LIMIT ?
+                ''', params + [limit]).fetchall()
+                return [dict(row) for row in rows]
+        except sqlite3.Error as e:
+            print(f"Database error exporting articles: {e}")
+            raise
+    
+    def _count_articles(self, conn: sqlite3.Connection, join_clause: str, where_clause: str,
+                        params: List[Any]) -> int:
+        """Total rows matching a filter: the trigger-maintained counter when unfiltered,
+        otherwise COUNT(*) cached for count_cache_ttl seconds within one data generation"""
+        if where_clause == "1=1":
+            row = conn.execute("SELECT value FROM table_counters WHERE name = 'news_articles'").fetchone()
+            if row is not None:
+                return row[0]
+        
+        # Read before counting, so a count racing a newer write is filed under the older generation
+        key = (self.get_generation(), join_clause, where_clause, tuple(params))
+        now = time.monotonic()
+        with self._count_cache_lock:
+            cached = self._count_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+        
+        total_count = conn.execute(
+            f"SELECT COUNT(*) FROM news_articles a {join_clause} WHERE {where_clause}", params
+        ).fetchone()[0]
+        
+        with self._count_cache_lock:
+            self._count_cache.pop(key, None)
+            while len(self._count_cache) >= self.count_cache_size:
+                # Dicts keep insertion order, so this drops the oldest entry
+                self._count_cache.pop(next(iter(self._count_cache)))
+            self._count_cache[key] = (now + self.count_cache_ttl, total_count)
+        return total_count
+    
+    @_instrumented()
+    def get_facets(self, search: Optional[str] = None, date_from: Optional[str] = None,
+                   date_to: Optional[str] = None, collapse: bool = False, limit: int = 20,
+                   rollup: bool = True) -> Dict[str, Any]:
+        """Article counts by publisher, category, language and published hour/day for the /articles filters
+        
+        Without a search, every created_at hour the date range covers completely is
+        read from the article_facets rollup, and only a partially covered first or
+        last hour is grouped from news_articles (through idx_created_at). A search,
+        a bound in another format or ``rollup=False`` groups all matching articles.
+        
+        publisher, category and language list their ``limit`` largest values;
+        published_hour and published_day list every hour/day in order. ``source``
+        reports the path taken: rollup, rollup+scan or scan.
+        """
+        plan = _facet_plan(date_from, date_to) if rollup and not search else None
+        counts: Dict[str, Dict[str, int]] = {facet: {} for facet, _ in _FACET_COLUMNS}
+        
+        try:
+            with self.read_connection() as conn:
+                if plan is None:
+                    source = 'scan'
+                    self._scan_facets(conn, counts, search, date_from, date_to, collapse)
+                else:
+                    hour_from, hour_to, edges = plan
+                    source = 'rollup+scan' if edges else 'rollup'
+                    conditions = []
+                    params = []
+                    if hour_from is not None:
+                        conditions.append('hour >= ?')
+                        params.append(hour_from)
+                    if hour_to is not None:
+                        conditions.append('hour < ?')
+                        params.append(hour_to)
+                    if collapse:
+                        conditions.append('representative = 1')
+                    where_clause = " AND ".join(conditions) if conditions else "1=1"
+                    for facet, value, articles in conn.execute(f'''
+                        SELECT facet, value, SUM(articles) FROM article_facets
+                        WHERE {where_clause}
+                        GROUP BY facet, value
+                    ''', params):
+                        counts[facet][value] = articles
+                    
+                    for edge in edges:
+                        start = datetime.strptime(edge, '%Y-%m-%d %H:%M:%S')
+                        self._scan_facets(conn, counts, None, date_from, date_to, collapse,
+                                          (edge, (start + timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S')))
+        except sqlite3.Error as e:
+            print(f"Database error getting facets: {e}")
+            return {'total': 0, 'facets': {}, 'source': 'error'}
+        
+        _FACET_QUERIES.inc(source)
+        facets = {}
+        for facet in ('publisher', 'category', 'language'):
+            ranked = sorted(counts[facet].items(), key=lambda item: (-item[1], item[0]))[:limit]
+            facets[facet] = [{'value': value, 'count': count} for value, count in ranked if count]
+        
+        days: Dict[str, int] = {}
+        for hour, count in counts['published_hour'].items():
+            if hour and count:
+                days[hour[:10]] = days.get(hour[:10], 0) + count
+        facets['published_hour'] = [{'value': hour, 'count': count}
+                                    for hour, count in sorted(counts['published_hour'].items()) if hour and count]
+        facets['published_day'] = [{'value': day, 'count': count} for day, count in sorted(days.items())]
+        
+        return {
+            # Every article has exactly one category value
+            'total': sum(counts['category'].values()),
+            'facets': facets,
+            'source': source
+        }
+    
+    def _scan_facets(self, conn: sqlite3.Connection, counts: Dict[str, Dict[str, int]], search: Optional[str],
+                     date_from: Optional[str], date_to: Optional[str], collapse: bool,
+                     hour: Optional[Tuple[str, str]] = None):
+        """Add facet counts grouped from the matching news_articles rows, optionally within one hour"""
+        join_clause, where_conditions, params = self._article_filters(search, date_from, date_to, collapse)
+        if hour is not None:
+            where_conditions.append("a.created_at >= ? AND a.created_at < ?")
+            params.extend(hour)
+        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        
+        # One pass groups by every facet at once; the filters pick rows through FTS5 or idx_created_at
+        columns = ', '.join(expression.format(row='a') for _, expression in _FACET_COLUMNS)
+        groups = ', '.join(str(n) for n in range(1, len(_FACET_COLUMNS) + 1))
+        for row in conn.execute(f'''
+            SELECT {columns}, COUNT(*) FROM news_articles a {join_clause}
+            WHERE {where_clause}
+            GROUP BY {groups}
+        ''', params):
+            articles = row[-1]
+            for (facet, _), value in zip(_FACET_COLUMNS, row):
+                counts[facet][value] = counts[facet].get(value, 0) + articles
+    
+    def _bump_generation(self, conn: sqlite3.Connection):
+        """Advance the data generation and last-modified time inside the caller's write transaction"""
+        conn.execute("UPDATE table_counters SET value = value + 1 WHERE name = 'generation'")
+        conn.execute("UPDATE table_counters SET value = CAST(strftime('%s', 'now') AS INTEGER) "
+                     "WHERE name = 'last_modified'")
+        self._store_generation(conn)
+    
+    def _store_generation(self, conn: sqlite3.Connection):
+        """Load generation and last-modified from table_counters into the in-process copy"""
+        values = dict(conn.execute(
+            "SELECT name, value FROM table_counters WHERE name IN ('generation', 'last_modified')"
+        ).fetchall())
+        generation = values.get('generation', 0)
+        # Never move backwards past a bump made by a concurrent local write
+        if generation >= self._generation:
+            if generation > self._generation:
+                # Another process wrote; counts cached under older generations can no longer be served
+                self.clear_count_cache()
+            self._generation = generation
+            self._last_modified = values.get('last_modified', 0)
+    
+    def _refresh_generation(self):
+        """Re-read the generation when generation_check_interval has elapsed"""
+        now = time.monotonic()
+        if now - self._generation_checked_at >= self.generation_check_interval:
+            try:
+                with self.get_connection() as conn:
+                    self._store_generation(conn)
+                self._generation_checked_at = now
+            except sqlite3.Error as e:
+                print(f"Database error reading data generation: {e}")
+    
+    def get_generation(self) -> int:
+        """Current data generation
+        
+        Writes made by this process are visible immediately; writes from other
+        processes are picked up within generation_check_interval seconds.
+        """
+        self._refresh_generation()
+        return self._generation
+    
+    def get_data_version(self) -> Tuple[int, int]:
+        """Generation and last-modified time read together, with at most one staleness check"""
+        self._refresh_generation()
+        return self._generation, self._last_modified
+    
+    def get_last_modified(self) -> int:
+        """Unix time of the last change to news_articles (seeded from MAX(updated_at))"""
+        self._refresh_generation()
+        return self._last_modified
+    
+    def record_ingest(self):
+        """Mark now as the last successful fetch, shared by every process (see get_last_ingest)"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute("INSERT OR REPLACE INTO table_counters (name, value) "
+                             "VALUES ('last_ingest', CAST(strftime('%s', 'now') AS INTEGER))")
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error recording ingest: {e}")
+    
+    def get_last_ingest(self) -> Optional[int]:
+        """Unix time of the last successful fetch in any process, or None if there has been none"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute("SELECT value FROM table_counters WHERE name = 'last_ingest'").fetchone()
+                return row[0] if row and row[0] else None
+        except sqlite3.Error as e:
+            print(f"Database error reading last ingest: {e}")
+            return None
+    
+    @_instrumented()
+    def get_article_count(self) -> int:
+        """Total stored articles, read from the trigger-maintained counter"""
+        try:
+            with self.get_connection() as conn:
+                return self._count_articles(conn, "", "1=1", [])
+        except sqlite3.Error as e:
+            print(f"Database error counting articles: {e}")
+            return 0
+    
+    @_instrumented()
+    def get_article_version(self, article_id: int) -> Optional[Dict[str, Any]]:
+        """Get just updated_at and content_hash for an article (for ETags), or None if missing"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    'SELECT updated_at, content_hash FROM news_articles WHERE id = ?', (article_id,)
+                ).fetchone()
+                return {'updated_at': row['updated_at'], 'content_hash': row['content_hash']} if row else None
+        except sqlite3.Error as e:
+            print(f"Database error getting article version: {e}")
+            return None
+    
+    def clear_count_cache(self):
+        """Drop cached filtered counts after the article set changes"""
+        with self._count_cache_lock:
+            self._count_cache.clear()
+    
+    @_instrumented(rows=lambda article: 1 if article else 0)
     def get_article_by_id(self, article_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific article by ID"""
         try:
-            with self.get_connection() as conn:
+            with self.read_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT id, title, url, publisher, published_date, summary, thumbnail, 
-                           language, category, full_content, created_at, updated_at
+                           language, category, full_content, created_at, updated_at,
+                           COALESCE(cluster_id, id) AS cluster_id
                     FROM news_articles 
                     WHERE id = ?
                 ''', (article_id,))
@@ -219,77 +1408,472 @@ class DatabaseManager:
                         'thumbnail': row['thumbnail'],
                         'language': row['language'],
                         'category': row['category'],
-                        'full_content': row['full_content'],
                         'created_at': row['created_at'],
-                        'updated_at': row['updated_at']
+                        'updated_at': row['updated_at'],
+                        'cluster_id': row['cluster_id'],
+                        'full_content': row['full_content']
                     }
                 return None
         except sqlite3.Error as e:
             print(f"Database error getting article by ID: {e}")
             return None
     
+    def _delete_in_batches(self, table: str, cutoff_str: str, articles: bool = False) -> int:
+        """Delete rows created before cutoff_str, cleanup_batch_size rows per transaction
+        
+        The write lock is released and the thread sleeps between batches, so ingest
+        and other writers are never blocked for the whole scan.
+        """
+        deleted_count = 0
+        while True:
+            with self.get_connection() as conn:
+                batch_count = conn.execute(f'''
+                    DELETE FROM {table} WHERE id IN (
+                        SELECT id FROM {table} WHERE created_at < ? LIMIT ?
+                    )
+                ''', (cutoff_str, self.cleanup_batch_size)).rowcount
+                if batch_count and articles:
+                    self._bump_generation(conn)
+                conn.commit()
+            if batch_count and articles:
+                self.clear_count_cache()
+            
+            deleted_count += batch_count
+            if batch_count < self.cleanup_batch_size:
+                return deleted_count
+            time.sleep(self.cleanup_batch_pause)
+    
+    @_instrumented(rows=lambda deleted: deleted)
     def cleanup_old_articles(self) -> int:
         """Remove articles older than retention period"""
         cutoff_date = datetime.now() - timedelta(days=self.retention_days)
         cutoff_str = cutoff_date.strftime('%Y-%m-%d %H:%M:%S')
         
         try:
+            deleted_count = self._delete_in_batches('news_articles', cutoff_str, articles=True)
+            if deleted_count:
+                with self.get_connection() as conn:
+                    repaired = self._repair_clusters(conn)
+                    if repaired:
+                        # Collapsed pages, ETags and the read snapshot built since the delete lack these stories
+                        self._bump_generation(conn)
+                    conn.commit()
+                if repaired:
+                    self.clear_count_cache()
+                    print(f"Promoted new representatives for {repaired} clusters")
+                self.request_snapshot_refresh()
+            self._prune_bands()
+            print(f"Cleaned up {deleted_count} articles older than {self.retention_days} days")
+            return deleted_count
+        except sqlite3.Error as e:
+            print(f"Database error during cleanup: {e}")
+            return 0
+    
+    @_instrumented(rows=lambda deleted: deleted)
+    def cleanup_api_logs(self) -> int:
+        """Remove API call logs older than their (separate) retention period"""
+        cutoff_date = datetime.now() - timedelta(days=self.api_log_retention_days)
+        cutoff_str = cutoff_date.strftime('%Y-%m-%d %H:%M:%S')
+        
+        try:
+            deleted_count = self._delete_in_batches('api_logs', cutoff_str)
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM news_articles WHERE created_at < ?', (cutoff_str,))
-                deleted_count = cursor.rowcount
+                # Buckets that have left the 24h stats window
+                conn.execute('DELETE FROM api_call_counts WHERE minute <= ?', (int(time.time()) // 60 - 1440,))
                 conn.commit()
-                print(f"Cleaned up {deleted_count} articles older than {self.retention_days} days")
-                return deleted_count
+            print(f"Cleaned up {deleted_count} API logs older than {self.api_log_retention_days} days")
+            return deleted_count
         except sqlite3.Error as e:
-            print(f"Database error during cleanup: {e}")
+            print(f"Database error during API log cleanup: {e}")
             return 0
     
-    def log_api_call(self, endpoint: str, response_code: int, response_time: float, articles_fetched: int):
-        """Log API call statistics"""
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """Page usage and on-disk size of the database (main file plus WAL)"""
+        try:
+            with self.get_connection() as conn:
+                page_size = conn.execute('PRAGMA page_size').fetchone()[0]
+                page_count = conn.execute('PRAGMA page_count').fetchone()[0]
+                freelist_count = conn.execute('PRAGMA freelist_count').fetchone()[0]
+                auto_vacuum = conn.execute('PRAGMA auto_vacuum').fetchone()[0]
+            
+            wal_path = f"{self.db_path}-wal"
+            return {
+                'file_bytes': os.path.getsize(self.db_path),
+                'wal_bytes': os.path.getsize(wal_path) if os.path.exists(wal_path) else 0,
+                'page_size': page_size,
+                'page_count': page_count,
+                'freelist_pages': freelist_count,
+                'freelist_bytes': freelist_count * page_size,
+                'auto_vacuum': ('NONE', 'FULL', 'INCREMENTAL')[auto_vacuum]
+            }
+        except (sqlite3.Error, OSError) as e:
+            print(f"Database error getting storage stats: {e}")
+            return {}
+    
+    @_instrumented()
+    def reclaim_space(self) -> str:
+        """Return free pages to the filesystem; returns the method used
+        
+        With incremental auto-vacuum the freelist is released vacuum_step_pages at a
+        time, pausing between steps like batched deletes. A database whose stored
+        mode differs from DATABASE_AUTO_VACUUM is converted once with a full VACUUM.
+        The WAL is checkpointed and truncated afterwards so the file sizes drop.
+        """
+        try:
+            with self.get_connection() as conn:
+                mode = ('NONE', 'FULL', 'INCREMENTAL')[conn.execute('PRAGMA auto_vacuum').fetchone()[0]]
+                if mode != self.auto_vacuum:
+                    print(f"Converting database auto_vacuum from {mode} to {self.auto_vacuum} (full VACUUM)")
+                    conn.execute(f'PRAGMA auto_vacuum={self.auto_vacuum}')
+                    conn.execute('VACUUM')
+                    method = 'vacuum'
+                elif mode == 'INCREMENTAL':
+                    while conn.execute('PRAGMA freelist_count').fetchone()[0]:
+                        # incremental_vacuum only frees pages as its rows are stepped through
+                        conn.execute(f'PRAGMA incremental_vacuum({self.vacuum_step_pages})').fetchall()
+                        time.sleep(self.cleanup_batch_pause)
+                    method = 'incremental_vacuum'
+                else:
+                    method = 'none'
+                conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchall()
+                return method
+        except sqlite3.Error as e:
+            print(f"Database error reclaiming space: {e}")
+            return 'error'
+    
+    def cleanup_database(self) -> Dict[str, Any]:
+        """Apply article and API log retention, then reclaim the freed space"""
+        started = time.monotonic()
+        size_before = self.get_storage_stats()
+        deleted_articles = self.cleanup_old_articles()
+        deleted_api_logs = self.cleanup_api_logs()
+        vacuum = self.reclaim_space()
+        size_after = self.get_storage_stats()
+        
+        reclaimed = None
+        if size_before and size_after:
+            reclaimed = (size_before['file_bytes'] + size_before['wal_bytes']
+                         - size_after['file_bytes'] - size_after['wal_bytes'])
+        return {
+            'deleted_articles': deleted_articles,
+            'deleted_api_logs': deleted_api_logs,
+            'vacuum': vacuum,
+            'size_before': size_before,
+            'size_after': size_after,
+            'reclaimed_bytes': reclaimed,
+            'elapsed_seconds': round(time.monotonic() - started, 3)
+        }
+    
+    @_instrumented()
+    def log_api_call(self, endpoint: str, response_code: Optional[int], response_time: float,
+                     articles_fetched: int, outcome: str = 'fetched'):
+        """Log API call statistics
+        
+        outcome is 'fetched', 'not_modified', 'error' (a failed response) or 'skipped',
+        a poll cycle that sent no request.
+        """
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
-                    INSERT INTO api_logs (endpoint, response_code, response_time, articles_fetched)
-                    VALUES (?, ?, ?, ?)
-                ''', (endpoint, response_code, response_time, articles_fetched))
+                    INSERT INTO api_logs (endpoint, response_code, response_time, articles_fetched, outcome)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (endpoint, response_code, response_time, articles_fetched, outcome))
                 conn.commit()
         except sqlite3.Error as e:
             print(f"Database error logging API call: {e}")
     
+    def get_feed_states(self) -> Dict[str, Dict[str, Any]]:
+        """Adaptive polling state of every feed seen so far, keyed by feed"""
+        try:
+            with self.get_connection() as conn:
+                rows = conn.execute('''
+                    SELECT feed, etag, last_modified, interval_seconds, yield_ratio, next_fetch_at, checked_at
+                    FROM feed_state
+                ''').fetchall()
+                return {row['feed']: dict(row) for row in rows}
+        except sqlite3.Error as e:
+            print(f"Database error getting feed state: {e}")
+            return {}
+    
+    def save_feed_state(self, feed: str, state: Dict[str, Any]):
+        """Store a feed's validators, poll interval and next due time"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('''
+                    INSERT INTO feed_state (feed, etag, last_modified, interval_seconds, yield_ratio, next_fetch_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(feed) DO UPDATE SET
+                        etag = excluded.etag,
+                        last_modified = excluded.last_modified,
+                        interval_seconds = excluded.interval_seconds,
+                        yield_ratio = excluded.yield_ratio,
+                        next_fetch_at = excluded.next_fetch_at,
+                        checked_at = CURRENT_TIMESTAMP
+                ''', (feed, state.get('etag'), state.get('last_modified'), state['interval_seconds'],
+                      state.get('yield_ratio'), state['next_fetch_at']))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error saving feed state: {e}")
+    
+    @_instrumented()
+    def save_scheduler_state(self, leader: str, state: Dict[str, Any]) -> bool:
+        """Publish the scheduler leader's identity and job status, refreshing its heartbeat"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('''
+                    INSERT INTO scheduler_state (id, leader, state, heartbeat_at)
+                    VALUES (1, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(id) DO UPDATE SET
+                        leader = excluded.leader,
+                        state = excluded.state,
+                        heartbeat_at = excluded.heartbeat_at
+                ''', (leader, json.dumps(state)))
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            print(f"Database error saving scheduler state: {e}")
+            return False
+    
+    @_instrumented()
+    def get_scheduler_state(self) -> Optional[Dict[str, Any]]:
+        """Get the published leader status, including the heartbeat age in seconds"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute('''
+                    SELECT leader, state, heartbeat_at,
+                           (julianday('now') - julianday(heartbeat_at)) * 86400 AS heartbeat_age
+                    FROM scheduler_state WHERE id = 1
+                ''').fetchone()
+                if not row:
+                    return None
+                return {
+                    'leader': row['leader'],
+                    'state': json.loads(row['state']),
+                    'heartbeat_at': row['heartbeat_at'],
+                    'heartbeat_age': row['heartbeat_age']
+                }
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Database error getting scheduler state: {e}")
+            return None
+    
+    def clear_scheduler_state(self, leader: str):
+        """Remove the published status if it still belongs to leader"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('DELETE FROM scheduler_state WHERE id = 1 AND leader = ?', (leader,))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"Database error clearing scheduler state: {e}")
+    
+    @_instrumented()
+    def save_fetch_job(self, job_id: str, summary: Dict[str, Any], keep: int) -> bool:
+        """Store a fetch job's summary, keeping only the ``keep`` most recently started jobs"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute('''
+                    INSERT INTO fetch_jobs (id, state, updated_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT(id) DO UPDATE SET
+                        state = excluded.state,
+                        updated_at = excluded.updated_at
+                ''', (job_id, json.dumps(summary)))
+                # Upserts keep the rowid, so rowid order is start order
+                conn.execute('''
+                    DELETE FROM fetch_jobs WHERE rowid <= (
+                        SELECT rowid FROM fetch_jobs ORDER BY rowid DESC LIMIT 1 OFFSET ?
+                    )
+                ''', (max(1, keep),))
+                conn.commit()
+                return True
+        except sqlite3.Error as e:
+            print(f"Database error saving fetch job: {e}")
+            return False
+    
+    @_instrumented()
+    def get_fetch_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a stored fetch job summary, or None if unknown"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute('SELECT state FROM fetch_jobs WHERE id = ?', (job_id,)).fetchone()
+                return json.loads(row['state']) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Database error getting fetch job: {e}")
+            return None
+    
+    @_instrumented()
+    def get_running_fetch_job(self) -> Optional[Dict[str, Any]]:
+        """Get the most recently started stored fetch job that is still running, or None"""
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute('''
+                    SELECT state FROM fetch_jobs WHERE json_extract(state, '$.status') = 'running'
+                    ORDER BY rowid DESC LIMIT 1
+                ''').fetchone()
+                return json.loads(row['state']) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Database error getting running fetch job: {e}")
+            return None
+    
+    @_instrumented()
     def get_database_stats(self) -> Dict[str, Any]:
-        """Get database statistics"""
+        """Get database statistics from the trigger-maintained counters (constant time)"""
         try:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Get article count
-                cursor.execute('SELECT COUNT(*) FROM news_articles')
-                article_count = cursor.fetchone()[0]
-                
-                # Get latest article date
-                cursor.execute('SELECT MAX(created_at) FROM news_articles')
-                latest_article = cursor.fetchone()[0]
+                counters = dict(conn.execute('''
+                    SELECT name, value FROM table_counters
+                    WHERE name IN ('news_articles', 'articles_newest', 'articles_oldest')
+                ''').fetchall())
                 
-                # Get oldest article date
-                cursor.execute('SELECT MIN(created_at) FROM news_articles')
-                oldest_article = cursor.fetchone()[0]
-                
-                # Get recent API calls
-                cursor.execute('SELECT COUNT(*) FROM api_logs WHERE created_at > datetime("now", "-1 day")')
-                recent_api_calls = cursor.fetchone()[0]
+                # Sum of the per-minute buckets covering the last 24 hours
+                now_minute = int(time.time()) // 60
+                recent_api_calls = conn.execute(
+                    'SELECT COALESCE(SUM(calls), 0) FROM api_call_counts WHERE minute > ?',
+                    (now_minute - 1440,)
+                ).fetchone()[0]
                 
                 return {
-                    'total_articles': article_count,
-                    'latest_article_date': latest_article,
-                    'oldest_article_date': oldest_article,
+                    'total_articles': counters.get('news_articles', 0),
+                    'latest_article_date': self._format_counter_time(counters.get('articles_newest')),
+                    'oldest_article_date': self._format_counter_time(counters.get('articles_oldest')),
                     'recent_api_calls_24h': recent_api_calls,
                     'retention_days': self.retention_days
                 }
         except sqlite3.Error as e:
             print(f"Database error getting stats: {e}")
             return {}
+    
+    @staticmethod
+    def _format_counter_time(value: Optional[int]) -> Optional[str]:
+        """Render a Unix-time counter in the CURRENT_TIMESTAMP format used by created_at"""
+        if not value:
+            return None
+        return datetime.fromtimestamp(value, timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    
+    @_instrumented()
+    def reconcile_stats(self) -> Dict[str, Any]:
+        """Recompute every maintained statistic from the base tables and repair any drift
+        
+        Runs in one write transaction so concurrent inserts cannot race the comparison.
+        Returns the values checked and the mismatches found (expected vs maintained).
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                expected = dict(conn.execute('''
+                    SELECT 'news_articles', COUNT(*) FROM news_articles
+                    UNION ALL
+                    SELECT 'articles_newest', COALESCE(CAST(strftime('%s', MAX(created_at)) AS INTEGER), 0)
+                    FROM news_articles
+                    UNION ALL
+                    SELECT 'articles_oldest', COALESCE(CAST(strftime('%s', MIN(created_at)) AS INTEGER), 0)
+                    FROM news_articles
+                ''').fetchall())
+                maintained = dict(conn.execute(
+                    'SELECT name, value FROM table_counters WHERE name IN (?, ?, ?)', tuple(expected)
+                ).fetchall())
+                
+                mismatches = {}
+                for name, value in expected.items():
+                    if maintained.get(name) != value:
+                        mismatches[name] = {'expected': value, 'maintained': maintained.get(name)}
+                        conn.execute('INSERT OR REPLACE INTO table_counters (name, value) VALUES (?, ?)',
+                                     (name, value))
+                
+                # API call buckets inside the 24h window
+                first_minute = int(time.time()) // 60 - 1440
+                expected_calls = dict(conn.execute('''
+                    SELECT CAST(strftime('%s', created_at) AS INTEGER) / 60 AS minute, COUNT(*)
+                    FROM api_logs WHERE created_at >= datetime(? * 60, 'unixepoch') AND outcome IS NOT 'skipped'
+                    GROUP BY minute
+                ''', (first_minute,)).fetchall())
+                maintained_calls = dict(conn.execute(
+                    'SELECT minute, calls FROM api_call_counts WHERE minute >= ?', (first_minute,)
+                ).fetchall())
+                
+                bucket_mismatches = 0
+                for minute in set(expected_calls) | set(maintained_calls):
+                    expected_count = expected_calls.get(minute, 0)
+                    if maintained_calls.get(minute, 0) != expected_count:
+                        bucket_mismatches += 1
+                        conn.execute('INSERT OR REPLACE INTO api_call_counts (minute, calls) VALUES (?, ?)',
+                                     (minute, expected_count))
+                if bucket_mismatches:
+                    mismatches['api_call_counts'] = {
+                        'buckets': bucket_mismatches,
+                        'expected': sum(expected_calls.values()),
+                        'maintained': sum(maintained_calls.values())
+                    }
+                
+                # Facet rollup, rebuilt whole if any row differs
+                expected_facets = {tuple(row) for row in conn.execute(_FACET_ROLLUP_SQL)}
+                maintained_facets = {tuple(row) for row in conn.execute(
+                    'SELECT hour, representative, facet, value, articles FROM article_facets')}
+                if expected_facets != maintained_facets:
+                    mismatches['article_facets'] = {'rows': len(expected_facets ^ maintained_facets)}
+                    conn.execute('DELETE FROM article_facets')
+                    conn.execute(f'INSERT INTO article_facets (hour, representative, facet, value, articles) '
+                                 f'{_FACET_ROLLUP_SQL}')
+                
+                conn.commit()
+                if mismatches:
+                    print(f"Reconciled database stats, corrected: {mismatches}")
+                return {
+                    'consistent': not mismatches,
+                    'checked': sorted(expected) + ['api_call_counts', 'article_facets'],
+                    'mismatches': mismatches
+                }
+        except sqlite3.Error as e:
+            print(f"Database error reconciling stats: {e}")
+            return {'consistent': None, 'error': str(e)}
+    
+    def metric_families(self) -> List[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]:
+        """Table counters for /metrics, read at scrape time"""
+        snapshot = self.get_snapshot_stats()
+        return [
+            ('db_articles', 'gauge', 'Stored articles', [({}, self.get_article_count())]),
+            ('db_data_generation', 'gauge', 'Data generation (bumped by every article change)',
+             [({}, self.get_generation())]),
+            ('db_pooled_connections', 'gauge', 'Open per-thread SQLite connections', [({}, len(self._connections))]),
+            ('db_read_snapshot_bytes', 'gauge', 'Size of the in-memory read snapshot',
+             [({}, snapshot['size_bytes'])]),
+            ('db_read_snapshot_generation', 'gauge', 'Data generation of the in-memory read snapshot',
+             [({}, snapshot['generation'] or 0)])
+        ]
+
+class AsyncDatabaseManager:
+    """Awaitable facade over DatabaseManager that runs every call on a bounded thread pool
+    
+    Exposes the same methods as the wrapped manager, e.g. ``await async_db.get_articles(page=2)``,
+    so SQLite work never blocks the event loop.
+    """
+    
+    def __init__(self, manager: DatabaseManager):
+        self._manager = manager
+        self.max_workers = int(os.getenv('DATABASE_EXECUTOR_WORKERS', '4'))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='db-worker')
+    
+    async def run(self, func, *args, **kwargs):
+        """Run a blocking callable on the database executor"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self._manager, name)
+        if not callable(attr):
+            return attr
+        
+        async def call(*args, **kwargs):
+            return await self.run(attr, *args, **kwargs)
+        
+        call.__name__ = name
+        return call
+    
+    def shutdown(self):
+        """Stop the executor, waiting for in-flight calls to finish"""
+        self._executor.shutdown(wait=True)
 
-# Global database instance
-db = DatabaseManager()
\ No newline at end of file
+# Global database instances
+db = DatabaseManager()
+metrics.add_collector(db.metric_families)
+async_db = AsyncDatabaseManager(db)
\ No newline at end of file
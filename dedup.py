@@ -0,0 +1,51 @@
+import re
+import struct
+import hashlib
+from typing import FrozenSet, List
+
+# MinHash signature of MINHASH_BANDS x MINHASH_ROWS 16-bit values; two headlines become
+# cluster candidates when all values of any one band agree. With 8 bands of 4 rows a
+# one-word edit of a 10-word headline (Jaccard ~0.8) is found with probability
+# 1 - (1 - 0.8**4)**8 > 98%, while headlines sharing a word or two almost never collide;
+# candidates are then checked with the exact Jaccard similarity.
+MINHASH_BANDS = 8
+MINHASH_ROWS = 4
+_SIGNATURE_SIZE = MINHASH_BANDS * MINHASH_ROWS
+_UNPACK = struct.Struct(f'<{_SIGNATURE_SIZE}H').unpack
+# Band number in the top byte of each key, band values hashed into the low 56 bits
+_BAND_SHIFT = 56
+
+# Trailing " - Reuters" / " | Bloomberg.com" attributions added by syndication
+_ATTRIBUTION_RE = re.compile(r'\s+[-|–—]\s+[^-|–—]{2,40}$')
+_TOKEN_RE = re.compile(r'[^\W_]+')
+_STOPWORDS = frozenset('a an and as at by for from in is it of on or the to with'.split())
+
+# Headlines with fewer distinct words are too short to cluster reliably
+MIN_FEATURES = 3
+
+def headline_features(title: str) -> FrozenSet[str]:
+    """Distinct lowercase words of a headline, without attribution suffix or stopwords"""
+    words = _TOKEN_RE.findall(_ATTRIBUTION_RE.sub('', title or '').lower())
+    return frozenset(word for word in words if word not in _STOPWORDS)
+
+def minhash_bands(features: FrozenSet[str]) -> List[int]:
+    """LSH band keys of the features' MinHash signature, empty if there are too few features"""
+    if len(features) < MIN_FEATURES:
+        return []
+    
+    # One 64-byte digest per feature supplies all 32 hash functions; min per column in C
+    signature = list(map(min, zip(*(
+        _UNPACK(hashlib.blake2b(feature.encode('utf-8'), digest_size=_SIGNATURE_SIZE * 2).digest())
+        for feature in features
+    ))))
+    keys = []
+    for band in range(MINHASH_BANDS):
+        values = signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]
+        digest = hashlib.blake2b(struct.pack(f'<{MINHASH_ROWS}H', *values), digest_size=7).digest()
+        keys.append((band << _BAND_SHIFT) | int.from_bytes(digest, 'big'))
+    return keys
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
@@ -0,0 +1,71 @@
+import os
+import socket
+import logging
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows has no flock; every process acts as leader there
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+class LeaderLock:
+    """Single-leader election between processes via an exclusive OS file lock
+
+    The lock is non-blocking: acquire() either wins immediately or reports that
+    another process leads. The kernel releases the lock when the holder exits
+    or crashes, so the next follower to call acquire() takes over.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.hostname = socket.gethostname()
+        self._file = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._file is not None and self.pid == os.getpid()
+
+    def acquire(self) -> bool:
+        """Try to become leader; returns True if this process holds the lock"""
+        if self.is_leader:
+            return True
+
+        # A lock inherited through fork() belongs to the parent
+        self._file = None
+        self.pid = os.getpid()
+
+        if fcntl is None:
+            logger.warning("fcntl unavailable; leader election disabled, this process will lead")
+            self._file = open(self.path, 'a')
+            return True
+
+        lock_file: Optional[object] = None
+        try:
+            lock_file = open(self.path, 'a+')
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            if lock_file:
+                lock_file.close()
+            return False
+
+        # Record the holder for operators inspecting the lock file
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(f"{self.hostname}:{self.pid}\n")
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self):
+        """Give up leadership"""
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None and self.is_leader:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+        finally:
+            self._file = None
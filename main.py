@@ -1,14 +1,30 @@
-from fastapi import FastAPI, HTTPException, Query, Path
+import time
+
+# Taken before any other import so startup timings include import cost
+IMPORT_STARTED_AT = time.perf_counter()
+
+from fastapi import FastAPI, HTTPException, Query, Path, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Optional, Dict, Any, List, Tuple
 import os
+import io
+import csv
+import json
+import hashlib
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
 from dotenv import load_dotenv
-from database import db
+from database import db, async_db, EXPORT_COLUMNS, decode_cursor, encode_cursor
 from news_fetcher import news_fetcher
+from cache import response_cache, CachedResponse
+from compress import response_compressor
+from serialization import FAST_PATH_ENABLED as SERIALIZATION_FAST_PATH, dumps as dump_json
+from metrics import metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
 
 # Load environment variables
 load_dotenv()
@@ -33,16 +49,31 @@ class ArticleResponse(BaseModel):
     category: str
     created_at: str
     updated_at: str
+    # Id of the story's representative article; near-duplicates share it
+    cluster_id: int
 
 class ArticleDetailResponse(ArticleResponse):
     full_content: str
 
 class PaginatedResponse(BaseModel):
     articles: List[ArticleResponse]
-    total_count: int
+    total_count: Optional[int]
     page: int
     limit: int
-    total_pages: int
+    total_pages: Optional[int]
+    has_more: bool
+    next_cursor: Optional[str] = None
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class FacetsResponse(BaseModel):
+    total: int
+    # publisher, category, language, published_hour and published_day
+    facets: Dict[str, List[FacetCount]]
+    # rollup, rollup+scan or scan
+    source: str
 
 class StatsResponse(BaseModel):
     total_articles: int
@@ -55,10 +86,17 @@ class SchedulerStatusResponse(BaseModel):
     scheduler_running: bool
     jobs: List[Dict[str, Any]]
     timezone: str
+    role: Optional[str] = None
+    leader: Optional[Dict[str, Any]] = None
+    feeds: List[Dict[str, Any]] = []
 
 class ManualFetchResponse(BaseModel):
     status: str
     message: str
+    job_id: Optional[str] = None
+    coalesced: bool = False
+    # True when another worker process was already fetching; job_id is that process's job
+    other_process: bool = False
 
 # Create FastAPI app
 app = FastAPI(
@@ -77,9 +115,294 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Milliseconds from main.py import to each startup milestone
+startup_timings: Dict[str, Optional[float]] = {
+    'import_ms': None,
+    'startup_complete_ms': None,
+    'first_request_ms': None
+}
+
+def record_startup_timing(milestone: str):
+    """Record the elapsed time since import for a startup milestone (first occurrence only)"""
+    if startup_timings[milestone] is None:
+        startup_timings[milestone] = round((time.perf_counter() - IMPORT_STARTED_AT) * 1000, 1)
+
+class FirstRequestTimer:
+    """ASGI middleware that notes when the first HTTP response starts, then gets out of the way"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or startup_timings['first_request_ms'] is not None:
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_and_record(message):
+            if message['type'] == 'http.response.start' and startup_timings['first_request_ms'] is None:
+                record_startup_timing('first_request_ms')
+                logger.info(f"First request served {startup_timings['first_request_ms']}ms after import")
+            await send(message)
+        
+        await self.app(scope, receive, send_and_record)
+
+app.add_middleware(FirstRequestTimer)
+
+class CompressionMiddleware:
+    """ASGI middleware compressing response bodies with the negotiated Content-Encoding
+    
+    Responses that already carry a Content-Encoding (cached payloads served from
+    their precompressed variant) pass through untouched. Streamed bodies are
+    compressed chunk by chunk and flushed, so each chunk still goes out at once.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        encoding = None
+        if scope['type'] == 'http':
+            encoding = response_compressor.negotiate(Headers(scope=scope).get('accept-encoding'))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        pending = None
+        stream = None
+        totals = [0, 0, 0.0]
+        
+        async def send_compressed(message):
+            nonlocal pending, stream
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                if 'content-encoding' in headers or not response_compressor.should_compress(
+                        headers.get('content-type'), None):
+                    await send(message)
+                else:
+                    # Hold the headers until the first body chunk shows whether it is worth compressing
+                    pending = message
+                return
+            if message['type'] != 'http.response.body' or (pending is None and stream is None):
+                await send(message)
+                return
+            
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if pending is not None:
+                start, pending = pending, None
+                if not more_body and not response_compressor.large_enough(len(body)):
+                    await send(start)
+                    await send(message)
+                    return
+                
+                headers = MutableHeaders(scope=start)
+                headers['Content-Encoding'] = encoding
+                headers.add_vary_header('Accept-Encoding')
+                if 'etag' in headers and not headers['etag'].startswith('W/'):
+                    headers['ETag'] = 'W/' + headers['etag']
+                if not more_body:
+                    body = response_compressor.compress(body, encoding)
+                    headers['Content-Length'] = str(len(body))
+                    await send(start)
+                    await send({'type': 'http.response.body', 'body': body})
+                    return
+                if 'content-length' in headers:
+                    del headers['content-length']
+                stream = response_compressor.stream(encoding)
+                await send(start)
+            
+            started = time.perf_counter()
+            data = stream.chunk(body) if more_body else stream.chunk(body) + stream.finish()
+            totals[0] += len(body)
+            totals[1] += len(data)
+            totals[2] += time.perf_counter() - started
+            if not more_body:
+                response_compressor.record(encoding, totals[0], totals[1], totals[2])
+            await send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+        
+        await self.app(scope, receive, send_compressed)
+
+app.add_middleware(CompressionMiddleware)
+
+_HTTP_DURATION = metrics.histogram('http_request_duration_seconds', 'HTTP request latency by route template',
+                                   ['method', 'route', 'status'])
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request, labelled by route template rather than raw path"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        status = 500
+        
+        async def send_and_capture(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_and_capture)
+        finally:
+            # The router records the matched route in the scope
+            route = getattr(scope.get('route'), 'path', 'unmatched')
+            _HTTP_DURATION.observe(time.perf_counter() - started, scope['method'], route, str(status))
+
+app.add_middleware(MetricsMiddleware)
+
+def startup_metric_families():
+    """Startup milestones for /metrics"""
+    return [('app_startup_milliseconds', 'gauge', 'Milliseconds from main.py import to each startup milestone',
+             [({'milestone': name}, value) for name, value in startup_timings.items()])]
+
+metrics.add_collector(startup_metric_families)
+
 # Configuration constants
 DEFAULT_PAGE_SIZE = int(os.getenv('DEFAULT_PAGE_SIZE', '20'))
 MAX_PAGE_SIZE = int(os.getenv('MAX_PAGE_SIZE', '100'))
+# Rows per query while streaming /articles/export
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+# /stats includes a rolling 24h API-call count, so it also expires on a timer
+STATS_CACHE_TTL = float(os.getenv('STATS_CACHE_TTL', '60'))
+
+paginated_adapter = TypeAdapter(PaginatedResponse)
+article_detail_adapter = TypeAdapter(ArticleDetailResponse)
+latest_articles_adapter = TypeAdapter(List[ArticleResponse])
+facets_adapter = TypeAdapter(FacetsResponse)
+
+def render_json(adapter: TypeAdapter, data: Any) -> bytes:
+    """Serialize database results shaped like the adapter's model
+    
+    The fast path encodes the dicts from DatabaseManager directly, which already
+    carry exactly the model's fields and types, instead of copying and validating
+    every row through Pydantic; the routes' response_model still documents the
+    schema. Without orjson, or with SERIALIZATION_FAST_PATH=False, rows are
+    validated and dumped by Pydantic.
+    """
+    if SERIALIZATION_FAST_PATH:
+        return dump_json(data)
+    return adapter.dump_json(adapter.validate_python(data))
+
+def cached_json_response(cached: CachedResponse, cache_status: str,
+                         validators: Optional[Dict[str, str]] = None,
+                         request: Optional[Request] = None, key: Optional[Tuple] = None) -> Response:
+    """Build a response from a cached payload, tagging it with X-Cache: HIT or MISS
+    
+    With the request, the body is sent in the negotiated Content-Encoding. Each
+    encoding is compressed once and kept on the cache entry under ``key``, so
+    hits reuse the compressed bytes instead of compressing again.
+    """
+    headers = dict(cached.headers)
+    headers.update(validators or {})
+    headers['X-Cache'] = cache_status
+    body = cached.body
+    
+    if request is not None and response_compressor.should_compress(cached.media_type, len(body)):
+        headers['Vary'] = 'Accept-Encoding'
+        encoding = response_compressor.negotiate(request.headers.get('accept-encoding'))
+        if encoding:
+            body = cached.encoded.get(encoding)
+            if body is None:
+                body = response_compressor.compress(cached.body, encoding)
+                response_cache.add_encoding(key, cached, encoding, body)
+            headers['Content-Encoding'] = encoding
+            if 'ETag' in headers:
+                headers['ETag'] = 'W/' + headers['ETag']
+    return Response(content=body, media_type=cached.media_type, headers=headers)
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag derived from the values that fully determine a response body"""
+    return '"' + hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:24] + '"'
+
+def make_validators(etag: str, last_modified: Optional[float]) -> Dict[str, str]:
+    """ETag and Last-Modified headers for a response"""
+    validators = {'ETag': etag}
+    if last_modified:
+        validators['Last-Modified'] = formatdate(last_modified, usegmt=True)
+    return validators
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[float]) -> bool:
+    """Evaluate If-None-Match (which takes precedence) or If-Modified-Since for a GET"""
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+    
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+    return False
+
+def timestamp_from_db(value: Optional[str]) -> Optional[float]:
+    """Convert a SQLite CURRENT_TIMESTAMP string (UTC) to a Unix timestamp"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+async def get_cached_stats() -> Tuple[Optional[CachedResponse], str]:
+    """Serialized database statistics shared by /stats and /health, with the cache status"""
+    key = ('stats',)
+    generation = await async_db.get_generation()
+    cached = response_cache.get(key, generation)
+    if cached is not None:
+        return cached, 'HIT'
+    
+    stats = await async_db.get_database_stats()
+    if not stats:
+        return None, 'MISS'
+    cached = CachedResponse(StatsResponse(**stats).model_dump_json().encode('utf-8'))
+    response_cache.set(key, generation, cached, ttl=STATS_CACHE_TTL)
+    return cached, 'MISS'
+
+async def export_rows(export_format: str, include_content: bool, filters: Dict[str, Any],
+                      after: Optional[Tuple[str, int]]):
+    """Stream every matching article in EXPORT_BATCH_SIZE keyset batches
+    
+    Each row carries the cursor of its own position; passing the cursor of the
+    last row received back as ``cursor`` resumes the export right after it.
+    """
+    columns = list(EXPORT_COLUMNS) + (['full_content'] if include_content else []) + ['cursor']
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+    
+    while True:
+        try:
+            rows = await async_db.get_export_batch(after=after, limit=EXPORT_BATCH_SIZE,
+                                                   include_content=include_content, **filters)
+        except Exception as e:
+            # Headers are already sent; dropping the connection tells the client to resume
+            logger.error(f"Error exporting articles after {after}: {e}")
+            raise
+        if not rows:
+            break
+        
+        for row in rows:
+            row['cursor'] = encode_cursor(row['created_at'], row['id'])
+        after = (rows[-1]['created_at'], rows[-1]['id'])
+        
+        if export_format == 'csv':
+            writer.writerows([row[column] for column in columns] for row in rows)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        else:
+            yield b''.join(dump_json(row) + b'\n' for row in rows)
+        
+        if len(rows) < EXPORT_BATCH_SIZE:
+            break
 
 # Startup event
 @app.on_event("startup")
@@ -88,11 +411,15 @@ async def startup_event():
     try:
         logger.info("Starting News API application...")
         
-        # Start the news fetcher scheduler
+        # Start the news fetcher scheduler (the initial fetch runs in the background)
         news_fetcher.start_scheduler()
         
-        logger.info("News API application started successfully")
+        # Build the in-memory read snapshot in the background (reads use disk until it is ready)
+        db.request_snapshot_refresh()
         
+        record_startup_timing('startup_complete_ms')
+        logger.info(f"News API application started successfully in {startup_timings['startup_complete_ms']}ms")
+    
     except Exception as e:
         logger.error(f"Error during startup: {e}")
         raise
@@ -107,8 +434,12 @@ async def shutdown_event():
         # Stop the scheduler
         news_fetcher.stop_scheduler()
         
-        logger.info("News API application shut down successfully")
+        # Drain the database executor and release pooled connections
+        async_db.shutdown()
+        db.close_all_connections()
         
+        logger.info("News API application shut down successfully")
+    
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
@@ -123,11 +454,16 @@ async def root():
         "endpoints": {
             "articles": "/articles - Get paginated news articles",
             "article_detail": "/articles/{id} - Get specific article by ID",
+            "facets": "/articles/facets - Article counts by publisher, category, language and published hour/day",
             "search": "/articles?search=query - Search articles",
             "stats": "/stats - Get database statistics",
             "health": "/health - Health check",
+            "metrics": "/metrics - Prometheus metrics for this worker process",
+            "ready": "/ready - Readiness (warm vs serving stale/empty data)",
             "scheduler": "/admin/scheduler - Get scheduler status",
-            "manual_fetch": "/admin/fetch - Manually trigger news fetch"
+            "cache": "/admin/cache - Get response cache statistics",
+            "manual_fetch": "/admin/fetch - Manually trigger news fetch",
+            "fetch_job": "/admin/fetch/{job_id} - Get fetch job status and stage timings"
         },
         "documentation": "/docs - Interactive API documentation"
     }
@@ -138,10 +474,11 @@ async def health_check():
     """Health check endpoint"""
     try:
         # Check database connection
-        stats = db.get_database_stats()
+        cached_stats, _ = await get_cached_stats()
+        stats = json.loads(cached_stats.body) if cached_stats else {}
         
         # Check scheduler status
-        scheduler_status = news_fetcher.get_scheduler_status()
+        scheduler_status = await async_db.run(news_fetcher.get_scheduler_status)
         
         return {
             "status": "healthy",
@@ -154,44 +491,169 @@ async def health_check():
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail="Service unhealthy")
 
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus text-format metrics for this worker process"""
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    # Collectors read table counters, so render on the database executor
+    body = await async_db.run(metrics.render)
+    return Response(content=body, media_type=METRICS_CONTENT_TYPE)
+
+# Readiness endpoint
+@app.get("/ready", response_model=Dict[str, Any])
+async def readiness_check(
+    require_warm: bool = Query(False, description="Respond 503 unless fresh data has been loaded")
+):
+    """Readiness: whether this instance serves fresh ('warm') or 'stale'/'empty' data"""
+    try:
+        readiness = await async_db.run(news_fetcher.get_readiness)
+        readiness['startup'] = startup_timings
+        status_code = 503 if require_warm and readiness['status'] != 'warm' else 200
+        return JSONResponse(content=readiness, status_code=status_code)
+    except Exception as e:
+        logger.error(f"Readiness check failed: {e}")
+        raise HTTPException(status_code=503, detail="Service not ready")
+
 # Get articles with pagination and filtering
 @app.get("/articles", response_model=PaginatedResponse)
 async def get_articles(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Items per page"),
-    search: Optional[str] = Query(None, description="Search in title and summary"),
+    search: Optional[str] = Query(None, description='Search in title and summary ("exact phrase", prefix*)'),
     date_from: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
-    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)")
+    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    sort: str = Query("date", pattern="^(date|relevance)$", description="Sort by date or search relevance (BM25)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from next_cursor; overrides page"),
+    include_total: bool = Query(True, description="Compute total_count/total_pages; false reports only has_more"),
+    collapse: bool = Query(False, description="One article per story: only the representative of each near-duplicate cluster")
 ):
     """Get paginated news articles with optional filtering"""
     try:
-        result = db.get_articles(
+        key = ('articles', page, limit, search, date_from, date_to, sort, cursor, include_total, collapse)
+        generation, last_modified = await async_db.get_data_version()
+        validators = make_validators(make_etag(generation, key), last_modified)
+        if is_not_modified(request, validators['ETag'], last_modified):
+            return Response(status_code=304, headers=validators)
+        
+        cached = response_cache.get(key, generation)
+        if cached is not None:
+            return cached_json_response(cached, 'HIT', validators, request, key)
+        
+        result = await async_db.get_articles(
             page=page,
             limit=limit,
             search=search,
             date_from=date_from,
-            date_to=date_to
+            date_to=date_to,
+            sort=sort,
+            cursor=cursor,
+            include_total=include_total,
+            collapse=collapse
         )
         
-        return PaginatedResponse(**result)
+        cached = CachedResponse(render_json(paginated_adapter, result))
+        response_cache.set(key, generation, cached)
+        return cached_json_response(cached, 'MISS', validators, request, key)
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting articles: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Bulk export of all matching articles
+@app.get("/articles/export")
+async def export_articles(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson (one JSON object per line) or csv"),
+    search: Optional[str] = Query(None, description='Search in title and summary ("exact phrase", prefix*)'),
+    date_from: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    include_content: bool = Query(False, description="Include full_content"),
+    cursor: Optional[str] = Query(None, description="Resume after the row carrying this cursor")
+):
+    """Stream every matching article, newest first, as NDJSON or CSV"""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    filters = {'search': search, 'date_from': date_from, 'date_to': date_to}
+    media_type = 'text/csv; charset=utf-8' if format == 'csv' else 'application/x-ndjson'
+    return StreamingResponse(
+        export_rows(format, include_content, filters, after),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="articles.{format}"'}
+    )
+
+# Facet counts for the /articles filters
+@app.get("/articles/facets", response_model=FacetsResponse)
+async def get_article_facets(
+    request: Request,
+    search: Optional[str] = Query(None, description='Search in title and summary ("exact phrase", prefix*)'),
+    date_from: Optional[str] = Query(None, description="Filter from date (YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="Filter to date (YYYY-MM-DD)"),
+    collapse: bool = Query(False, description="Count one article per story (cluster representatives only)"),
+    limit: int = Query(20, ge=1, le=1000, description="Values returned for publisher, category and language")
+):
+    """Count matching articles by publisher, category, language and published hour/day"""
+    try:
+        key = ('facets', search, date_from, date_to, collapse, limit)
+        generation, last_modified = await async_db.get_data_version()
+        validators = make_validators(make_etag(generation, key), last_modified)
+        if is_not_modified(request, validators['ETag'], last_modified):
+            return Response(status_code=304, headers=validators)
+        
+        cached = response_cache.get(key, generation)
+        if cached is not None:
+            return cached_json_response(cached, 'HIT', validators, request, key)
+        
+        result = await async_db.get_facets(
+            search=search,
+            date_from=date_from,
+            date_to=date_to,
+            collapse=collapse,
+            limit=limit
+        )
+        
+        cached = CachedResponse(render_json(facets_adapter, result))
+        response_cache.set(key, generation, cached)
+        return cached_json_response(cached, 'MISS', validators, request, key)
+    
+    except Exception as e:
+        logger.error(f"Error getting article facets: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 # Get specific article by ID
 @app.get("/articles/{article_id}", response_model=ArticleDetailResponse)
 async def get_article(
+    request: Request,
     article_id: int = Path(..., ge=1, description="Article ID")
 ):
     """Get a specific article by ID"""
     try:
-        article = db.get_article_by_id(article_id)
+        # Validate against the row version before loading and serializing the full article
+        version = await async_db.get_article_version(article_id)
+        
+        if not version:
+            raise HTTPException(status_code=404, detail="Article not found")
+        
+        last_modified = timestamp_from_db(version['updated_at'])
+        validators = make_validators(
+            make_etag(article_id, version['updated_at'], version['content_hash']), last_modified
+        )
+        if is_not_modified(request, validators['ETag'], last_modified):
+            return Response(status_code=304, headers=validators)
+        
+        article = await async_db.get_article_by_id(article_id)
         
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
         
-        return ArticleDetailResponse(**article)
+        return Response(content=render_json(article_detail_adapter, article),
+                        media_type='application/json', headers=validators)
     
     except HTTPException:
         raise
@@ -204,12 +666,12 @@ async def get_article(
 async def get_stats():
     """Get database and API statistics"""
     try:
-        stats = db.get_database_stats()
+        cached, cache_status = await get_cached_stats()
         
-        if not stats:
+        if cached is None:
             raise HTTPException(status_code=500, detail="Unable to retrieve statistics")
         
-        return StatsResponse(**stats)
+        return cached_json_response(cached, cache_status)
     
     except HTTPException:
         raise
@@ -222,7 +684,7 @@ async def get_stats():
 async def get_scheduler_status():
     """Get scheduler status and job information (Admin endpoint)"""
     try:
-        status = news_fetcher.get_scheduler_status()
+        status = await async_db.run(news_fetcher.get_scheduler_status, include_feeds=True)
         
         if 'error' in status:
             raise HTTPException(status_code=500, detail=status['error'])
@@ -236,11 +698,13 @@ async def get_scheduler_status():
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # Admin endpoint - Manual news fetch
-@app.post("/admin/fetch", response_model=ManualFetchResponse)
+@app.post("/admin/fetch", response_model=ManualFetchResponse, status_code=202)
 async def manual_fetch():
-    """Manually trigger news fetch (Admin endpoint)"""
+    """Manually trigger news fetch (Admin endpoint); returns a job id to poll"""
     try:
-        result = news_fetcher.manual_fetch()
+        # The fetch runs on its own thread; a trigger during a running fetch joins it.
+        # Starting a job stores its summary, so the call goes through the database executor
+        result = await async_db.run(news_fetcher.manual_fetch)
         
         if result['status'] == 'error':
             raise HTTPException(status_code=500, detail=result['message'])
@@ -253,33 +717,86 @@ async def manual_fetch():
         logger.error(f"Error in manual fetch: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Admin endpoint - Fetch job status
+@app.get("/admin/fetch/{job_id}", response_model=Dict[str, Any])
+async def get_fetch_job(job_id: str = Path(..., description="Job id returned by POST /admin/fetch")):
+    """Get the status, article counts and per-stage timings of a fetch job"""
+    job = await async_db.run(news_fetcher.get_fetch_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Fetch job not found")
+    return job
+
 # Admin endpoint - Manual cleanup
 @app.post("/admin/cleanup", response_model=Dict[str, Any])
 async def manual_cleanup():
     """Manually trigger database cleanup (Admin endpoint)"""
     try:
-        deleted_count = db.cleanup_old_articles()
+        # Batched deletes pause between transactions, so keep them off the database executor
+        result = await run_in_threadpool(db.cleanup_database)
         
         return {
             "status": "success",
             "message": f"Cleanup completed successfully",
-            "deleted_articles": deleted_count
+            **result
         }
     
     except Exception as e:
         logger.error(f"Error in manual cleanup: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+# Admin endpoint - Reconcile maintained statistics
+@app.post("/admin/stats/reconcile", response_model=Dict[str, Any])
+async def reconcile_stats():
+    """Recompute the incrementally maintained statistics and repair any drift (Admin endpoint)"""
+    try:
+        result = await async_db.reconcile_stats()
+        if result.get('error'):
+            raise HTTPException(status_code=500, detail=result['error'])
+        return result
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error reconciling stats: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+# Admin endpoint - Response cache statistics
+@app.get("/admin/cache", response_model=Dict[str, Any])
+async def get_cache_stats():
+    """Get response cache hit/miss/eviction counters (Admin endpoint)"""
+    return response_cache.get_stats()
+
 # Latest articles endpoint (convenience)
 @app.get("/latest", response_model=List[ArticleResponse])
 async def get_latest_articles(
-    limit: int = Query(10, ge=1, le=50, description="Number of latest articles")
+    request: Request,
+    limit: int = Query(10, ge=1, le=50, description="Number of latest articles"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header")
 ):
-    """Get latest articles (convenience endpoint)"""
+    """Get latest articles (convenience endpoint)
+    
+    The cursor for the following page is returned in the X-Next-Cursor header
+    so the response body stays a plain list.
+    """
     try:
-        result = db.get_articles(page=1, limit=limit)
-        return result['articles']
+        key = ('latest', limit, cursor)
+        generation, last_modified = await async_db.get_data_version()
+        validators = make_validators(make_etag(generation, key), last_modified)
+        if is_not_modified(request, validators['ETag'], last_modified):
+            return Response(status_code=304, headers=validators)
+        
+        cached = response_cache.get(key, generation)
+        if cached is not None:
+            return cached_json_response(cached, 'HIT', validators, request, key)
+        
+        result = await async_db.get_articles(page=1, limit=limit, cursor=cursor, include_total=False)
+        headers = {'X-Next-Cursor': result['next_cursor']} if result['next_cursor'] else {}
+        cached = CachedResponse(render_json(latest_articles_adapter, result['articles']), headers=headers)
+        response_cache.set(key, generation, cached)
+        return cached_json_response(cached, 'MISS', validators, request, key)
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting latest articles: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -294,6 +811,9 @@ async def global_exception_handler(request, exc):
         content={"detail": "Internal server error", "type": "server_error"}
     )
 
+# Module import (including database and fetcher setup) is done
+record_startup_timing('import_ms')
+
 # Run the application
 if __name__ == "__main__":
     import uvicorn
@@ -2,15 +2,27 @@ import http.client
 import json
 import os
 import time
+import codecs
+import queue
 import logging
-import datetime
+import threading
+import uuid
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from itertools import islice
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.events import (EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MISSED,
+                                EVENT_JOB_SUBMITTED, EVENT_JOB_MAX_INSTANCES)
 from dotenv import load_dotenv
 from database import db
+from leader import LeaderLock
+from metrics import metrics
+from normalize import ItemNormalizer
 
 # Load environment variables
 load_dotenv()
@@ -26,40 +38,461 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_UPSTREAM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_UPSTREAM_DURATION = metrics.histogram('upstream_request_duration_seconds',
+                                       'News API request latency, including streaming the body',
+                                       ['endpoint'], buckets=_UPSTREAM_BUCKETS)
+_UPSTREAM_RESPONSES = metrics.counter('upstream_responses_total',
+                                      'News API responses by status code ("error" for connection failures)',
+                                      ['endpoint', 'status'])
+_SCHEDULER_JOB_DURATION = metrics.histogram('scheduler_job_duration_seconds', 'Scheduler job run time',
+                                            ['job'], buckets=_UPSTREAM_BUCKETS)
+_SCHEDULER_JOB_RUNS = metrics.counter('scheduler_job_runs_total',
+                                      'Scheduler job runs by result (success, error, skipped)', ['job', 'result'])
+_SCHEDULER_JOB_MISFIRES = metrics.counter('scheduler_job_misfires_total',
+                                          'Scheduler runs missed past their misfire grace time', ['job'])
+_FETCH_JOBS = metrics.counter('fetch_jobs_total', 'Fetch jobs by trigger and final status', ['trigger', 'status'])
+_FETCH_STAGE_SECONDS = metrics.counter('fetch_stage_seconds_total',
+                                       'Worker seconds spent per fetch stage (network, parse, write)', ['stage'])
+_FETCH_ARTICLES = metrics.counter('fetch_articles_total', 'Articles processed by fetch jobs', ['outcome'])
+_FETCH_REJECTS = metrics.counter('fetch_rejects_total', 'Upstream items rejected by the normalizer', ['reason'])
+_FEED_POLLS = metrics.counter('feed_polls_total',
+                              'Feed poll cycles by outcome (fetched, not_modified, skipped, error)', ['outcome'])
+
+# A feed counts as due this close to its next fetch time, so tick jitter never costs a whole interval
+_POLL_SLACK_SECONDS = 5
+
 class NewsAPIError(Exception):
     """Custom exception for news API errors"""
     pass
 
+_json_decoder = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+
+def iter_json_array(chunks: Iterable[bytes], key: str, meta: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Incrementally yield the elements of one array member of a top-level JSON object
+    
+    ``chunks`` is any iterable of raw bytes (e.g. successive ``response.read(n)``
+    calls). Only the current element is held in memory, never the whole document.
+    Other top-level members are decoded and stored in ``meta`` as they are passed.
+    Raises ValueError on malformed or truncated input.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buf = ''
+    pos = 0
+    eof = False
+    
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            buf = buf[pos:] + decoder.decode(b'', final=True)
+        else:
+            buf = buf[pos:] + decoder.decode(chunk)
+        pos = 0
+        return chunk is not None
+    
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _JSON_WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                raise ValueError("Unexpected end of JSON input")
+    
+    def take(expected: str) -> str:
+        nonlocal pos
+        char = peek()
+        if char not in expected:
+            raise ValueError(f"Expected one of {expected!r} but found {char!r}")
+        pos += 1
+        return char
+    
+    def value() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                obj, end = _json_decoder.raw_decode(buf, pos)
+                # A value touching the end of the buffer may be a truncated number
+                if end < len(buf) or eof:
+                    pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            fill()
+    
+    take('{')
+    if peek() == '}':
+        return
+    while True:
+        name = value()
+        take(':')
+        if name == key and peek() == '[':
+            take('[')
+            if peek() == ']':
+                take(']')
+            else:
+                while True:
+                    yield value()
+                    if take(',]') == ']':
+                        break
+        else:
+            member = value()
+            if meta is not None:
+                meta[name] = member
+        if take(',}') == '}':
+            return
+
+def parse_feeds(value: str, default_endpoint: str, default_language: str) -> List[Dict[str, str]]:
+    """Parse a NEWS_FEEDS value into feed definitions
+    
+    Entries are comma separated as ``endpoint[:language[:category]]``, e.g.
+    ``/business:en-US,/technology:en-GB,/world:de-DE:world``. The category
+    defaults to the endpoint name. An empty value yields the single legacy
+    NEWS_ENDPOINT/NEWS_LANGUAGE feed.
+    """
+    feeds = []
+    for entry in (value or '').split(','):
+        parts = [part.strip() for part in entry.strip().split(':')]
+        if not parts[0]:
+            continue
+        endpoint = parts[0] if parts[0].startswith('/') else '/' + parts[0]
+        language = parts[1] if len(parts) > 1 and parts[1] else default_language
+        category = parts[2] if len(parts) > 2 and parts[2] else endpoint.strip('/').split('/')[-1] or 'business'
+        feeds.append({'endpoint': endpoint, 'language': language, 'category': category})
+    
+    if not feeds:
+        feeds.append({
+            'endpoint': default_endpoint,
+            'language': default_language,
+            'category': default_endpoint.strip('/').split('/')[-1] or 'business'
+        })
+    return feeds
+
+def feed_key(feed: Dict[str, str]) -> str:
+    """Request path identifying a feed in api_logs and feed_state"""
+    return f"{feed['endpoint']}?lr={feed['language']}"
+
+@contextmanager
+def timed(timings: Dict[str, float], stage: str):
+    """Add the time spent inside the block to timings[stage]"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - started
+
+class HostConnectionPool:
+    """Keep-alive HTTP(S) connections shared by fetch workers, pooled per host"""
+    
+    def __init__(self, scheme: str, timeout: int, max_idle_per_host: int = 4):
+        self.connection_class = http.client.HTTPConnection if scheme == 'http' else http.client.HTTPSConnection
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[str, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, host: str) -> Tuple[http.client.HTTPConnection, bool]:
+        """Take an idle connection to host, or open a new one; also reports whether it was reused"""
+        with self._lock:
+            idle = self._idle.get(host)
+            if idle:
+                return idle.pop(), True
+        return self.connection_class(host, timeout=self.timeout), False
+    
+    def release(self, host: str, conn: http.client.HTTPConnection, reusable: bool = True):
+        """Return a connection whose response was fully read; anything else is closed"""
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(host, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(conn)
+                    return
+        conn.close()
+    
+    def close_all(self):
+        """Close every idle connection"""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle.clear()
+
+class HostRateLimiter:
+    """Spaces requests to the same host at least 1/requests_per_second apart"""
+    
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def wait(self, host: str):
+        """Block until the caller may send the next request to host"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class PollPolicy:
+    """Per-feed poll intervals driven by the share of new URLs in recent fetches
+    
+    A fetch's yield is the share of its items that were new URLs (0 for a 304),
+    smoothed over recent fetches. Feeds yielding at least ``high`` are polled
+    twice as often and feeds yielding at most ``low`` 1.5x less often, always
+    within [min_seconds, max_seconds]. The smoothed yield is rescaled with the
+    interval, so it keeps predicting the next fetch's yield instead of lagging
+    behind and overshooting.
+    """
+    
+    SPEED_UP = 0.5
+    SLOW_DOWN = 1.5
+    # Weight of the latest fetch in the smoothed yield
+    SMOOTHING = 0.5
+    
+    def __init__(self, min_seconds: float, max_seconds: float, initial_seconds: float, low: float, high: float):
+        self.min_seconds = min_seconds
+        self.max_seconds = max(max_seconds, min_seconds)
+        self.initial_seconds = self.clamp(initial_seconds)
+        self.low = low
+        self.high = high
+    
+    def clamp(self, seconds: float) -> float:
+        return min(self.max_seconds, max(self.min_seconds, seconds))
+    
+    def update(self, interval: float, smoothed: Optional[float], new_items: int, items: int) -> Tuple[float, float]:
+        """Next (interval, smoothed yield) after a fetch of items of which new_items were new URLs"""
+        ratio = new_items / items if items else 0.0
+        smoothed = ratio if smoothed is None else self.SMOOTHING * ratio + (1 - self.SMOOTHING) * smoothed
+        if smoothed >= self.high:
+            next_interval = self.clamp(interval * self.SPEED_UP)
+        elif smoothed <= self.low:
+            next_interval = self.clamp(interval * self.SLOW_DOWN)
+        else:
+            next_interval = interval
+        return next_interval, min(1.0, smoothed * next_interval / interval)
+
+class FetchJob:
+    """One fetch run, shared by every trigger that arrives while it is in progress
+    
+    Stage timings are seconds summed over the feed workers: ``network`` covers
+    rate-limit waits, connecting, retries and reading the body, ``parse`` the
+    JSON decoding and normalization, ``write`` the database batches. ``targets``
+    limits the run to some feeds (None means all); ``polled_at`` is the poll
+    time the feeds' next fetch times are counted from. A ``queued`` job waits
+    behind the running one and starts its clock when it begins.
+    """
+    
+    def __init__(self, trigger: str, targets: Optional[List[Dict[str, str]]] = None,
+                 polled_at: Optional[float] = None, queued: bool = False):
+        self.id = uuid.uuid4().hex[:16]
+        self.trigger = trigger
+        self.targets = targets
+        self.status = 'queued' if queued else 'running'
+        self.started_at = time.time()
+        self._polled_at_given = polled_at is not None
+        self.polled_at = polled_at if polled_at is not None else self.started_at
+        self.finished_at: Optional[float] = None
+        self.coalesced = 0
+        self.feeds = {'succeeded': 0, 'failed': 0, 'not_modified': 0}
+        self.counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        self.timings = {'network': 0.0, 'parse': 0.0, 'write': 0.0}
+        self.rejects: Dict[str, int] = {}
+        self.errors: List[str] = []
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+    
+    def begin(self) -> bool:
+        """Move a queued job to running, timing it from now; False if it was not queued"""
+        with self._lock:
+            if self.status != 'queued':
+                return False
+            self.status = 'running'
+            self.started_at = time.time()
+            if not self._polled_at_given:
+                self.polled_at = self.started_at
+            return True
+    
+    def add_targets(self, feeds: List[Dict[str, str]]):
+        """Widen a queued job to more feeds (it already fetches all of them when targets is None)"""
+        with self._lock:
+            if self.targets is None:
+                return
+            known = {feed_key(feed) for feed in self.targets}
+            self.targets = self.targets + [feed for feed in feeds if feed_key(feed) not in known]
+    
+    def add_timings(self, timings: Dict[str, float]):
+        with self._lock:
+            for stage, seconds in timings.items():
+                self.timings[stage] += seconds
+    
+    def add_rejects(self, rejects: Dict[str, int]):
+        with self._lock:
+            for reason, count in rejects.items():
+                self.rejects[reason] = self.rejects.get(reason, 0) + count
+    
+    def record_feed(self, error: Optional[str] = None, not_modified: bool = False):
+        with self._lock:
+            if error:
+                self.feeds['failed'] += 1
+                self.errors.append(error)
+            else:
+                self.feeds['succeeded'] += 1
+                if not_modified:
+                    self.feeds['not_modified'] += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                'job_id': self.id,
+                'trigger': self.trigger,
+                'status': self.status,
+                'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+                'finished_at': datetime.fromtimestamp(self.finished_at).isoformat() if self.finished_at else None,
+                'coalesced_triggers': self.coalesced,
+                'feeds': dict(self.feeds),
+                'articles': dict(self.counts),
+                'rejects': dict(self.rejects),
+                'timings': {
+                    'network_seconds': round(self.timings['network'], 3),
+                    'parse_seconds': round(self.timings['parse'], 3),
+                    'write_seconds': round(self.timings['write'], 3),
+                    'total_seconds': round(end - self.started_at, 3)
+                },
+                'errors': list(self.errors)
+            }
+
 class NewsFetcher:
     def __init__(self):
         self.rapidapi_key = os.getenv('RAPIDAPI_KEY')
         self.rapidapi_host = os.getenv('RAPIDAPI_HOST', 'google-news13.p.rapidapi.com')
+        self.api_scheme = os.getenv('NEWS_API_SCHEME', 'https').lower()
         self.news_endpoint = os.getenv('NEWS_ENDPOINT', '/business')
         self.news_language = os.getenv('NEWS_LANGUAGE', 'en-US')
+        self.feeds = parse_feeds(os.getenv('NEWS_FEEDS', ''), self.news_endpoint, self.news_language)
+        self.fetch_workers = int(os.getenv('FETCH_WORKERS', '4'))
+        self.rate_limit_per_second = float(os.getenv('RATE_LIMIT_PER_SECOND', '5'))
         self.connection_timeout = int(os.getenv('CONNECTION_TIMEOUT', '30'))
         self.read_timeout = int(os.getenv('READ_TIMEOUT', '30'))
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
         self.include_subnews = os.getenv('INCLUDE_SUBNEWS', 'True').lower() == 'true'
         self.max_articles_per_fetch = int(os.getenv('MAX_ARTICLES_PER_FETCH', '1000'))
+        self.ingest_batch_size = int(os.getenv('INGEST_BATCH_SIZE', '500'))
+        self.stream_chunk_size = int(os.getenv('STREAM_CHUNK_SIZE', '65536'))
         
         if not self.rapidapi_key:
             raise ValueError("RAPIDAPI_KEY is required in environment variables")
         
+        self.connection_pool = HostConnectionPool(self.api_scheme, self.connection_timeout,
+                                                  max_idle_per_host=self.fetch_workers)
+        self.rate_limiter = HostRateLimiter(self.rate_limit_per_second)
+        
+        # Only the process holding the leader lock runs fetch/cleanup jobs
+        self.leader_election = os.getenv('SCHEDULER_LEADER_ELECTION', 'True').lower() == 'true'
+        self.leader_check_seconds = int(os.getenv('LEADER_CHECK_SECONDS', '30'))
+        self.leader_lock = LeaderLock(os.getenv('SCHEDULER_LOCK_FILE') or f"{db.db_path}.scheduler.lock")
+        
+        # Adaptive polling: each feed's interval moves within these bounds with its share of new
+        # URLs; a scheduler tick every FETCH_INTERVAL_MIN_MINUTES fetches the feeds that are due
+        self.fetch_interval_hours = int(os.getenv('FETCH_INTERVAL_HOURS', '2'))
+        self.adaptive_polling = os.getenv('ADAPTIVE_POLLING', 'True').lower() == 'true'
+        self.conditional_requests = os.getenv('CONDITIONAL_REQUESTS', 'True').lower() == 'true'
+        self.poll_policy = PollPolicy(
+            min_seconds=float(os.getenv('FETCH_INTERVAL_MIN_MINUTES', '15')) * 60,
+            max_seconds=float(os.getenv('FETCH_INTERVAL_MAX_HOURS') or 2 * self.fetch_interval_hours) * 3600,
+            initial_seconds=self.fetch_interval_hours * 3600,
+            low=float(os.getenv('FETCH_YIELD_LOW', '0.1')),
+            high=float(os.getenv('FETCH_YIELD_HIGH', '0.5'))
+        )
+        
+        # Readiness: data older than this (default two of the longest fetch intervals) is reported as stale
+        longest_interval_hours = (self.poll_policy.max_seconds / 3600 if self.adaptive_polling
+                                  else self.fetch_interval_hours)
+        self.ready_max_data_age_hours = float(os.getenv('READY_MAX_DATA_AGE_HOURS')
+                                              or 2 * longest_interval_hours)
+        self.initial_fetch_state = 'pending'
+        self.last_fetch_completed_at: Optional[float] = None
+        
+        # Fetch jobs: concurrent triggers join the running job, or a follow-up queued behind it
+        # for feeds it does not cover; the file lock stops other worker processes from
+        # starting an overlapping fetch
+        self.fetch_job_history = int(os.getenv('FETCH_JOB_HISTORY', '50'))
+        self.fetch_jobs: "OrderedDict[str, FetchJob]" = OrderedDict()
+        self._current_fetch: Optional[FetchJob] = None
+        self._queued_fetch: Optional[FetchJob] = None
+        self._fetch_lock = threading.Lock()
+        self.fetch_file_lock = LeaderLock(f"{db.db_path}.fetch.lock")
+        
         self.scheduler = BackgroundScheduler()
+        self._job_started: Dict[str, float] = {}
         self.setup_scheduler()
     
+    @property
+    def leader_id(self) -> str:
+        return f"{self.leader_lock.hostname}:{os.getpid()}"
+    
+    @property
+    def is_leader(self) -> bool:
+        return not self.leader_election or self.leader_lock.is_leader
+    
     def setup_scheduler(self):
-        """Setup background scheduler for fetching news and cleanup"""
+        """Setup background scheduler; fetch/cleanup jobs are added once this process leads"""
         try:
-            # Schedule news fetching
-            fetch_interval = int(os.getenv('FETCH_INTERVAL_HOURS', '2'))
-            self.scheduler.add_job(
-                func=self.fetch_and_store_news,
-                trigger=IntervalTrigger(hours=fetch_interval),
-                id='fetch_news',
-                name='Fetch News from API',
-                replace_existing=True
-            )
+            self.scheduler.add_listener(self._record_job_event,
+                                        EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR |
+                                        EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES)
+            if self.leader_election:
+                self.scheduler.add_job(
+                    func=self.leader_tick,
+                    trigger=IntervalTrigger(seconds=self.leader_check_seconds),
+                    id='leader_election',
+                    name='Scheduler Leader Election',
+                    replace_existing=True
+                )
+                self.scheduler.add_listener(self._publish_state,
+                                            EVENT_JOB_EXECUTED | EVENT_JOB_ERROR | EVENT_JOB_MISSED)
+                logger.info(f"Scheduler leader election enabled (lock {self.leader_lock.path}, "
+                            f"checked every {self.leader_check_seconds}s)")
+            else:
+                self.add_leader_jobs()
+        except Exception as e:
+            logger.error(f"Error setting up scheduler: {e}")
+            raise
+    
+    def add_leader_jobs(self):
+        """Schedule news fetching and daily cleanup"""
+        try:
+            # Schedule news fetching: a fixed interval, or a tick that polls whichever feeds are due
+            if self.adaptive_polling:
+                fetch_schedule = f"Poll due feeds every {self.poll_policy.min_seconds / 60:g}min"
+                self.scheduler.add_job(
+                    func=self.poll_feeds,
+                    trigger=IntervalTrigger(seconds=self.poll_policy.min_seconds),
+                    id='fetch_news',
+                    name='Poll News Feeds',
+                    replace_existing=True
+                )
+            else:
+                fetch_schedule = f"Fetch every {self.fetch_interval_hours}h"
+                self.scheduler.add_job(
+                    func=self.fetch_and_store_news,
+                    trigger=IntervalTrigger(hours=self.fetch_interval_hours),
+                    id='fetch_news',
+                    name='Fetch News from API',
+                    replace_existing=True
+                )
             
             # Schedule daily cleanup
             cleanup_hour = int(os.getenv('CLEANUP_HOUR', '0'))
@@ -72,21 +505,96 @@ class NewsFetcher:
                 replace_existing=True
             )
             
-            logger.info(f"Scheduler configured: Fetch every {fetch_interval}h, Cleanup daily at {cleanup_hour:02d}:{cleanup_minute:02d}")
-            
+            logger.info(f"Scheduler configured: {fetch_schedule}, Cleanup daily at {cleanup_hour:02d}:{cleanup_minute:02d}")
+        
         except Exception as e:
             logger.error(f"Error setting up scheduler: {e}")
             raise
     
+    def try_become_leader(self) -> bool:
+        """Acquire the leader lock if it is free; returns True only on a new acquisition"""
+        if not self.leader_election or self.leader_lock.is_leader:
+            return False
+        if not self.leader_lock.acquire():
+            return False
+        
+        logger.info(f"Acquired scheduler leadership ({self.leader_id})")
+        self.add_leader_jobs()
+        self._publish_state()
+        return True
+    
+    def leader_tick(self):
+        """Periodic election job: followers try to take over, the leader refreshes its heartbeat"""
+        try:
+            if self.leader_lock.is_leader:
+                self._publish_state()
+            elif self.try_become_leader():
+                # Taking over from a leader that died; don't wait a full interval for fresh data
+                self.schedule_initial_fetch()
+        except Exception as e:
+            logger.error(f"Error in leader election: {e}")
+    
+    def _record_job_event(self, event):
+        """Feed scheduler job durations, results and misfires into /metrics"""
+        if event.code == EVENT_JOB_SUBMITTED:
+            self._job_started[event.job_id] = time.perf_counter()
+        elif event.code == EVENT_JOB_MISSED:
+            _SCHEDULER_JOB_MISFIRES.inc(event.job_id)
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            _SCHEDULER_JOB_RUNS.inc(event.job_id, 'skipped')
+        else:
+            started = self._job_started.pop(event.job_id, None)
+            if started is not None:
+                _SCHEDULER_JOB_DURATION.observe(time.perf_counter() - started, event.job_id)
+            _SCHEDULER_JOB_RUNS.inc(event.job_id, 'error' if event.exception else 'success')
+    
+    def _publish_state(self, event=None):
+        """Share this leader's job status so followers can report it"""
+        if not self.leader_election or not self.leader_lock.is_leader:
+            return
+        status = self._local_scheduler_status()
+        db.save_scheduler_state(self.leader_id, {
+            'jobs': status['jobs'],
+            'timezone': status['timezone'],
+            'last_fetch_at': self.last_fetch_completed_at
+        })
+    
+    def schedule_initial_fetch(self):
+        """Queue a one-off fetch on the scheduler's thread pool so callers never wait on the upstream"""
+        self.initial_fetch_state = 'scheduled'
+        self.scheduler.add_job(
+            func=self._run_initial_fetch,
+            id='initial_fetch',
+            name='Initial News Fetch',
+            replace_existing=True
+        )
+    
+    def _run_initial_fetch(self):
+        self.initial_fetch_state = 'running'
+        try:
+            if self.adaptive_polling:
+                # Feeds polled recently by a previous process are not refetched on restart
+                self.poll_feeds('initial')
+            else:
+                self.fetch_and_store_news('initial')
+        finally:
+            self.initial_fetch_state = 'completed'
+    
     def start_scheduler(self):
-        """Start the background scheduler"""
+        """Start the background scheduler; the leader's initial fetch runs in the background"""
         try:
             if not self.scheduler.running:
                 self.scheduler.start()
                 logger.info("News fetcher scheduler started successfully")
                 
-                # Run initial fetch
-                self.fetch_and_store_news()
+                self.try_become_leader()
+                if not self.is_leader:
+                    self.initial_fetch_state = 'follower'
+                    logger.info("Another process leads the scheduler; running as follower")
+                    return
+                
+                # Run initial fetch without holding up startup
+                self.schedule_initial_fetch()
             else:
                 logger.info("Scheduler is already running")
         except Exception as e:
@@ -94,276 +602,674 @@ class NewsFetcher:
             raise
     
     def stop_scheduler(self):
-        """Stop the background scheduler"""
+        """Stop the background scheduler and hand leadership to another process"""
         try:
             if self.scheduler.running:
                 self.scheduler.shutdown()
                 logger.info("News fetcher scheduler stopped")
+            if self.leader_lock.is_leader:
+                db.clear_scheduler_state(self.leader_id)
+                self.leader_lock.release()
+                logger.info("Released scheduler leadership")
+            self.connection_pool.close_all()
         except Exception as e:
             logger.error(f"Error stopping scheduler: {e}")
     
-    def fetch_news_from_api(self) -> Optional[Dict[str, Any]]:
-        """Fetch news from external API with retry logic"""
+    def _open_response(self, path: str,
+                       headers: Dict[str, str]) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a GET over a pooled keep-alive connection and return it with the unread response
+        
+        A pooled connection the server already closed is retried once on a fresh one.
+        The caller must hand the connection back via connection_pool.release.
+        """
+        while True:
+            conn, reused = self.connection_pool.acquire(self.rapidapi_host)
+            try:
+                conn.request("GET", path, headers=headers)
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+    
+    @staticmethod
+    def _observe_upstream(endpoint_url: str, status: Any, response_time: float):
+        _UPSTREAM_DURATION.observe(response_time, endpoint_url)
+        _UPSTREAM_RESPONSES.inc(endpoint_url, str(status))
+    
+    def item_normalizer(self, feed: Dict[str, str]) -> ItemNormalizer:
+        """Normalizer for raw API items (and their subnews) tagging rows with the feed's language/category"""
+        return ItemNormalizer(feed['language'], feed['category'], self.include_subnews)
+    
+    @staticmethod
+    def _report_rejects(feed: Dict[str, str], rejects: Dict[str, int]):
+        """One warning per feed for the items the normalizer rejected, by reason"""
+        rejected = {reason: count for reason, count in rejects.items() if count}
+        if rejected:
+            logger.warning(f"Rejected {sum(rejected.values())} item(s) from {feed_key(feed)}: {rejected}")
+    
+    def stream_news_items(self, feed: Dict[str, str], timings: Optional[Dict[str, float]] = None,
+                          conditional: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield raw items from one feed as they are parsed off the response stream
+        
+        Retries (with exponential backoff) happen only until a 200 response starts
+        streaming. Closing the generator early closes the connection instead of
+        downloading the rest of the body. Time spent waiting on the upstream is
+        added to timings['network'].
+        
+        Items stream once the response's ``status`` member is 'success'; items that
+        come before it are held until it is read. A missing or other status raises
+        NewsAPIError after the body is parsed.
+        
+        ``conditional['etag']`` / ``['last_modified']`` are sent as If-None-Match /
+        If-Modified-Since and replaced by the response's validators; a 304 yields
+        nothing and sets ``conditional['not_modified']``.
+        """
+        timings = timings if timings is not None else {}
         headers = {
             'x-rapidapi-key': self.rapidapi_key,
             'x-rapidapi-host': self.rapidapi_host
         }
+        if conditional is not None:
+            if conditional.get('etag'):
+                headers['If-None-Match'] = conditional['etag']
+            if conditional.get('last_modified'):
+                headers['If-Modified-Since'] = conditional['last_modified']
         
-        endpoint_url = f"{self.news_endpoint}?lr={self.news_language}"
+        endpoint_url = feed_key(feed)
         
         for attempt in range(self.max_retries):
+            with timed(timings, 'network'):
+                self.rate_limiter.wait(self.rapidapi_host)
             start_time = time.time()
-            conn = None
             
             try:
-                logger.info(f"Fetching news from API (attempt {attempt + 1}/{self.max_retries})")
-                
-                conn = http.client.HTTPSConnection(self.rapidapi_host, timeout=self.connection_timeout)
-                conn.request("GET", endpoint_url, headers=headers)
-                
-                response = conn.getresponse()
-                response_time = time.time() - start_time
-                
-                if response.status == 200:
-                    data = response.read()
-                    response_data = json.loads(data.decode("utf-8"))
-                    
-                    logger.info(f"Successfully fetched news data in {response_time:.2f}s")
-                    
-                    # Log successful API call
-                    articles_count = len(response_data.get('articles', [])) if isinstance(response_data, dict) else 0
-                    db.log_api_call(endpoint_url, response.status, response_time, articles_count)
-                    
-                    return response_data
-                
-                elif response.status == 429:
-                    logger.warning(f"Rate limit exceeded (429). Attempt {attempt + 1}")
-                    if attempt < self.max_retries - 1:
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        logger.info(f"Waiting {wait_time}s before retry...")
-                        time.sleep(wait_time)
+                logger.info(f"Streaming {endpoint_url} from API (attempt {attempt + 1}/{self.max_retries})")
+                with timed(timings, 'network'):
+                    conn, response = self._open_response(endpoint_url, headers)
+            except Exception as e:
+                logger.error(f"Connection error: {e}")
+                self._observe_upstream(endpoint_url, 'error', time.time() - start_time)
+                if attempt < self.max_retries - 1:
+                    with timed(timings, 'network'):
+                        time.sleep(2 ** attempt)
                     continue
+                raise NewsAPIError(f"Connection failed after {self.max_retries} attempts: {e}")
+            
+            if response.status == 304 and conditional is not None:
+                # Reading the (empty) body finishes the response so the connection can send again
+                response.read()
+                self.connection_pool.release(self.rapidapi_host, conn, reusable=not response.will_close)
+                response_time = time.time() - start_time
+                self._observe_upstream(endpoint_url, response.status, response_time)
+                logger.info(f"{endpoint_url} not modified since the last fetch")
+                db.log_api_call(endpoint_url, response.status, response_time, 0, 'not_modified')
+                conditional['not_modified'] = True
+                return
+            
+            if response.status != 200:
+                with timed(timings, 'network'):
+                    response.read()
+                self.connection_pool.release(self.rapidapi_host, conn, reusable=not response.will_close)
+                response_time = time.time() - start_time
+                self._observe_upstream(endpoint_url, response.status, response_time)
                 
+                if response.status == 429:
+                    logger.warning(f"Rate limit exceeded (429) for {endpoint_url}. Attempt {attempt + 1}")
                 else:
-                    error_msg = f"API request failed with status {response.status}"
-                    logger.error(error_msg)
-                    
-                    # Log failed API call
-                    db.log_api_call(endpoint_url, response.status, response_time, 0)
-                    
-                    if attempt < self.max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    else:
-                        raise NewsAPIError(error_msg)
-            
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
+                    logger.error(f"API request for {endpoint_url} failed with status {response.status}")
+                    db.log_api_call(endpoint_url, response.status, response_time, 0, 'error')
+                
                 if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    with timed(timings, 'network'):
+                        time.sleep(2 ** attempt)
                     continue
-                else:
-                    raise NewsAPIError(f"Invalid JSON response: {e}")
+                raise NewsAPIError(f"API request for {endpoint_url} failed with status {response.status}")
             
-            except Exception as e:
-                logger.error(f"Connection error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                else:
-                    raise NewsAPIError(f"Connection failed after {self.max_retries} attempts: {e}")
+            if conditional is not None:
+                conditional['etag'] = response.getheader('ETag')
+                conditional['last_modified'] = response.getheader('Last-Modified')
+            
+            meta: Dict[str, Any] = {}
+            items_count = 0
+            completed = False
+            rejected = False
+            # Items parsed before the status member, held until it shows they may be stored
+            held: List[Any] = []
+            
+            def read_chunk() -> bytes:
+                with timed(timings, 'network'):
+                    return response.read(self.stream_chunk_size)
             
+            try:
+                chunks = iter(read_chunk, b'')
+                for item in iter_json_array(chunks, 'items', meta):
+                    if 'status' not in meta:
+                        held.append(item)
+                        continue
+                    if meta['status'] != 'success':
+                        break
+                    items_count += 1
+                    yield item
+                else:
+                    completed = True
+                
+                # The whole object has been read by now, so a missing status really is missing
+                if meta.get('status') != 'success':
+                    rejected = True
+                    logger.warning(f"API returned non-success status for {endpoint_url}: {meta.get('status')}")
+                    raise NewsAPIError(f"API returned status {meta.get('status')!r} for {endpoint_url}")
+                for item in held:
+                    items_count += 1
+                    yield item
+            except ValueError as e:
+                raise NewsAPIError(f"Invalid JSON response from {endpoint_url}: {e}")
             finally:
-                if conn:
-                    conn.close()
-        
-        return None
+                # Only a fully consumed body leaves the connection reusable
+                self.connection_pool.release(self.rapidapi_host, conn,
+                                             reusable=completed and not response.will_close)
+                response_time = time.time() - start_time
+                self._observe_upstream(endpoint_url, response.status, response_time)
+                logger.info(f"Streamed {items_count} items from {endpoint_url} in {response_time:.2f}s")
+                db.log_api_call(endpoint_url, response.status, response_time, items_count,
+                                'error' if rejected else 'fetched')
+            return
     
-    def parse_news_data(self, raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Parse and normalize news data from API response"""
-        articles = []
+    def iter_feed_batches(self, feed: Dict[str, str], timings: Optional[Dict[str, float]] = None,
+                          conditional: Optional[Dict[str, Any]] = None,
+                          rejects: Optional[Dict[str, int]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream, normalize and batch one feed, stopping at max_articles_per_fetch
+        
+        Raw items are normalized ingest_batch_size at a time. Fills timings['network']
+        and timings['parse']; parse time is the time spent producing each batch minus
+        the network time within it. ``conditional`` is passed to stream_news_items and
+        rejected items are added to ``rejects`` per reason.
+        """
+        timings = timings if timings is not None else {}
+        timings.setdefault('network', 0.0)
+        timings.setdefault('parse', 0.0)
+        items = self.stream_news_items(feed, timings, conditional)
+        normalizer = self.item_normalizer(feed)
+        size = self.ingest_batch_size
+        pending: List[Dict[str, Any]] = []
+        remaining = self.max_articles_per_fetch
+        batch_started, network_before = time.perf_counter(), timings['network']
+        
+        def charge_parse():
+            timings['parse'] += (time.perf_counter() - batch_started) - (timings['network'] - network_before)
         
         try:
-            # Check if response is successful
-            if not isinstance(raw_data, dict):
-                logger.warning("Unexpected response format")
-                return articles
-            
-            # Check status
-            if raw_data.get('status') != 'success':
-                logger.warning(f"API returned non-success status: {raw_data.get('status')}")
-                return articles
-            
-            # Get items from the response
-            news_items = raw_data.get('items', [])
-            if not news_items:
-                logger.warning("No items found in API response")
-                return articles
-            
-            for item in news_items:
-                try:
-                    # Convert timestamp to readable date format
-                    timestamp = item.get('timestamp', '')
-                    published_date = ''
-                    if timestamp:
-                        try:
-                            # Convert timestamp (milliseconds) to datetime
-                            import datetime
-                            dt = datetime.datetime.fromtimestamp(int(timestamp) / 1000)
-                            published_date = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except (ValueError, TypeError):
-                            published_date = str(timestamp)
-                    
-                    # Extract thumbnail from images object
-                    thumbnail = ''
-                    images = item.get('images', {})
-                    if isinstance(images, dict):
-                        # Try thumbnailProxied first, then thumbnail
-                        thumbnail = images.get('thumbnailProxied', images.get('thumbnail', ''))
-                    
-                    # Normalize article data according to the actual API structure
-                    article = {
-                        'title': item.get('title', '').strip(),
-                        'url': item.get('newsUrl', '').strip(),
-                        'publisher': item.get('publisher', '').strip(),
-                        'published_date': published_date,
-                        'summary': item.get('snippet', '').strip(),
-                        'thumbnail': thumbnail.strip(),
-                        'language': self.news_language,
-                        'category': 'business',
-                        'full_content': ''  # This API doesn't provide full content
-                    }
-                    
-                    # Skip articles with missing essential fields
-                    if not article['title'] or not article['url']:
-                        logger.warning(f"Skipping article with missing title or URL")
-                        continue
-                    
-                    articles.append(article)
-                    
-                    # Also process subnews if available
-                    subnews = item.get('subnews', [])
-                    if isinstance(subnews, list) and item.get('hasSubnews', False):
-                        for subitem in subnews:
-                            try:
-                                # Convert subnews timestamp
-                                sub_timestamp = subitem.get('timestamp', '')
-                                sub_published_date = ''
-                                if sub_timestamp:
-                                    try:
-                                        dt = datetime.datetime.fromtimestamp(int(sub_timestamp) / 1000)
-                                        sub_published_date = dt.strftime('%Y-%m-%d %H:%M:%S')
-                                    except (ValueError, TypeError):
-                                        sub_published_date = str(sub_timestamp)
-                                
-                                # Extract subnews thumbnail
-                                sub_thumbnail = ''
-                                sub_images = subitem.get('images', {})
-                                if isinstance(sub_images, dict):
-                                    sub_thumbnail = sub_images.get('thumbnailProxied', sub_images.get('thumbnail', ''))
-                                
-                                sub_article = {
-                                    'title': subitem.get('title', '').strip(),
-                                    'url': subitem.get('newsUrl', '').strip(),
-                                    'publisher': subitem.get('publisher', '').strip(),
-                                    'published_date': sub_published_date,
-                                    'summary': subitem.get('snippet', '').strip(),
-                                    'thumbnail': sub_thumbnail.strip(),
-                                    'language': self.news_language,
-                                    'category': 'business',
-                                    'full_content': ''
-                                }
-                                
-                                if sub_article['title'] and sub_article['url']:
-                                    articles.append(sub_article)
-                                    
-                            except Exception as e:
-                                logger.warning(f"Error parsing subnews item: {e}")
-                                continue
-                    
-                except Exception as e:
-                    logger.warning(f"Error parsing article: {e}")
-                    continue
-            
-            logger.info(f"Successfully parsed {len(articles)} articles")
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Error parsing news data: {e}")
+            while remaining > 0:
+                chunk = list(islice(items, size))
+                if not chunk:
+                    break
+                rows = normalizer.normalize(chunk)[:remaining]
+                remaining -= len(rows)
+                pending.extend(rows)
+                while len(pending) >= size:
+                    batch, pending = pending[:size], pending[size:]
+                    charge_parse()
+                    yield batch
+                    batch_started, network_before = time.perf_counter(), timings['network']
+            if remaining <= 0:
+                logger.info(f"Reached {self.max_articles_per_fetch} articles for {feed['endpoint']}, stopping early")
+            charge_parse()
+            if pending:
+                yield pending
+        finally:
+            items.close()
+            if rejects is not None:
+                for reason, count in normalizer.rejects.items():
+                    if count:
+                        rejects[reason] = rejects.get(reason, 0) + count
+    
+    def start_fetch(self, trigger: str, background: bool = True, feeds: Optional[List[Dict[str, str]]] = None,
+                    polled_at: Optional[float] = None) -> Tuple[Optional[FetchJob], bool]:
+        """Start a fetch job, or join the one already running
+        
+        Returns the job and whether this call started it. A new job runs on its own
+        thread when background is True, otherwise in the caller's thread before returning.
+        A new job fetches ``feeds`` (default all configured feeds). When the running job
+        does not cover all of them, the rest go to a follow-up job queued behind it, which
+        is returned instead. The job is None when another worker process is fetching.
+        """
+        with self._fetch_lock:
+            job = self._current_fetch
+            if job is not None:
+                missing = self._uncovered_feeds(job, feeds)
+                if not missing:
+                    job.coalesced += 1
+                    logger.info(f"Fetch triggered ({trigger}) while job {job.id} is running; joining it")
+                    return job, False
+                
+                follow_up = self._queued_fetch
+                if follow_up is None:
+                    follow_up = self._queued_fetch = FetchJob(trigger, missing, polled_at, queued=True)
+                    self._register_fetch_job(follow_up)
+                else:
+                    follow_up.coalesced += 1
+                    follow_up.add_targets(missing)
+                logger.info(f"Fetch triggered ({trigger}) while job {job.id} is running; {len(missing)} feed(s) "
+                            f"it does not cover are queued in job {follow_up.id}")
+            elif not self.fetch_file_lock.acquire():
+                logger.info(f"Fetch triggered ({trigger}) while another process is fetching; not starting one")
+                _FETCH_JOBS.inc(trigger, 'skipped')
+                return None, False
+            else:
+                follow_up = None
+                job = self._current_fetch = FetchJob(trigger, feeds, polled_at)
+                self._register_fetch_job(job)
+        
+        if follow_up is not None:
+            self._publish_fetch_job(follow_up)
+            return follow_up, False
+        self._publish_fetch_job(job)
+        
+        if background:
+            threading.Thread(target=self._run_fetch_job, args=(job,), name=f'fetch-{job.id}', daemon=True).start()
+        else:
+            self._run_fetch_job(job)
+        return job, True
+    
+    def _uncovered_feeds(self, job: FetchJob, feeds: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+        """Feeds of a request (default all configured feeds) that job does not fetch"""
+        if job.targets is None:
             return []
+        covered = {feed_key(feed) for feed in job.targets}
+        return [feed for feed in (feeds or self.feeds) if feed_key(feed) not in covered]
+    
+    def _register_fetch_job(self, job: FetchJob):
+        """Track a new job for get_fetch_job (caller holds _fetch_lock)"""
+        self.fetch_jobs[job.id] = job
+        while len(self.fetch_jobs) > self.fetch_job_history:
+            self.fetch_jobs.popitem(last=False)
     
-    def fetch_and_store_news(self):
-        """Main function to fetch news and store in database"""
+    def _run_fetch_job(self, job: FetchJob):
+        """Run a job, then the follow-up queued behind it
+        
+        The caller holds fetch_file_lock; it is handed on to the follow-up, or
+        released when there is none.
+        """
+        follow_up = None
         try:
-            logger.info("Starting news fetch and store process")
-            
-            # Fetch news from API
-            raw_data = self.fetch_news_from_api()
-            if not raw_data:
-                logger.warning("No data received from API")
-                return
+            if job.begin():
+                self._publish_fetch_job(job)
+            self._fetch_and_store(job)
             
-            # Parse the data
-            articles = self.parse_news_data(raw_data)
-            if not articles:
-                logger.warning("No articles parsed from API response")
-                return
-            
-            # Limit the number of articles if configured
-            if len(articles) > self.max_articles_per_fetch:
-                logger.info(f"Limiting articles from {len(articles)} to {self.max_articles_per_fetch}")
-                articles = articles[:self.max_articles_per_fetch]
-            
-            # Store articles in database
-            inserted_count = db.bulk_insert_articles(articles)
-            
-            logger.info(f"Successfully stored {inserted_count} articles in database")
-            
-            # Log summary
-            stats = db.get_database_stats()
-            logger.info(f"Database stats: {stats}")
-            
-        except NewsAPIError as e:
-            logger.error(f"News API error: {e}")
+            if job.feeds['failed'] == 0:
+                job.status = 'completed'
+            else:
+                job.status = 'failed' if job.feeds['succeeded'] == 0 else 'partial'
         except Exception as e:
-            logger.error(f"Unexpected error in fetch_and_store_news: {e}")
+            logger.error(f"Unexpected error in fetch job {job.id}: {e}")
+            job.status = 'failed'
+            job.errors.append(str(e))
+        finally:
+            job.finished_at = time.time()
+            _FETCH_JOBS.inc(job.trigger, job.status)
+            for stage, seconds in job.timings.items():
+                _FETCH_STAGE_SECONDS.inc(stage, amount=seconds)
+            for outcome, count in job.counts.items():
+                _FETCH_ARTICLES.inc(outcome, amount=count)
+            for reason, count in job.rejects.items():
+                _FETCH_REJECTS.inc(reason, amount=count)
+            self._publish_fetch_job(job)
+            with self._fetch_lock:
+                follow_up = self._current_fetch = self._queued_fetch
+                self._queued_fetch = None
+                if follow_up is None:
+                    self.fetch_file_lock.release()
+            job.done.set()
+        
+        if follow_up is not None:
+            logger.info(f"Starting follow-up fetch job {follow_up.id} queued behind job {job.id}")
+            threading.Thread(target=self._run_fetch_job, args=(follow_up,), name=f'fetch-{follow_up.id}',
+                             daemon=True).start()
+    
+    def _publish_fetch_job(self, job: FetchJob):
+        """Store the job's summary for workers that did not run it"""
+        db.save_fetch_job(job.id, job.to_dict(), self.fetch_job_history)
+    
+    def get_fetch_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Status of a recent fetch job, or None if unknown
+        
+        Jobs run by this process report live progress; others come from the
+        summary their worker stored when the job started and finished.
+        """
+        with self._fetch_lock:
+            job = self.fetch_jobs.get(job_id)
+        return job.to_dict() if job else db.get_fetch_job(job_id)
+    
+    def fetch_and_store_news(self, trigger: str = 'scheduled', feeds: Optional[List[Dict[str, str]]] = None,
+                             polled_at: Optional[float] = None) -> Optional[FetchJob]:
+        """Fetch and store every feed (or just ``feeds``) now, or wait for the fetch already in progress
+        
+        Returns None without fetching when another worker process is fetching.
+        """
+        job, started = self.start_fetch(trigger, background=False, feeds=feeds, polled_at=polled_at)
+        if job is not None and not started:
+            job.done.wait()
+        return job
+    
+    def poll_feeds(self, trigger: str = 'scheduled', now: Optional[float] = None) -> Optional[FetchJob]:
+        """Adaptive polling tick: fetch the feeds whose interval has elapsed, log the rest as skipped
+        
+        ``now`` (default the current time) decides which feeds are due and is what
+        their next fetch times are counted from. Returns None when no feed was due.
+        """
+        now = time.time() if now is None else now
+        states = db.get_feed_states()
+        due = []
+        for feed in self.feeds:
+            state = states.get(feed_key(feed))
+            if state is None or state['next_fetch_at'] <= now + _POLL_SLACK_SECONDS:
+                due.append(feed)
+            else:
+                db.log_api_call(feed_key(feed), None, 0.0, 0, 'skipped')
+                _FEED_POLLS.inc('skipped')
+        
+        if not due:
+            logger.info(f"No feed due for polling; skipped {len(self.feeds)} feed(s)")
+            return None
+        logger.info(f"Polling {len(due)} of {len(self.feeds)} feed(s) due ({trigger})")
+        return self.fetch_and_store_news(trigger, feeds=due, polled_at=now)
+    
+    def _fetch_and_store(self, job: FetchJob):
+        """Stream every configured feed and store it in fixed-size batches
+        
+        Feeds are fetched and parsed concurrently; a single writer (this thread)
+        commits each batch in its own transaction, so memory stays bounded by the
+        batch queue no matter how large the payloads are.
+        """
+        feeds = job.targets or self.feeds
+        logger.info(f"Starting news fetch and store process for {len(feeds)} feed(s) (job {job.id})")
+        
+        totals = job.counts
+        batches: queue.Queue = queue.Queue(maxsize=max(2, self.fetch_workers * 2))
+        stop = threading.Event()
+        
+        # Per feed: validators sent and received (see stream_news_items), article counts and the
+        # fetch or write error that failed it
+        states = db.get_feed_states()
+        conditionals = [self._request_validators(states.get(feed_key(feed))) for feed in feeds]
+        feed_counts = [{'inserted': 0, 'updated': 0, 'unchanged': 0} for _ in feeds]
+        errors: List[Optional[str]] = [None] * len(feeds)
+        write_errors: List[Optional[str]] = [None] * len(feeds)
+        
+        def produce(index: int, feed: Dict[str, str]):
+            timings = {'network': 0.0, 'parse': 0.0}
+            rejects: Dict[str, int] = {}
+            error = None
+            try:
+                for batch in self.iter_feed_batches(feed, timings, conditionals[index], rejects):
+                    if stop.is_set():
+                        break
+                    batches.put((index, batch))
+            except NewsAPIError as e:
+                error = f"{feed['endpoint']} ({feed['language']}): {e}"
+                logger.error(f"News API error for {error}")
+            except Exception as e:
+                error = f"{feed['endpoint']} ({feed['language']}): {e}"
+                logger.error(f"Unexpected error fetching {error}")
+            finally:
+                errors[index] = error
+                self._report_rejects(feed, rejects)
+                job.add_rejects(rejects)
+                job.add_timings(timings)
+                batches.put(None)
+        
+        workers = max(1, min(self.fetch_workers, len(feeds)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='feed-fetch') as executor:
+            for index, feed in enumerate(feeds):
+                executor.submit(produce, index, feed)
+            
+            remaining = len(feeds)
+            try:
+                while remaining:
+                    item = batches.get()
+                    if item is None:
+                        remaining -= 1
+                        continue
+                    index, batch = item
+                    write_timings: Dict[str, float] = {}
+                    with timed(write_timings, 'write'):
+                        counts = db.bulk_insert_articles(batch)
+                    job.add_timings(write_timings)
+                    if counts.get('error') and write_errors[index] is None:
+                        feed = feeds[index]
+                        write_errors[index] = f"{feed['endpoint']} ({feed['language']}): write failed: {counts['error']}"
+                        logger.error(f"Could not store articles from {write_errors[index]}")
+                    for key in totals:
+                        totals[key] += counts[key]
+                        feed_counts[index][key] += counts[key]
+            finally:
+                # Unblock producers if the writer failed
+                stop.set()
+                while remaining:
+                    if batches.get() is None:
+                        remaining -= 1
+        
+        # Only reached once every batch is written; a feed with a failed batch keeps its old
+        # validators, so its next request is unconditional and fetches the lost articles again
+        for index, feed in enumerate(feeds):
+            error = errors[index] or write_errors[index]
+            # Counted once the writes are done, so a feed whose batches failed is reported as failed
+            job.record_feed(error, conditionals[index].get('not_modified', False))
+            self._save_feed_state(feed, states.get(feed_key(feed)), conditionals[index],
+                                  feed_counts[index], error, job.polled_at)
+        
+        if job.feeds['not_modified']:
+            logger.info(f"{job.feeds['not_modified']} feed(s) not modified since their last fetch")
+        if not any(totals.values()) and not job.feeds['not_modified']:
+            logger.warning("No articles parsed from API responses")
+            return
+        
+        self.last_fetch_completed_at = time.time()
+        db.record_ingest()
+        self._publish_state()
+        logger.info(f"Stored articles in database: {totals['inserted']} inserted, "
+                    f"{totals['updated']} updated, {totals['unchanged']} unchanged")
+        
+        # Log summary
+        stats = db.get_database_stats()
+        logger.info(f"Database stats: {stats}")
+    
+    def _request_validators(self, state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Validators to send with a feed's next request (none when conditional requests are off)"""
+        if not self.conditional_requests or not state:
+            return {}
+        return {'etag': state['etag'], 'last_modified': state['last_modified']}
+    
+    def _save_feed_state(self, feed: Dict[str, str], previous: Optional[Dict[str, Any]],
+                         conditional: Dict[str, Any], counts: Dict[str, int], error: Optional[str],
+                         polled_at: float):
+        """Store a fetched feed's new validators and adapt its poll interval to its yield"""
+        policy = self.poll_policy
+        state = dict(previous) if previous else {'interval_seconds': policy.initial_seconds, 'yield_ratio': None}
+        if error:
+            # Keep the validators and interval, retry at the next tick
+            _FEED_POLLS.inc('error')
+            state['next_fetch_at'] = polled_at + policy.min_seconds
+            db.save_feed_state(feed_key(feed), state)
+            return
+        
+        not_modified = conditional.get('not_modified', False)
+        _FEED_POLLS.inc('not_modified' if not_modified else 'fetched')
+        if not not_modified:
+            state['etag'] = conditional.get('etag')
+            state['last_modified'] = conditional.get('last_modified')
+        # Every URL is new on a feed's first fetch, which says nothing about how fast it changes
+        if previous:
+            state['interval_seconds'], state['yield_ratio'] = policy.update(
+                policy.clamp(previous['interval_seconds']), previous['yield_ratio'],
+                counts['inserted'], sum(counts.values()))
+        state['next_fetch_at'] = polled_at + state['interval_seconds']
+        db.save_feed_state(feed_key(feed), state)
+    
+    def get_feed_poll_status(self) -> List[Dict[str, Any]]:
+        """Poll interval, smoothed yield and next fetch time of each configured feed"""
+        states = db.get_feed_states()
+        feeds = []
+        for feed in self.feeds:
+            state = states.get(feed_key(feed))
+            feeds.append({
+                'feed': feed_key(feed),
+                'interval_seconds': round(state['interval_seconds'], 1) if state else None,
+                'yield_ratio': round(state['yield_ratio'], 3) if state and state['yield_ratio'] is not None else None,
+                'next_fetch_at': datetime.fromtimestamp(state['next_fetch_at']).isoformat() if state else None,
+                'conditional': bool(state and (state['etag'] or state['last_modified']))
+            })
+        return feeds
     
     def cleanup_old_data(self):
-        """Clean up old articles from database"""
+        """Clean up old articles and API logs, then reconcile the maintained statistics"""
         try:
             logger.info("Starting database cleanup process")
-            deleted_count = db.cleanup_old_articles()
-            logger.info(f"Cleanup completed: {deleted_count} old articles removed")
+            result = db.cleanup_database()
+            logger.info(f"Cleanup completed: {result['deleted_articles']} old articles and "
+                        f"{result['deleted_api_logs']} API logs removed, {result['reclaimed_bytes']} bytes "
+                        f"reclaimed ({result['vacuum']}) in {result['elapsed_seconds']}s")
+            
+            # Verify the incrementally maintained statistics once a day
+            reconcile = db.reconcile_stats()
+            if reconcile.get('mismatches'):
+                logger.warning(f"Database stats drifted and were repaired: {reconcile['mismatches']}")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
     
-    def get_scheduler_status(self) -> Dict[str, Any]:
-        """Get scheduler status and job information"""
+    def _local_scheduler_status(self) -> Dict[str, Any]:
+        """Job information from this process's own scheduler"""
+        jobs = []
+        for job in self.scheduler.get_jobs():
+            # Jobs only get a next_run_time once the scheduler has started
+            next_run_time = getattr(job, 'next_run_time', None)
+            jobs.append({
+                'id': job.id,
+                'name': job.name,
+                'next_run': next_run_time.isoformat() if next_run_time else None,
+                'trigger': str(job.trigger)
+            })
+        
+        return {
+            'scheduler_running': self.scheduler.running,
+            'jobs': jobs,
+            'timezone': str(self.scheduler.timezone)
+        }
+    
+    def get_scheduler_status(self, include_feeds: bool = False) -> Dict[str, Any]:
+        """Get scheduler status and job information
+        
+        Followers report the jobs published by the leader; the scheduler counts as
+        running while the leader's heartbeat is fresh. Per-feed poll state costs a
+        feed_state query, so it is added only with ``include_feeds`` (/admin/scheduler,
+        not /health).
+        """
         try:
-            jobs = []
-            for job in self.scheduler.get_jobs():
-                jobs.append({
-                    'id': job.id,
-                    'name': job.name,
-                    'next_run': job.next_run_time.isoformat() if job.next_run_time else None,
-                    'trigger': str(job.trigger)
-                })
-            
-            return {
-                'scheduler_running': self.scheduler.running,
-                'jobs': jobs,
-                'timezone': str(self.scheduler.timezone)
-            }
+            status = self._scheduler_status()
+            if include_feeds and 'error' not in status:
+                status['feeds'] = self.get_feed_poll_status()
+            return status
         except Exception as e:
             logger.error(f"Error getting scheduler status: {e}")
             return {'error': str(e)}
     
+    def _scheduler_status(self) -> Dict[str, Any]:
+        """Scheduler status without the per-feed poll state"""
+        if self.is_leader:
+            status = self._local_scheduler_status()
+            status['role'] = 'leader' if self.leader_election else 'standalone'
+            status['leader'] = {'id': self.leader_id}
+            return status
+        
+        published = db.get_scheduler_state()
+        if not published:
+            return {
+                'scheduler_running': False,
+                'jobs': [],
+                'timezone': str(self.scheduler.timezone),
+                'role': 'follower',
+                'leader': None
+            }
+        
+        alive = published['heartbeat_age'] is not None and \
+            published['heartbeat_age'] <= 3 * self.leader_check_seconds
+        return {
+            'scheduler_running': alive,
+            'jobs': published['state'].get('jobs', []),
+            'timezone': published['state'].get('timezone', str(self.scheduler.timezone)),
+            'role': 'follower',
+            'leader': {
+                'id': published['leader'],
+                'heartbeat_at': published['heartbeat_at'],
+                'heartbeat_age_seconds': round(published['heartbeat_age'], 1)
+            }
+        }
+    
+    def get_readiness(self) -> Dict[str, Any]:
+        """Report whether this instance is serving fresh data ('warm') or 'stale'/'empty' data
+        
+        Freshness is the newer of the last successful fetch (this process's, or the
+        leader's published one on followers) and the last ingest recorded in the
+        database by any process. Cleanup deletes do not count as fresh data.
+        """
+        total_articles = db.get_article_count()
+        
+        last_fetch_at = self.last_fetch_completed_at
+        if not self.is_leader:
+            published = db.get_scheduler_state()
+            if published:
+                last_fetch_at = published['state'].get('last_fetch_at')
+        
+        freshest = max(filter(None, [last_fetch_at, db.get_last_ingest()]), default=None)
+        data_age = time.time() - freshest if freshest else None
+        
+        if total_articles == 0:
+            status = 'empty'
+        elif data_age is not None and data_age <= self.ready_max_data_age_hours * 3600:
+            status = 'warm'
+        else:
+            status = 'stale'
+        
+        return {
+            'status': status,
+            'initial_fetch': self.initial_fetch_state,
+            'total_articles': total_articles,
+            'last_fetch_at': datetime.fromtimestamp(last_fetch_at).isoformat() if last_fetch_at else None,
+            'data_age_seconds': round(data_age, 1) if data_age is not None else None,
+            'max_data_age_seconds': self.ready_max_data_age_hours * 3600
+        }
+    
     def manual_fetch(self) -> Dict[str, Any]:
-        """Manually trigger news fetch (for testing/admin purposes)"""
+        """Manually trigger a background news fetch job (for testing/admin purposes)"""
         try:
             logger.info("Manual news fetch triggered")
-            self.fetch_and_store_news()
-            return {'status': 'success', 'message': 'News fetch completed successfully'}
+            job, started = self.start_fetch('manual')
+            if job is None:
+                # Its summary is in fetch_jobs, so any worker can report on it
+                running = db.get_running_fetch_job()
+                return {
+                    'status': 'accepted',
+                    'message': 'Another worker process is already fetching; joined its job',
+                    'job_id': running['job_id'] if running else None,
+                    'coalesced': True,
+                    'other_process': True
+                }
+            if started:
+                message = 'News fetch started'
+            elif job.status == 'queued':
+                message = 'Queued a follow-up fetch for the feeds the running job does not cover'
+            else:
+                message = 'Joined the news fetch already in progress'
+            return {
+                'status': 'accepted',
+                'message': message,
+                'job_id': job.id,
+                'coalesced': not started
+            }
         except Exception as e:
             logger.error(f"Manual fetch failed: {e}")
             return {'status': 'error', 'message': str(e)}
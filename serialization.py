@@ -0,0 +1,27 @@
+import os
+import json
+from typing import Any
+from dotenv import load_dotenv
+
+# orjson is optional; without it responses fall back to the standard library encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Load environment variables
+load_dotenv()
+
+# Encode database rows directly instead of validating them through Pydantic. Only with
+# orjson: the stdlib encoder is slower than Pydantic's own serializer, validation included
+FAST_PATH_ENABLED = orjson is not None and os.getenv('SERIALIZATION_FAST_PATH', 'True').lower() == 'true'
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON, byte-for-byte what Pydantic's model_dump_json writes for the same plain data
+    
+    Only for dicts, lists, strings, numbers, booleans and None, as returned by
+    DatabaseManager; anything else should go through its Pydantic model.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
@@ -0,0 +1,48 @@
+"""
+Point the module-level database and log file at a scratch directory before
+any test imports database, news_fetcher or main, so the tracked news.db and
+news_api.log are never touched. Also provides a local stub of the news API
+(benchmarks/fake_upstream.py) and fetchers pointed at it.
+"""
+import os
+import sys
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix='news_test_')
+os.environ['DATABASE_PATH'] = os.path.join(_tmp_dir, 'test.db')
+os.environ['LOG_FILE'] = os.path.join(_tmp_dir, 'test.log')
+os.environ.setdefault('RAPIDAPI_KEY', 'test')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from benchmarks.fake_upstream import FakeUpstream
+
+
+@pytest.fixture
+def upstream():
+    """Local stand-in for the news API, serving five items per feed"""
+    server = FakeUpstream(items_per_feed=5, subnews_per_item=0).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def make_fetcher(monkeypatch):
+    """Factory for a NewsFetcher that fetches ``feeds`` (a NEWS_FEEDS value) from a stub upstream"""
+    from news_fetcher import NewsFetcher
+    fetchers = []
+    
+    def make(server, feeds):
+        for name, value in {'RAPIDAPI_HOST': server.host, 'NEWS_API_SCHEME': 'http', 'NEWS_FEEDS': feeds,
+                            'RATE_LIMIT_PER_SECOND': '0', 'MAX_RETRIES': '1'}.items():
+            monkeypatch.setenv(name, value)
+        fetcher = NewsFetcher()
+        fetchers.append(fetcher)
+        return fetcher
+    
+    yield make
+    for fetcher in fetchers:
+        fetcher.connection_pool.close_all()
+        fetcher.fetch_file_lock.release()
@@ -0,0 +1,119 @@
+"""
+Adaptive polling: PollPolicy interval rules, and conditional requests against
+the local stub upstream (benchmarks/fake_upstream.ChangingUpstream).
+"""
+import pytest
+
+from benchmarks.fake_upstream import ChangingUpstream
+from database import db
+from news_fetcher import PollPolicy, feed_key
+
+HOUR = 3600
+
+
+@pytest.fixture
+def policy():
+    return PollPolicy(min_seconds=900, max_seconds=4 * HOUR, initial_seconds=HOUR, low=0.1, high=0.5)
+
+
+def test_high_yield_halves_the_interval(policy):
+    interval, smoothed = policy.update(HOUR, None, new_items=8, items=10)
+    assert interval == HOUR / 2
+    # The smoothed yield is rescaled to the shorter interval
+    assert smoothed == pytest.approx(0.4)
+
+
+def test_low_yield_stretches_the_interval(policy):
+    interval, smoothed = policy.update(HOUR, None, new_items=0, items=10)
+    assert interval == 1.5 * HOUR
+    assert smoothed == 0.0
+
+
+def test_yield_between_thresholds_keeps_the_interval(policy):
+    assert policy.update(HOUR, None, new_items=3, items=10) == (HOUR, pytest.approx(0.3))
+
+
+def test_yield_is_smoothed_with_the_previous_fetches(policy):
+    # 0.5 * 1.0 + 0.5 * 0.0 reaches the high threshold
+    interval, _ = policy.update(HOUR, 0.0, new_items=10, items=10)
+    assert interval == HOUR / 2
+    # 0.5 * 0.0 + 0.5 * 0.3 stays above the low threshold
+    interval, _ = policy.update(HOUR, 0.3, new_items=0, items=10)
+    assert interval == HOUR
+
+
+def test_not_modified_counts_as_zero_yield(policy):
+    assert policy.update(HOUR, None, new_items=0, items=0)[0] == 1.5 * HOUR
+
+
+def test_intervals_are_clamped(policy):
+    assert policy.update(1000, None, new_items=10, items=10)[0] == 900
+    assert policy.update(3 * HOUR, None, new_items=0, items=10)[0] == 4 * HOUR
+    assert PollPolicy(900, 4 * HOUR, 10 * HOUR, 0.1, 0.5).initial_seconds == 4 * HOUR
+    assert PollPolicy(900, 60, HOUR, 0.1, 0.5).max_seconds == 900
+
+
+@pytest.fixture
+def changing_upstream():
+    server = ChangingUpstream({'quiet': 0.0, 'busy': 100.0}, items_per_feed=5, subnews_per_item=0).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def polling_fetcher(changing_upstream, make_fetcher, monkeypatch):
+    monkeypatch.setenv('FETCH_INTERVAL_HOURS', '1')
+    monkeypatch.setenv('FETCH_INTERVAL_MIN_MINUTES', '15')
+    monkeypatch.setenv('FETCH_INTERVAL_MAX_HOURS', '4')
+    return make_fetcher(changing_upstream, '/quiet:en-US,/busy:en-US')
+
+
+def requests_for(server, path):
+    return [log['headers'] for log in server.request_log if log['path'] == path]
+
+
+def api_log_outcomes(endpoint):
+    with db.get_connection() as conn:
+        return [tuple(row) for row in conn.execute(
+            'SELECT response_code, outcome FROM api_logs WHERE endpoint = ? ORDER BY id', (endpoint,))]
+
+
+def test_unchanged_feed_is_revalidated_and_left_alone(changing_upstream, polling_fetcher):
+    quiet = polling_fetcher.feeds[0]
+    polling_fetcher.fetch_and_store_news('scheduled', feeds=[quiet], polled_at=0.0)
+    state = db.get_feed_states()[feed_key(quiet)]
+    assert state['etag'] and state['last_modified']
+    assert state['interval_seconds'] == HOUR
+    
+    job = polling_fetcher.fetch_and_store_news('scheduled', feeds=[quiet], polled_at=HOUR)
+    
+    first, second = requests_for(changing_upstream, '/quiet?lr=en-US')
+    assert 'If-None-Match' not in first and 'If-Modified-Since' not in first
+    assert second['If-None-Match'] == state['etag']
+    assert second['If-Modified-Since'] == state['last_modified']
+    
+    assert job.status == 'completed'
+    assert job.feeds['not_modified'] == 1
+    assert job.counts == {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    assert api_log_outcomes('/quiet?lr=en-US') == [(200, 'fetched'), (304, 'not_modified')]
+    
+    after = db.get_feed_states()[feed_key(quiet)]
+    assert (after['etag'], after['last_modified']) == (state['etag'], state['last_modified'])
+    assert after['interval_seconds'] == 1.5 * HOUR
+    assert after['next_fetch_at'] == HOUR + 1.5 * HOUR
+
+
+def test_changed_feed_is_fetched_and_polled_sooner(changing_upstream, polling_fetcher):
+    busy = polling_fetcher.feeds[1]
+    polling_fetcher.fetch_and_store_news('scheduled', feeds=[busy], polled_at=0.0)
+    state = db.get_feed_states()[feed_key(busy)]
+    
+    changing_upstream.advance(1)
+    job = polling_fetcher.fetch_and_store_news('scheduled', feeds=[busy], polled_at=HOUR)
+    
+    assert requests_for(changing_upstream, '/busy?lr=en-US')[1]['If-None-Match'] == state['etag']
+    assert job.feeds['not_modified'] == 0
+    assert job.counts['inserted'] == 5
+    after = db.get_feed_states()[feed_key(busy)]
+    assert after['etag'] != state['etag']
+    assert after['interval_seconds'] == HOUR / 2
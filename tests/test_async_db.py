@@ -0,0 +1,84 @@
+"""
+A slow SQLite query must not hold up other requests.
+
+Both tests run a recursive CTE that keeps SQLite busy for about a second
+alongside a burst of fast calls, and fail if any fast call finishes after the
+slow one, which is what happens once database work runs on the event loop.
+"""
+import asyncio
+import time
+
+import httpx
+
+from database import AsyncDatabaseManager, DatabaseManager, db
+from main import app
+
+SLOW_QUERY = '''
+    WITH RECURSIVE counter(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM counter WHERE x < 4000000)
+    SELECT SUM(x) FROM counter
+'''
+FAST_CALLS = 20
+
+
+def slow_query(manager: DatabaseManager):
+    with manager.get_connection() as conn:
+        return conn.execute(SLOW_QUERY).fetchone()[0]
+
+
+async def finish_times(slow, fast):
+    """Seconds until the slow awaitable and each fast one completed, all started together"""
+    started = time.perf_counter()
+    
+    async def timed(awaitable):
+        await awaitable
+        return time.perf_counter() - started
+    
+    slow_task = asyncio.create_task(timed(slow))
+    await asyncio.sleep(0.05)
+    fast_done = await asyncio.gather(*[timed(awaitable) for awaitable in fast])
+    return await slow_task, fast_done
+
+
+def test_executor_runs_fast_queries_beside_a_slow_one():
+    manager = DatabaseManager()
+    async_manager = AsyncDatabaseManager(manager)
+    try:
+        slow_done, fast_done = asyncio.run(finish_times(
+            async_manager.run(slow_query, manager),
+            [async_manager.get_database_stats() for _ in range(FAST_CALLS)]
+        ))
+    finally:
+        async_manager.shutdown()
+        manager.close_all_connections()
+    
+    assert max(fast_done) < slow_done
+
+
+def test_slow_request_does_not_block_other_requests(monkeypatch):
+    db.insert_article({'title': 'Slow article', 'url': 'https://example.com/slow'})
+    original = db.get_article_version
+    
+    def slow_get_article_version(article_id):
+        slow_query(db)
+        return original(article_id)
+    
+    monkeypatch.setattr(db, 'get_article_version', slow_get_article_version)
+    
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            statuses = []
+            
+            async def get(path: str):
+                response = await client.get(path)
+                statuses.append(response.status_code)
+            
+            times = await finish_times(get('/articles/1'), [
+                get('/health' if n % 2 else '/latest') for n in range(FAST_CALLS)
+            ])
+            return times, statuses
+    
+    (slow_done, fast_done), statuses = asyncio.run(run())
+    
+    assert set(statuses) == {200}
+    assert max(fast_done) < slow_done
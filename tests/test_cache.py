@@ -0,0 +1,66 @@
+"""
+ResponseCache generation handling and size accounting.
+"""
+import pytest
+
+from cache import CachedResponse, ResponseCache
+
+
+@pytest.fixture
+def cache():
+    response_cache = ResponseCache()
+    response_cache.enabled = True
+    return response_cache
+
+
+def test_newer_generation_invalidates(cache):
+    cache.set('a', 1, CachedResponse(b'one'))
+    assert cache.get('a', 1).body == b'one'
+    
+    assert cache.get('a', 2) is None
+    assert cache.get_stats()['invalidations'] == 1
+
+
+def test_store_from_older_generation_is_ignored(cache):
+    cache.set('a', 2, CachedResponse(b'current'))
+    
+    # A request that read before the bump finishes after it
+    cache.set('b', 1, CachedResponse(b'stale'))
+    
+    assert cache.get('a', 2).body == b'current'
+    assert cache.get('b', 2) is None
+    assert cache.get_stats()['generation'] == 2
+
+
+def test_lookup_from_older_generation_misses_without_clearing(cache):
+    cache.set('a', 2, CachedResponse(b'current'))
+    
+    assert cache.get('a', 1) is None
+    assert cache.get('a', 2).body == b'current'
+
+
+def test_compressed_variant_stays_within_max_bytes(cache):
+    cache.max_bytes = 4096
+    first = CachedResponse(b'x' * 1500)
+    second = CachedResponse(b'y' * 1500)
+    cache.set('first', 1, first)
+    cache.set('second', 1, second)
+    
+    cache.add_encoding('second', second, 'gzip', b'z' * 1500)
+    
+    stats = cache.get_stats()
+    assert stats['size_bytes'] <= cache.max_bytes
+    assert cache.get('first', 1) is None
+    assert cache.get('second', 1).encoded['gzip'] == b'z' * 1500
+    assert stats['size_bytes'] == second.size
+
+
+def test_compressed_variant_that_cannot_fit_is_not_stored(cache):
+    cache.max_bytes = 2048
+    cached = CachedResponse(b'x' * 1500)
+    cache.set('a', 1, cached)
+    
+    cache.add_encoding('a', cached, 'gzip', b'z' * 1000)
+    
+    assert 'gzip' not in cached.encoded
+    assert cache.get_stats()['size_bytes'] == cached.size
@@ -0,0 +1,33 @@
+"""
+DatabaseManager behaviour that spans processes sharing one database file.
+
+Each test opens two managers on a fresh file, standing in for two worker
+processes.
+"""
+import pytest
+
+from database import DatabaseManager
+
+
+@pytest.fixture
+def managers(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_PATH', str(tmp_path / 'news.db'))
+    opened = [DatabaseManager(), DatabaseManager()]
+    for manager in opened:
+        manager.clustering_enabled = False
+        manager.generation_check_interval = 0
+    yield opened
+    for manager in opened:
+        manager.close_all_connections()
+
+
+def test_filtered_count_follows_writes_from_another_process(managers):
+    reader, writer = managers
+    writer.insert_article({'title': 'Apple unveils a new phone', 'url': 'https://example.com/1'})
+    assert reader.get_articles(search='apple')['total_count'] == 1
+    
+    writer.insert_article({'title': 'Apple shares climb', 'url': 'https://example.com/2'})
+    result = reader.get_articles(search='apple')
+    
+    assert len(result['articles']) == 2
+    assert result['total_count'] == 2
@@ -0,0 +1,158 @@
+"""
+NewsFetcher behaviour that does not need a network.
+"""
+import json
+import threading
+
+import pytest
+
+from benchmarks.fake_upstream import make_item
+from database import db
+from leader import LeaderLock
+from news_fetcher import NewsAPIError, NewsFetcher, feed_key
+
+
+def test_cleanup_does_not_make_stale_data_ready():
+    db.insert_article({'title': 'Old story about markets', 'url': 'https://example.com/old'})
+    db.insert_article({'title': 'Older story about rates', 'url': 'https://example.com/older'})
+    with db.get_connection() as conn:
+        conn.execute("UPDATE news_articles SET created_at = datetime('now', '-10 days') "
+                     "WHERE url = 'https://example.com/older'")
+        conn.execute("UPDATE table_counters SET value = CAST(strftime('%s', 'now', '-10 days') AS INTEGER) "
+                     "WHERE name = 'last_ingest'")
+        conn.commit()
+    fetcher = NewsFetcher()
+    
+    # Deleting expired articles moves last_modified but is not an ingest
+    assert db.cleanup_old_articles() >= 1
+    assert fetcher.get_readiness()['status'] == 'stale'
+    
+    db.record_ingest()
+    assert fetcher.get_readiness()['status'] == 'warm'
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    monkeypatch.setenv('NEWS_FEEDS', '/business:en-US,/technology:en-GB,/world:de-DE')
+    instance = NewsFetcher()
+    yield instance
+    instance.fetch_file_lock.release()
+
+
+def fake_fetch(fetcher, monkeypatch):
+    """Replace the network fetch with one recording each job's feeds; the first job waits for the returned event"""
+    release = threading.Event()
+    fetched = []
+    
+    def fetch_and_store(job):
+        fetched.append([feed_key(feed) for feed in job.targets or fetcher.feeds])
+        if len(fetched) == 1:
+            release.wait(5)
+        job.record_feed()
+    
+    monkeypatch.setattr(fetcher, '_fetch_and_store', fetch_and_store)
+    return release, fetched
+
+
+def test_manual_fetch_during_partial_poll_queues_remaining_feeds(fetcher, monkeypatch):
+    release, fetched = fake_fetch(fetcher, monkeypatch)
+    poll, started = fetcher.start_fetch('scheduled', feeds=fetcher.feeds[:1])
+    assert started
+    
+    result = fetcher.manual_fetch()
+    follow_up = fetcher.fetch_jobs[result['job_id']]
+    assert result['job_id'] != poll.id
+    assert follow_up.status == 'queued'
+    # A second trigger joins the queued job instead of queueing another
+    assert fetcher.manual_fetch()['job_id'] == follow_up.id
+    
+    release.set()
+    assert follow_up.done.wait(5)
+    assert fetched == [['/business?lr=en-US'], ['/technology?lr=en-GB', '/world?lr=de-DE']]
+    assert follow_up.status == 'completed'
+    assert follow_up.coalesced == 1
+
+
+def test_manual_fetch_reports_a_fetch_in_another_process(fetcher):
+    db.save_fetch_job('elsewhere', {'job_id': 'elsewhere', 'status': 'running'}, fetcher.fetch_job_history)
+    other_process = LeaderLock(fetcher.fetch_file_lock.path)
+    assert other_process.acquire()
+    try:
+        result = fetcher.manual_fetch()
+    finally:
+        other_process.release()
+    
+    assert result['other_process'] is True
+    assert result['job_id'] == 'elsewhere'
+
+
+def serve(server, document):
+    """Make the stub answer every request with this JSON document"""
+    body = json.dumps(document).encode('utf-8')
+    server.handle = lambda handler: (200, {}, body)
+
+
+def test_status_after_items_is_honoured(upstream, make_fetcher):
+    fetcher = make_fetcher(upstream, '/trailing:en-US')
+    items = [make_item('trailing', 'en-US', n, 0) for n in range(3)]
+    serve(upstream, {'items': items, 'status': 'success'})
+    
+    assert [item['newsUrl'] for item in fetcher.stream_news_items(fetcher.feeds[0])] == \
+        [item['newsUrl'] for item in items]
+
+
+@pytest.mark.parametrize('document', [
+    {'items': [make_item('rejected', 'en-US', 0, 0)], 'status': 'error'},
+    {'status': 'error', 'items': [make_item('rejected', 'en-US', 0, 0)]},
+    {'items': [make_item('rejected', 'en-US', 0, 0)]},
+], ids=['error-after-items', 'error-before-items', 'missing'])
+def test_non_success_status_yields_nothing(upstream, make_fetcher, document):
+    fetcher = make_fetcher(upstream, '/rejected:en-US')
+    serve(upstream, document)
+    
+    yielded = []
+    with pytest.raises(NewsAPIError):
+        for item in fetcher.stream_news_items(fetcher.feeds[0]):
+            yielded.append(item)
+    assert yielded == []
+
+
+def api_logs(endpoint):
+    with db.get_connection() as conn:
+        return [tuple(row) for row in conn.execute(
+            'SELECT response_code, articles_fetched, outcome FROM api_logs WHERE endpoint = ? ORDER BY id',
+            (endpoint,))]
+
+
+def test_fetches_every_feed_with_its_language_and_category(upstream, make_fetcher):
+    fetcher = make_fetcher(upstream, '/markets:en-US,/tech:en-GB:technology,/welt:de-DE:world')
+    
+    job = fetcher.fetch_and_store_news('manual')
+    
+    assert job.status == 'completed'
+    assert job.feeds == {'succeeded': 3, 'failed': 0, 'not_modified': 0}
+    assert job.counts['inserted'] == 15
+    assert sorted(log['path'] for log in upstream.request_log) == \
+        ['/markets?lr=en-US', '/tech?lr=en-GB', '/welt?lr=de-DE']
+    with db.get_connection() as conn:
+        tags = {tuple(row) for row in conn.execute(
+            "SELECT url, language, category FROM news_articles WHERE url LIKE 'https://news.example.com/%'")}
+    for feed, language, category in (('markets', 'en-US', 'markets'), ('tech', 'en-GB', 'technology'),
+                                     ('welt', 'de-DE', 'world')):
+        assert {(f'https://news.example.com/{language}/{feed}/{n}', language, category)
+                for n in range(5)} <= tags
+
+
+def test_one_failing_feed_is_logged_and_reported_on_its_own(upstream, make_fetcher):
+    fetcher = make_fetcher(upstream, '/healthy:en-US,/broken:en-US')
+    serve_payload = upstream.handle
+    upstream.handle = lambda handler: (500, {}, b'{}') if handler.path.startswith('/broken') \
+        else serve_payload(handler)
+    
+    job = fetcher.fetch_and_store_news('manual')
+    
+    assert job.status == 'partial'
+    assert job.feeds == {'succeeded': 1, 'failed': 1, 'not_modified': 0}
+    assert len(job.errors) == 1 and job.errors[0].startswith('/broken (en-US)')
+    assert api_logs('/healthy?lr=en-US') == [(200, 5, 'fetched')]
+    assert api_logs('/broken?lr=en-US') == [(500, 0, 'error')]